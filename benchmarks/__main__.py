@@ -0,0 +1,91 @@
+"""
+Command-line runner for the benchmark suite.
+
+Examples:
+    python -m benchmarks --output results.json
+    python -m benchmarks --baseline baseline.json --threshold 0.15
+    python -m benchmarks --filter service. --output service.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks import (
+    bench_cli,
+    bench_converter,
+    bench_dispatch,
+    bench_domain,
+    bench_pricing,
+    bench_service,
+    bench_startup,
+    bench_table,
+    bench_templates,
+)
+from benchmarks.harness import compare, load_results, over_budget, run_benchmarks, save_results
+
+SUITES = (bench_domain, bench_service, bench_dispatch, bench_cli, bench_converter, bench_pricing, bench_table, bench_templates, bench_startup)
+
+
+def parse_arguments(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the calculator benchmark suite")
+    parser.add_argument('--output', metavar='FILE', help="write results as JSON to FILE")
+    parser.add_argument('--baseline', metavar='FILE', help="compare against results saved in FILE")
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.10,
+        help="allowed slowdown against the baseline as a fraction (default: 0.10)",
+    )
+    parser.add_argument('--filter', default='', help="only run benchmarks whose name contains this text")
+    parser.add_argument('--repeat', type=int, default=5, help="measurements per benchmark (default: 5)")
+    parser.add_argument(
+        '--min-time',
+        type=float,
+        default=0.05,
+        help="minimum seconds per measurement (default: 0.05)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Run the suite; return 1 if any benchmark is over budget or regressed past the threshold."""
+    arguments = parse_arguments(argv)
+    selected = [
+        benchmark
+        for suite in SUITES
+        for benchmark in suite.benchmarks()
+        if arguments.filter in benchmark.name
+    ]
+
+    def report(name, record):
+        print(f"{name:<48}{record['ns_per_item']:14.1f} ns/item")
+
+    results = run_benchmarks(selected, arguments.repeat, arguments.min_time, report)
+    if arguments.output:
+        save_results(results, arguments.output)
+
+    status = 0
+    for name in over_budget(results):
+        record = results['results'][name]
+        print(f"OVER BUDGET {name}: {record['seconds'] * 1e3:.1f} ms > {record['budget'] * 1e3:.1f} ms")
+        status = 1
+
+    if arguments.baseline:
+        regressions = compare(results, load_results(arguments.baseline), arguments.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression.name}: {regression.slowdown:+.1%} "
+                  f"({regression.baseline * 1e9:.1f} ns -> {regression.current * 1e9:.1f} ns)")
+        if regressions:
+            return 1
+        print(f"No regressions above {arguments.threshold:.0%}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
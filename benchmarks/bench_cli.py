@@ -0,0 +1,40 @@
+"""Benchmarks for CLI input parsing and batch tokenizing."""
+
+from typing import List
+
+from benchmarks.harness import Benchmark
+from src.application.calculator_service import CalculatorService
+from src.application.tokenizer import scan
+from src.presentation.batch import CalculatorBatch
+from src.presentation.cli import CalculatorCLI
+
+_LINES = 10_000
+
+
+def benchmarks() -> List[Benchmark]:
+    """Return benchmarks for CalculatorCLI._parse_number over token sizes and for batch input."""
+    parse = CalculatorCLI._parse_number
+    result = []
+    for label, token in [
+        ('int1', '7'),
+        ('int20', '7' * 20),
+        ('int1000', '7' * 1000),
+        ('float', '3.14159'),
+        ('float20', '1234567890.123456789'),
+    ]:
+        result.append(Benchmark(
+            f"cli._parse_number[{label}]",
+            lambda token=token: parse(token),
+        ))
+
+    simple = ''.join(f"{i} {'+-*/'[i % 4]} {i % 13 + 1}.5\n" for i in range(_LINES)).encode('ascii')
+    nested = ''.join(f"({i} + 1.5e2) * {i % 7} ^ 2\n" for i in range(_LINES)).encode('ascii')
+    batch = CalculatorBatch(CalculatorService())
+    result.append(Benchmark("tokenizer.scan", lambda: sum(1 for _ in scan(simple)), _LINES))
+    for label, data in [('simple', simple), ('expression', nested)]:
+        result.append(Benchmark(
+            f"batch.evaluate_buffer[{label}]",
+            lambda data=data: sum(1 for _ in batch.evaluate_buffer(data)),
+            _LINES,
+        ))
+    return result
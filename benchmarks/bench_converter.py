@@ -0,0 +1,28 @@
+"""Benchmarks for the temperature converter."""
+
+from array import array
+from typing import List
+
+from benchmarks.harness import Benchmark
+from src.converter import c_to_f, c_to_f_buffer, f_to_c
+
+
+def benchmarks() -> List[Benchmark]:
+    """Return benchmarks for scalar and bulk conversion over several input sizes."""
+    result = []
+    for size in (1, 1_000, 100_000):
+        values = [float(i % 200 - 50) for i in range(size)]
+        for function in (c_to_f, f_to_c):
+            result.append(Benchmark(
+                f"converter.{function.__name__}[n={size}]",
+                lambda function=function, values=values: [function(value) for value in values],
+                items=size,
+            ))
+        readings = array('d', values)
+        output = bytearray(len(readings) * 8)
+        result.append(Benchmark(
+            f"converter.c_to_f_buffer[n={size}]",
+            lambda readings=readings, output=output: c_to_f_buffer(readings, output),
+            items=size,
+        ))
+    return result
@@ -0,0 +1,78 @@
+"""
+Benchmarks for the per-call overhead of CalculatorService operator dispatch.
+
+The precompiled dispatch table is timed against a replica of the original
+lookup path (``in`` check, second dictionary lookup, bound-method call
+through the ABC) and against a bare lambda as the floor. The table must
+stay within ``DISPATCH_BUDGET``.
+
+Run with ``python -m benchmarks --filter dispatch.``, or print the
+before/after table with:
+    python -m benchmarks.bench_dispatch
+"""
+
+from typing import List
+
+from benchmarks.harness import Benchmark, time_benchmark
+from src.application.calculator_service import CalculatorService
+from src.domain.operations import Operation
+
+CALLS = 1_000
+
+# Seconds per CALLS dispatched calls (1 us per call)
+DISPATCH_BUDGET = 1e-3
+
+
+class _Addition(Operation):
+    def execute(self, a, b):
+        return a + b
+
+    def symbol(self):
+        return "+"
+
+
+class LegacyService:
+    """Replica of the original dispatch: a dict of ABC instances and a checked lookup."""
+
+    def __init__(self):
+        self._operations = {'+': _Addition()}
+
+    def calculate(self, a, operator, b):
+        if operator not in self._operations:
+            raise ValueError(f"Unsupported operator: {operator}")
+        operation = self._operations[operator]
+        return operation.execute(a, b)
+
+
+def _calls(calculate) -> None:
+    for _ in range(CALLS):
+        calculate(3, '+', 4)
+
+
+def benchmarks() -> List[Benchmark]:
+    """Return dispatch benchmarks: the original path, the dispatch table, the floor and construction."""
+    legacy = LegacyService().calculate
+    table = CalculatorService().calculate
+    floor = lambda a, operator, b: a + b  # noqa: E731
+    return [
+        Benchmark("dispatch.calculate[dict+abc]", lambda: _calls(legacy), items=CALLS),
+        Benchmark("dispatch.calculate[table]", lambda: _calls(table), items=CALLS, budget=DISPATCH_BUDGET),
+        Benchmark("dispatch.calculate[lambda]", lambda: _calls(floor), items=CALLS),
+        Benchmark("dispatch.construct", CalculatorService),
+    ]
+
+
+def main() -> None:
+    """Print per-call dispatch overhead before and after the dispatch table."""
+    records = {benchmark.name: time_benchmark(benchmark) for benchmark in benchmarks()}
+    before = records["dispatch.calculate[dict+abc]"]['ns_per_item']
+    after = records["dispatch.calculate[table]"]['ns_per_item']
+    print(f"{'dict + ABC dispatch':<24}{before:8.1f} ns/call")
+    print(f"{'dispatch table':<24}{after:8.1f} ns/call")
+    print(f"{'bare lambda (floor)':<24}{records['dispatch.calculate[lambda]']['ns_per_item']:8.1f} ns/call")
+    print(f"{'speedup':<24}{before / after:8.2f} x")
+    print(f"{'CalculatorService()':<24}{records['dispatch.construct']['ns_per_item'] / 1e3:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
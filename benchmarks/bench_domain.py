@@ -0,0 +1,39 @@
+"""Benchmarks for Operation.execute across operand sizes."""
+
+from typing import List
+
+from benchmarks.harness import Benchmark
+from src.domain.operations import Addition, Division, Multiplication, Power, Root, Subtraction
+
+
+def benchmarks() -> List[Benchmark]:
+    """Return benchmarks for every built-in operation."""
+    result = []
+    for digits in (1, 100, 1000):
+        a = int('7' * digits)
+        b = int('3' * digits)
+        for operation in (Addition(), Subtraction(), Multiplication(), Division()):
+            result.append(Benchmark(
+                f"domain.{type(operation).__name__}.execute[int{digits}]",
+                lambda execute=operation.execute, a=a, b=b: execute(a, b),
+            ))
+        # Keep inexact roots within float range
+        degree = 3 if digits < 100 else digits // 10
+        result.append(Benchmark(
+            f"domain.Root.execute[int{digits},n={degree}]",
+            lambda execute=Root().execute, a=a, degree=degree: execute(a, degree),
+        ))
+        result.append(Benchmark(
+            f"domain.Root.execute[perfect_cube{digits}]",
+            lambda execute=Root().execute, a=a ** 3: execute(a, 3),
+        ))
+    for exponent in (2, 64, 1024):
+        result.append(Benchmark(
+            f"domain.Power.execute[int^{exponent}]",
+            lambda execute=Power().execute, exponent=exponent: execute(7, exponent),
+        ))
+    result.append(Benchmark(
+        "domain.Power.execute[float]",
+        lambda execute=Power().execute: execute(1.0001, 2.5),
+    ))
+    return result
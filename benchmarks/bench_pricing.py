@@ -0,0 +1,32 @@
+"""Benchmarks for percent chains and CSV repricing."""
+
+import io
+from typing import List
+
+from benchmarks.harness import Benchmark
+from src.percent_chain import PercentChain
+from src.repricing import CsvRepricer
+
+
+def benchmarks() -> List[Benchmark]:
+    """Return benchmarks showing chain length does not change the per-row cost."""
+    size = 100_000
+    values = [(i % 50_000) / 100 for i in range(size)]
+    csv_text = 'sku,price\n' + ''.join(f"{i},{value}\n" for i, value in enumerate(values))
+    result = []
+    for length in (1, 20):
+        steps = [('raise' if i % 2 else 'discount', 1 + i % 7) for i in range(length)]
+        for exact in (False, True):
+            chain = PercentChain(steps, exact=exact)
+            mode = 'exact' if exact else 'float'
+            result.append(Benchmark(
+                f"pricing.apply_many[{mode},steps={length}]",
+                lambda chain=chain: chain.apply_many(values, 2),
+                items=size,
+            ))
+            result.append(Benchmark(
+                f"pricing.reprice_csv[{mode},steps={length}]",
+                lambda chain=chain: CsvRepricer('price', chain, 2).run(io.StringIO(csv_text), io.StringIO()),
+                items=size,
+            ))
+    return result
@@ -0,0 +1,75 @@
+"""Benchmarks for CalculatorService dispatch and batch calculation."""
+
+import os
+import tempfile
+from array import array
+from typing import List
+
+from benchmarks.harness import Benchmark
+from src.application.calculator_service import CalculatorService
+from src.application.history_log import HistoryRecorder
+from src.presentation.binary_batch import BinaryBatch, as_array
+
+
+BACKENDS = ('float', 'decimal', 'fraction', 'int')
+
+
+def benchmarks() -> List[Benchmark]:
+    """Return benchmarks for calculate, calculate_many, binary batches, each numeric backend, metrics and history recording."""
+    service = CalculatorService()
+    result = []
+    for operator in service.get_supported_operators():
+        result.append(Benchmark(
+            f"service.calculate[{operator}]",
+            lambda calculate=service.calculate, operator=operator: calculate(9, operator, 2),
+        ))
+    for size in (1_000, 100_000):
+        a_values = array('d', (float(i + 1) for i in range(size)))
+        b_values = array('d', (2.0 for _ in range(size)))
+        for operator in ('+', '/', '^'):
+            result.append(Benchmark(
+                f"service.calculate_many[{operator},n={size}]",
+                lambda operator=operator, a=a_values, b=b_values: service.calculate_many(a, operator, b),
+                items=size,
+            ))
+    # Raw little-endian buffers in, preallocated buffer out
+    size = 100_000
+    a_buffer = as_array(array('d', (float(i + 1) for i in range(size))).tobytes())
+    b_buffer = as_array(array('d', (2.0 for _ in range(size))).tobytes())
+    output = memoryview(bytearray(size * 8)).cast('d')
+    binary_batch = BinaryBatch(service)
+    result.append(Benchmark(
+        f"service.binary_batch[/,n={size}]",
+        lambda: binary_batch.run(a_buffer, '/', b_buffer, output),
+        items=size,
+    ))
+    # The same integer workload in every numeric backend
+    workload = [(i + 1, operator, i % 7 + 1) for i in range(1_000) for operator in ('+', '-', '*', '/')]
+    for numeric in BACKENDS:
+        calculate = CalculatorService(numeric=numeric).calculate
+        result.append(Benchmark(
+            f"service.numeric[{numeric}]",
+            lambda calculate=calculate: [calculate(a, operator, b) for a, operator, b in workload],
+            items=len(workload),
+        ))
+    result.append(Benchmark(
+        "service.numeric[none]",
+        lambda calculate=service.calculate: [calculate(a, operator, b) for a, operator, b in workload],
+        items=len(workload),
+    ))
+    calculate = CalculatorService(metrics=True).calculate
+    result.append(Benchmark(
+        "service.metrics[on]",
+        lambda calculate=calculate: [calculate(a, operator, b) for a, operator, b in workload],
+        items=len(workload),
+    ))
+    # Recording overhead; the directory is removed when the benchmark is collected
+    directory = tempfile.TemporaryDirectory()
+    recorder = HistoryRecorder(os.path.join(directory.name, 'history.log'))
+    calculate = CalculatorService(history=recorder).calculate
+    result.append(Benchmark(
+        "service.history[record]",
+        lambda calculate=calculate, directory=directory: [calculate(a, operator, b) for a, operator, b in workload],
+        items=len(workload),
+    ))
+    return result
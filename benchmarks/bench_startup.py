@@ -0,0 +1,35 @@
+"""
+Benchmarks for interpreter startup on the CLI and batch paths.
+
+Each call starts a fresh interpreter and imports the entry point, so the
+measurement includes interpreter startup. The CLI path must stay within
+``CLI_IMPORT_BUDGET`` and never import tkinter.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+from benchmarks.harness import Benchmark
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Seconds per fresh interpreter importing src.main (interpreter start included)
+CLI_IMPORT_BUDGET = 0.150
+
+
+def _run(code: str) -> None:
+    subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, check=True)
+
+
+def benchmarks() -> List[Benchmark]:
+    """Return startup benchmarks for the bare interpreter and the CLI entry point."""
+    return [
+        Benchmark("startup.python", lambda: _run('pass')),
+        Benchmark(
+            "startup.import[src.main]",
+            lambda: _run('import src.main'),
+            budget=CLI_IMPORT_BUDGET,
+        ),
+    ]
@@ -0,0 +1,26 @@
+"""Benchmarks for column-wise CSV calculation."""
+
+import io
+from typing import List
+
+from benchmarks.harness import Benchmark
+from src.application.calculator_service import CalculatorService
+from src.table import ColumnCalculator
+
+
+def benchmarks() -> List[Benchmark]:
+    """Return benchmarks for calc-table over clean input and input with rejected rows."""
+    size = 100_000
+    service = CalculatorService()
+    clean = 'sku,price,qty\n' + ''.join(f"{i},{i % 5000 / 100},{i % 9 + 1}\n" for i in range(size))
+    # One zero divisor per 1000 rows
+    rejects = 'sku,price,qty\n' + ''.join(f"{i},{i % 5000 / 100},{i % 1000}\n" for i in range(size))
+    result = []
+    for label, text in [('clean', clean), ('rejects', rejects)]:
+        calculator = ColumnCalculator(service, 'price', '/', 'qty', 'unit')
+        result.append(Benchmark(
+            f"table.calculate_columns[{label}]",
+            lambda calculator=calculator, text=text: calculator.run(io.StringIO(text), io.StringIO(), io.StringIO()),
+            items=size,
+        ))
+    return result
@@ -0,0 +1,51 @@
+"""Benchmarks for expression templates against tree evaluation and a hand-written lambda."""
+
+from array import array
+from typing import List
+
+from benchmarks.harness import Benchmark
+from src.application.calculator_service import CalculatorService
+from src.application.expression import evaluate_expression
+from src.application.templates import compile_template
+
+FORMULA = "x ^ 2 + y * 3"
+
+
+def benchmarks() -> List[Benchmark]:
+    """Return per-row costs of one formula evaluated in different ways."""
+    size = 10_000
+    rows = [(i * 0.5, float(i % 97)) for i in range(size)]
+    xs = array('d', (x for x, _ in rows))
+    ys = array('d', (y for _, y in rows))
+    service = CalculatorService()
+    template = compile_template(FORMULA, service)
+    unoptimized = compile_template(FORMULA, service, optimize=False)
+    by_hand = lambda x, y: x ** 2 + y * 3  # noqa: E731
+    sources = [f"{x} ^ 2 + {y} * 3" for x, y in rows[:1_000]]
+    return [
+        Benchmark(
+            "templates.lambda",
+            lambda: [by_hand(x, y) for x, y in rows],
+            items=size,
+        ),
+        Benchmark(
+            "templates.evaluate_rows",
+            lambda: template.evaluate_rows(rows),
+            items=size,
+        ),
+        Benchmark(
+            "templates.evaluate_rows[unoptimized]",
+            lambda: unoptimized.evaluate_rows(rows),
+            items=size,
+        ),
+        Benchmark(
+            "templates.evaluate_columns",
+            lambda: template.evaluate_columns(xs, ys),
+            items=size,
+        ),
+        Benchmark(
+            "templates.tree",
+            lambda: [evaluate_expression(source, service) for source in sources],
+            items=len(sources),
+        ),
+    ]
@@ -0,0 +1,123 @@
+"""
+Benchmark harness: timing, JSON result files and baseline comparison.
+"""
+
+import json
+import platform
+import time
+import timeit
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+
+class Benchmark(NamedTuple):
+    """
+    A named, timed callable.
+
+    ``items`` is the number of elements it processes per call and ``budget``
+    an optional upper bound, in seconds per call, that the run must meet.
+    """
+
+    name: str
+    function: Callable[[], object]
+    items: int = 1
+    budget: Optional[float] = None
+
+
+class Regression(NamedTuple):
+    """A benchmark that became slower than allowed compared to the baseline."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def slowdown(self) -> float:
+        """Relative slowdown, e.g. 0.25 for 25% slower."""
+        return self.current / self.baseline - 1
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int = 5, min_time: float = 0.05) -> Dict[str, float]:
+    """
+    Time a benchmark and return its result record.
+
+    The number of calls per measurement is calibrated so each measurement
+    takes at least ``min_time`` seconds; the best of ``repeat`` measurements
+    is reported.
+    """
+    timer = timeit.Timer(benchmark.function)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 10
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    record = {
+        'seconds': best,
+        'ns_per_item': best / benchmark.items * 1e9,
+        'items': benchmark.items,
+        'number': number,
+    }
+    if benchmark.budget is not None:
+        record['budget'] = benchmark.budget
+    return record
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    repeat: int = 5,
+    min_time: float = 0.05,
+    report: Optional[Callable[[str, Dict[str, float]], None]] = None,
+) -> Dict[str, object]:
+    """Run benchmarks and return a JSON-serializable results document."""
+    results = {}
+    for benchmark in benchmarks:
+        if benchmark.name in results:
+            raise ValueError(f"Duplicate benchmark name: {benchmark.name}")
+        results[benchmark.name] = time_benchmark(benchmark, repeat, min_time)
+        if report is not None:
+            report(benchmark.name, results[benchmark.name])
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': results,
+    }
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object], threshold: float) -> List[Regression]:
+    """
+    Return benchmarks whose time grew by more than ``threshold`` (e.g. 0.1 = 10%).
+
+    Benchmarks present in only one of the documents are ignored.
+    """
+    regressions = []
+    baseline_results = baseline['results']
+    for name, record in current['results'].items():
+        if name not in baseline_results:
+            continue
+        before = baseline_results[name]['seconds']
+        after = record['seconds']
+        if after > before * (1 + threshold):
+            regressions.append(Regression(name, before, after))
+    return regressions
+
+
+def over_budget(results: Dict[str, object]) -> List[str]:
+    """Return the names of benchmarks slower than their budget."""
+    return [
+        name
+        for name, record in results['results'].items()
+        if 'budget' in record and record['seconds'] > record['budget']
+    ]
+
+
+def load_results(path: str) -> Dict[str, object]:
+    """Load a results document written by ``save_results``."""
+    with open(path, encoding='utf-8') as source:
+        return json.load(source)
+
+
+def save_results(results: Dict[str, object], path: str) -> None:
+    """Write a results document as JSON."""
+    with open(path, 'w', encoding='utf-8') as target:
+        json.dump(results, target, indent=2, sort_keys=True)
+        target.write('\n')
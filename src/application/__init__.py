@@ -1,5 +1,6 @@
 """Application layer package."""
 
 from .calculator_service import CalculatorService
+from .expression import ExpressionError, compile_expression, evaluate_expression
 
-__all__ = ['CalculatorService']
+__all__ = ['CalculatorService', 'ExpressionError', 'compile_expression', 'evaluate_expression']
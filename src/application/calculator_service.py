@@ -3,7 +3,14 @@ Application Layer: Calculator service that orchestrates operations.
 This layer contains the use cases and business workflows.
 """
 
-from typing import Dict, Union
+import math
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Iterable, Mapping, Optional, Sequence, Union
+from src.application.history_log import HistoryRecorder
+from src.application.metrics import OperatorStats, ServiceMetrics
+from src.application.plugins import LazyOperation
+from src.application.result_cache import CacheInfo, ResultCache
+from src.domain.numeric import NumericBackend, get_numeric_backend
 from src.domain.operations import (
     Operation,
     Addition,
@@ -18,8 +25,39 @@ from src.domain.operations import (
 class CalculatorService:
     """Service class that manages calculator operations."""
     
-    def __init__(self):
-        """Initialize the calculator service with available operations."""
+    def __init__(
+        self,
+        cache_size: Optional[int] = None,
+        numeric: Union[str, NumericBackend, None] = None,
+        history: Optional[HistoryRecorder] = None,
+        metrics: bool = False,
+        operations: Iterable[Operation] = (),
+    ):
+        """
+        Initialize the calculator service with available operations.
+        
+        Args:
+            cache_size: If given, memoize up to this many results with LRU
+                eviction; by default results are not cached
+            numeric: Numeric backend ('float', 'decimal', 'fraction', 'int' or
+                a ``NumericBackend``) that operands are coerced to; by default
+                operands are used as given
+            history: If given, every calculation (including failed ones) is
+                appended to this log, a failed ``calculate_many`` batch as one
+                error record; copies made by pickling or by
+                ``with_history(None)`` do not record
+            metrics: If True, count calls, errors and latency per operator
+                (see ``stats``); disabled layers add no per-call cost
+            operations: Extra operations to register, e.g. the lazily
+                imported plugins returned by ``plugin_operations()``
+        
+        Raises:
+            ValueError: If the numeric backend is unknown
+        """
+        self._cache: Optional[ResultCache] = ResultCache(cache_size) if cache_size is not None else None
+        self._numeric: Optional[NumericBackend] = get_numeric_backend(numeric)
+        self._history = history
+        self._metrics: Optional[ServiceMetrics] = ServiceMetrics() if metrics else None
         self._operations: Dict[str, Operation] = {
             '+': Addition(),
             '-': Subtraction(),
@@ -28,8 +66,13 @@ class CalculatorService:
             '^': Power(),
             'root': Root(),
         }
+        for operation in operations:
+            self._operations[operation.symbol()] = operation
+        self._dispatch: Mapping[str, Callable[[Any, Any], Any]] = MappingProxyType({})
+        self._compiled: Dict[Hashable, Any] = {}
+        self._rebuild_dispatch()
     
-    def calculate(self, a: Union[int, float], operator: str, b: Union[int, float]) -> Union[int, float]:
+    def calculate(self, a: Any, operator: str, b: Any) -> Any:
         """
         Perform a calculation using the specified operator.
         
@@ -39,27 +82,322 @@ class CalculatorService:
             b: Second operand
             
         Returns:
-            Result of the calculation
+            Result of the calculation, in the numeric backend's type if one
+            is selected
             
         Raises:
-            ValueError: If operator is not supported or if division by zero
+            ValueError: If operator is not supported, if division by zero or
+                if an operand cannot be coerced to the numeric backend
         """
-        if operator not in self._operations:
-            raise ValueError(f"Unsupported operator: {operator}. Supported operators: {', '.join(self._operations.keys())}")
+        try:
+            function = self._dispatch[operator]
+        except KeyError:
+            raise self._unsupported_operator(operator) from None
+        return function(a, b)
+    
+    def calculate_many(
+        self,
+        a_values: Iterable[Any],
+        operator: str,
+        b_values: Iterable[Any],
+    ) -> Sequence[Any]:
+        """
+        Perform a calculation element-wise over two sequences of operands.
         
-        operation = self._operations[operator]
-        return operation.execute(a, b)
+        Operands may be lists, ``array.array`` objects, memoryviews or any
+        other buffer; they are processed as float64 by the operation's batch
+        kernel (NumPy-backed when NumPy is installed). With a Decimal,
+        Fraction or int backend the backend's kernel is applied instead and
+        a list is returned.
+        
+        The throughput gain over a ``calculate`` loop (10x and more) needs
+        NumPy. Without it the kernels are element-wise ``map`` loops, at best
+        about twice as fast as ``calculate`` (``array('d')`` operands) and no
+        faster for lists.
+        
+        With a history log every element is recorded; a failed batch is
+        recorded as one error record with NaN operands.
+        
+        Args:
+            a_values: First operands
+            operator: Operation symbol (+, -, *, /, ^, root)
+            b_values: Second operands, same length as ``a_values``
+            
+        Returns:
+            A NumPy array when NumPy is installed, otherwise ``array('d')``;
+            a list for non-float numeric backends
+            
+        Raises:
+            ValueError: If operator is not supported, the sequences differ in
+                length or any element is invalid for the operation
+        """
+        operation = self._get_operation(operator)
+        if self._metrics is not None:
+            return self._measure_many(operation, operator, a_values, b_values)
+        return self._record_many(operation, operator, a_values, b_values)
+    
+    def _measure_many(self, operation: Operation, operator: str, a_values: Iterable[Any], b_values: Iterable[Any]) -> Sequence[Any]:
+        """Run a batch as one measured call."""
+        counters = self._metrics.operator(operator)
+        clock = self._metrics.clock
+        start = clock()
+        try:
+            results = self._record_many(operation, operator, a_values, b_values)
+        except Exception as e:
+            counters.record_error(e, clock() - start)
+            raise
+        counters.record(clock() - start)
+        return results
+    
+    def _record_many(self, operation: Operation, operator: str, a_values: Iterable[Any], b_values: Iterable[Any]) -> Sequence[Any]:
+        if self._history is None:
+            return self._execute_many(operation, a_values, b_values)
+        # Sequences and buffers are read again for recording, without a copy;
+        # only one-shot iterators must be materialized first
+        if iter(a_values) is a_values:
+            a_values = list(a_values)
+        if iter(b_values) is b_values:
+            b_values = list(b_values)
+        try:
+            results = self._execute_many(operation, a_values, b_values)
+        except Exception:
+            # The failing element is unknown: one error record for the batch
+            self._history.record(math.nan, operator, math.nan, error=True)
+            raise
+        self._history.record_many(a_values, operator, b_values, results)
+        return results
+    
+    def _execute_many(self, operation: Operation, a_values: Iterable[Any], b_values: Iterable[Any]) -> Sequence[Any]:
+        if self._numeric is not None:
+            return self._numeric.execute_many(operation, a_values, b_values)
+        return operation.execute_many(a_values, b_values)
     
     def get_supported_operators(self) -> list:
         """Return list of supported operators."""
         return list(self._operations.keys())
     
+    def get_operation(self, operator: str) -> Operation:
+        """
+        Return the operation registered for ``operator``.
+        
+        Raises:
+            ValueError: If operator is not supported or its plugin cannot be loaded
+        """
+        return self._get_operation(operator)
+    
+    def resolve(self, operator: str) -> Callable[[Any, Any], Any]:
+        """
+        Return the callable ``calculate`` uses for ``operator``, with every enabled layer.
+        
+        Callers evaluating many values can keep it and skip the lookup; it
+        stays valid until the registry changes (see ``dispatch``).
+        
+        Raises:
+            ValueError: If operator is not supported or its plugin cannot be loaded
+        """
+        self._get_operation(operator)
+        return self._dispatch[operator]
+    
+    @property
+    def dispatch(self) -> Mapping[str, Callable[[Any, Any], Any]]:
+        """The frozen operator -> callable table; replaced whenever the registry changes."""
+        return self._dispatch
+    
+    def compiled(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Return the object cached under ``key``, calling ``build()`` on a miss.
+        
+        Meant for artefacts compiled against this service's operations
+        (e.g. expression templates): the cache is emptied whenever the
+        registry changes and is not pickled.
+        """
+        try:
+            return self._compiled[key]
+        except KeyError:
+            value = self._compiled[key] = build()
+            return value
+    
     def add_operation(self, operation: Operation) -> None:
         """
         Add a new operation to the calculator.
         This allows for extensibility.
         
+        A ``LazyOperation`` (see ``src.application.plugins``) is imported the
+        first time its operator is used and then replaces itself.
+        
         Args:
             operation: An instance of Operation to add
         """
-        self._operations[operation.symbol()] = operation
+        symbol = operation.symbol()
+        self._operations[symbol] = operation
+        if self._cache is not None:
+            self._cache.discard_operator(symbol)
+        self._rebuild_dispatch()
+    
+    @property
+    def history(self) -> Optional[HistoryRecorder]:
+        """The history recorder calculations are appended to, or None."""
+        return self._history
+    
+    @property
+    def numeric(self) -> Optional[NumericBackend]:
+        """The numeric backend operands are coerced to, or None."""
+        return self._numeric
+    
+    def stats(self) -> Dict[str, OperatorStats]:
+        """
+        Return per-operator call counts, errors by type and latency histograms.
+        
+        Only operators that have been called appear; a ``calculate_many``
+        call counts as one call. Empty when metrics are disabled.
+        """
+        if self._metrics is None:
+            return {}
+        return self._metrics.snapshot()
+    
+    def stats_clear(self) -> None:
+        """Reset the per-operator metrics."""
+        if self._metrics is not None:
+            self._metrics.clear()
+    
+    def stats_merge(self, stats: Dict[str, OperatorStats]) -> None:
+        """
+        Add per-operator stats collected by another copy of the service.
+        
+        Worker processes measure calls in their own copy; returning its
+        ``stats()`` and merging them here keeps this service's totals
+        complete. Ignored when metrics are disabled.
+        """
+        if self._metrics is not None:
+            self._metrics.merge(stats)
+    
+    @property
+    def metrics_enabled(self) -> bool:
+        """True when per-operator metrics are collected."""
+        return self._metrics is not None
+    
+    def cache_info(self) -> CacheInfo:
+        """Return hit, miss and eviction statistics of the result cache."""
+        if self._cache is None:
+            return CacheInfo(0, 0, 0, 0, 0)
+        return self._cache.info()
+    
+    def cache_clear(self) -> None:
+        """Drop all memoized results and reset the cache statistics."""
+        if self._cache is not None:
+            self._cache.clear()
+    
+    def with_history(self, history: Optional[HistoryRecorder]) -> 'CalculatorService':
+        """
+        Return a copy of the service that records to ``history`` (``None``: not at all).
+        
+        Worker processes must be given ``with_history(None)``: with the
+        ``fork`` start method nothing is pickled, so a worker handed the
+        service itself would inherit the live recorder and write into the
+        same log as the parent. The copy has its own registry and shares
+        the result cache and metrics.
+        """
+        state = self.__getstate__()
+        state['_history'] = history
+        state['_operations'] = dict(self._operations)
+        copy = self.__class__.__new__(self.__class__)
+        copy.__setstate__(state)
+        return copy
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle the registry and settings; the dispatch table is rebuilt on load.
+        
+        The history recorder owns open files and is not copied.
+        """
+        state = self.__dict__.copy()
+        del state['_dispatch']
+        del state['_compiled']
+        state['_history'] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._compiled = {}
+        self._rebuild_dispatch()
+    
+    def _get_operation(self, operator: str) -> Operation:
+        """Return the operation registered for ``operator``."""
+        if operator not in self._operations:
+            raise self._unsupported_operator(operator)
+        operation = self._operations[operator]
+        if isinstance(operation, LazyOperation):
+            operation = self._resolve(operation)
+        return operation
+    
+    def _resolve(self, operation: LazyOperation) -> Operation:
+        """Import a plugin operation and register it in place of its stand-in."""
+        loaded = operation.load()
+        if self._operations.get(operation.symbol()) is operation:
+            self.add_operation(loaded)
+        return loaded
+    
+    def _unsupported_operator(self, operator: str) -> ValueError:
+        """Build the error raised for an operator missing from the registry."""
+        return ValueError(f"Unsupported operator: {operator}. Supported operators: {', '.join(self._operations.keys())}")
+    
+    def _rebuild_dispatch(self) -> None:
+        """
+        Precompile the frozen operator -> callable table used by ``calculate``.
+        
+        Called whenever the registry changes, so ``calculate`` performs a
+        single lookup and a direct call.
+        """
+        self._dispatch = MappingProxyType({
+            symbol: self._bind(symbol, operation)
+            for symbol, operation in self._operations.items()
+        })
+        self._compiled.clear()
+    
+    def _bind(self, symbol: str, operation: Operation) -> Callable[[Any, Any], Any]:
+        """Return the callable evaluating ``operation``, wrapped by enabled layers."""
+        if isinstance(operation, LazyOperation):
+            def load_and_calculate(a, b):
+                self._resolve(operation)
+                return self._dispatch[symbol](a, b)
+            return load_and_calculate
+        function = operation.execute
+        if self._numeric is not None:
+            function = self._numeric.bind(operation)
+        if self._cache is not None:
+            cache = self._cache
+            compute = function
+            
+            def cached(a, b):
+                return cache.get_or_compute(a, symbol, b, compute)
+            function = cached
+        if self._metrics is not None:
+            counters = self._metrics.operator(symbol)
+            record = counters.record
+            clock = self._metrics.clock
+            timed = function
+            
+            def measured(a, b):
+                start = clock()
+                try:
+                    result = timed(a, b)
+                except Exception as e:
+                    counters.record_error(e, clock() - start)
+                    raise
+                record(clock() - start)
+                return result
+            function = measured
+        if self._history is not None:
+            history = self._history
+            evaluate = function
+            
+            def recorded(a, b):
+                try:
+                    result = evaluate(a, b)
+                except Exception:
+                    history.record(a, symbol, b, error=True)
+                    raise
+                history.record(a, symbol, b, result)
+                return result
+            function = recorded
+        return function
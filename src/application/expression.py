@@ -0,0 +1,260 @@
+"""
+Application Layer: Arithmetic expression engine.
+Expressions are compiled to a tree whose operations are evaluated through the
+CalculatorService operation registry.
+"""
+
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import List, Optional, Union
+
+from src.application.calculator_service import CalculatorService
+from src.application.tokenizer import Token, tokenize
+
+
+# Binding power of binary operators; higher binds tighter.
+_PRECEDENCE = {
+    '+': 1,
+    '-': 1,
+    '*': 2,
+    '/': 2,
+    '^': 4,
+    'root': 4,
+}
+_RIGHT_ASSOCIATIVE = {'^', 'root'}
+# Operators registered through add_operation bind like multiplication.
+_DEFAULT_PRECEDENCE = 2
+# Unary minus binds tighter than * and / but looser than ^, so -2 ^ 2 == -4.
+_UNARY_PRECEDENCE = 3
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression cannot be parsed."""
+
+
+class Node(ABC):
+    """A node of a compiled expression tree."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def evaluate(self, service: CalculatorService) -> Union[int, float]:
+        """Evaluate the node using the operations registered in ``service``."""
+        pass
+
+
+class NumberNode(Node):
+    """A numeric literal."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Union[int, float]):
+        self.value = value
+
+    def evaluate(self, service: CalculatorService) -> Union[int, float]:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"NumberNode({self.value!r})"
+
+
+class NegateNode(Node):
+    """Unary minus applied to a sub-expression."""
+
+    __slots__ = ('operand',)
+
+    def __init__(self, operand: Node):
+        self.operand = operand
+
+    def evaluate(self, service: CalculatorService) -> Union[int, float]:
+        return -self.operand.evaluate(service)
+
+    def __repr__(self) -> str:
+        return f"NegateNode({self.operand!r})"
+
+
+class VariableNode(Node):
+    """A named variable, bound when the expression is used as a template."""
+
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def evaluate(self, service: CalculatorService) -> Union[int, float]:
+        raise ExpressionError(f"Unbound variable '{self.name}'")
+
+    def __repr__(self) -> str:
+        return f"VariableNode({self.name!r})"
+
+
+class BinaryNode(Node):
+    """A binary operation dispatched through ``CalculatorService.calculate``."""
+
+    __slots__ = ('left', 'operator', 'right')
+
+    def __init__(self, left: Node, operator: str, right: Node):
+        self.left = left
+        self.operator = operator
+        self.right = right
+
+    def evaluate(self, service: CalculatorService) -> Union[int, float]:
+        return service.calculate(
+            self.left.evaluate(service),
+            self.operator,
+            self.right.evaluate(service),
+        )
+
+    def __repr__(self) -> str:
+        return f"BinaryNode({self.left!r}, {self.operator!r}, {self.right!r})"
+
+
+class _Parser:
+    """
+    Precedence-climbing parser producing a Node tree.
+
+    Tokens come from ``src.application.tokenizer``: numbers are already
+    ``int``/``float`` and everything else is a ``str``.
+    """
+
+    def __init__(self, tokens: List[Token]):
+        if not tokens:
+            raise ExpressionError("Empty expression")
+        self._tokens = tokens
+        self._position = 0
+
+    def parse(self) -> Node:
+        node = self._expression(0)
+        token = self._peek()
+        if token is not None:
+            raise ExpressionError(f"Unexpected '{token}'")
+        return node
+
+    def _peek(self) -> Optional[Token]:
+        if self._position < len(self._tokens):
+            return self._tokens[self._position]
+        return None
+
+    def _advance(self) -> Token:
+        token = self._tokens[self._position]
+        self._position += 1
+        return token
+
+    def _expression(self, min_precedence: int) -> Node:
+        left = self._unary()
+        while True:
+            token = self._peek()
+            if token is None or not isinstance(token, str) or token in ('(', ')'):
+                return left
+            operator = token
+            precedence = _PRECEDENCE.get(operator, _DEFAULT_PRECEDENCE)
+            if precedence < min_precedence:
+                return left
+            self._advance()
+            next_min = precedence if operator in _RIGHT_ASSOCIATIVE else precedence + 1
+            left = BinaryNode(left, operator, self._expression(next_min))
+
+    def _unary(self) -> Node:
+        token = self._peek()
+        if token == '-' or token == '+':
+            self._advance()
+            operand = self._expression(_UNARY_PRECEDENCE)
+            return NegateNode(operand) if token == '-' else operand
+        return self._primary()
+
+    def _primary(self) -> Node:
+        token = self._peek()
+        if token is None:
+            raise ExpressionError("Unexpected end of expression")
+        token = self._advance()
+        if not isinstance(token, str):
+            return NumberNode(token)
+        if token.isidentifier():
+            return VariableNode(token)
+        if token == '(':
+            node = self._expression(0)
+            closing = self._peek()
+            if closing != ')':
+                raise ExpressionError("Missing closing parenthesis")
+            self._advance()
+            return node
+        raise ExpressionError(f"Unexpected '{token}'")
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(source: str) -> Node:
+    """
+    Compile an expression to a tree.
+
+    Compiled trees are cached by source text, so repeated formulas skip
+    tokenizing and parsing entirely.
+
+    Args:
+        source: Expression such as ``2 + 3 * 4 ^ 2`` or ``(27 root 3) - 1``
+
+    Returns:
+        Root node of the expression tree
+
+    Raises:
+        ExpressionError: If the expression is malformed
+    """
+    return _Parser(tokenize(source)).parse()
+
+
+def parse_tokens(tokens: List[Token]) -> Node:
+    """
+    Compile already tokenized input (see ``src.application.tokenizer.scan``).
+
+    Unlike ``compile_expression`` the result is not cached.
+
+    Raises:
+        ExpressionError: If the tokens do not form an expression
+    """
+    return _Parser(tokens).parse()
+
+
+def variables(node: Node) -> List[str]:
+    """Return the variable names used in a tree, in order of first appearance."""
+    names: List[str] = []
+    pending = [node]
+    while pending:
+        current = pending.pop()
+        if isinstance(current, VariableNode):
+            if current.name not in names:
+                names.append(current.name)
+        elif isinstance(current, NegateNode):
+            pending.append(current.operand)
+        elif isinstance(current, BinaryNode):
+            pending.append(current.right)
+            pending.append(current.left)
+    return names
+
+
+def unparse(node: Node) -> str:
+    """Return expression text for a tree; every binary operation is parenthesized."""
+    if isinstance(node, NumberNode):
+        return repr(node.value) if isinstance(node.value, (int, float)) else str(node.value)
+    if isinstance(node, VariableNode):
+        return node.name
+    if isinstance(node, NegateNode):
+        return f"-{unparse(node.operand)}"
+    if isinstance(node, BinaryNode):
+        return f"({unparse(node.left)} {node.operator} {unparse(node.right)})"
+    raise TypeError(f"Not an expression node: {node!r}")
+
+
+def evaluate_expression(source: str, service: CalculatorService) -> Union[int, float]:
+    """
+    Compile (or fetch from cache) and evaluate an expression.
+
+    Args:
+        source: Expression text
+        service: Calculator service providing the operations
+
+    Returns:
+        Result of the expression
+
+    Raises:
+        ValueError: If the expression is malformed or an operation fails
+    """
+    return compile_expression(source).evaluate(service)
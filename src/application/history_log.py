@@ -0,0 +1,398 @@
+"""
+Application Layer: Append-only, memory-mapped calculation history.
+
+Every calculation is stored as a fixed-width binary record:
+
+    timestamp_ns (int64) | a, b, result (float64) | operator code (uint8) | flags (uint8)
+
+Recording only appends a tuple to an in-memory batch; conversion and
+packing happen once per batch, column by column, before the batch is
+copied into a memory-mapped file. A
+sidecar ``.idx`` file holds ``(timestamp_ns, record_number)`` pairs for every
+``index_interval``-th record, so a time range is found with a binary search.
+Timestamps are the wall-clock time at which the recorder was opened plus
+monotonic elapsed time, so they never decrease within a log and the records
+themselves stay sorted by time.
+
+File layout: a 256-byte header (magic, version, record size, committed
+record count, operator table) followed by the records.
+"""
+
+import bisect
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+MAGIC = b'CALCLOG1'
+VERSION = 1
+HEADER_SIZE = 256
+
+_HEADER = struct.Struct('<8sIIQ')
+_OPERATOR_SLOT = struct.Struct('<16s')
+_OPERATOR_TABLE_OFFSET = 32
+MAX_OPERATORS = (HEADER_SIZE - _OPERATOR_TABLE_OFFSET) // _OPERATOR_SLOT.size
+OTHER_OPERATOR = 255  # Code used once the operator table is full
+
+_RECORD = struct.Struct('<qdddBB6x')
+RECORD_SIZE = _RECORD.size
+_INDEX_ENTRY = struct.Struct('<qq')
+
+# Record flags
+ERROR = 1  # The calculation raised; the result is NaN
+LOSSY = 2  # An operand or the result did not fit a float64 and was stored as +-inf or NaN
+
+_FIELDS_PER_RECORD = RECORD_SIZE // 8
+_CODE_OFFSET = 32
+_FLAGS_OFFSET = 33
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+_GROWTH_RECORDS = 1 << 16
+_NAN = float('nan')
+
+
+class HistoryRecord(NamedTuple):
+    """One decoded history record."""
+
+    timestamp_ns: int
+    operator: str
+    a: float
+    b: float
+    result: float
+    flags: int
+
+    @property
+    def error(self) -> bool:
+        """True if the calculation raised."""
+        return bool(self.flags & ERROR)
+
+
+def _as_float(value: Any):
+    """Return ``(float value, lossy)`` for any operand or result."""
+    try:
+        return float(value), False
+    except (TypeError, ValueError):
+        return _NAN, True
+    except OverflowError:
+        return (math.inf if value > 0 else -math.inf), True
+
+
+def _float_column(values: Iterable[Any], flags: bytearray) -> array:
+    """Convert one column of a batch to float64, flagging values that do not fit."""
+    try:
+        return array('d', values)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    column = array('d')
+    for number, value in enumerate(values):
+        converted, lossy = _as_float(value)
+        column.append(converted)
+        if lossy:
+            flags[number] |= LOSSY
+    return column
+
+
+def pack_records(batch: List[tuple]) -> bytearray:
+    """
+    Pack ``(timestamp_ns, a, b, result, code, error)`` tuples into records.
+
+    Columns are converted in bulk and written with strided slice
+    assignment, so the per-record work happens in C.
+    """
+    timestamps, a_values, b_values, results, codes, errors = zip(*batch)
+    flags = bytearray(errors)  # True -> ERROR
+    a_column = _float_column(a_values, flags)
+    b_column = _float_column(b_values, flags)
+    if any(errors):
+        results = [_NAN if error else result for result, error in zip(results, errors)]
+    result_column = _float_column(results, flags)
+    if not _LITTLE_ENDIAN:
+        return bytearray(b''.join(
+            _RECORD.pack(*fields)
+            for fields in zip(timestamps, a_column, b_column, result_column, codes, flags)
+        ))
+    data = bytearray(len(batch) * RECORD_SIZE)
+    view = memoryview(data)
+    try:
+        view.cast('q')[0::_FIELDS_PER_RECORD] = array('q', timestamps)
+        doubles = view.cast('d')
+        doubles[1::_FIELDS_PER_RECORD] = a_column
+        doubles[2::_FIELDS_PER_RECORD] = b_column
+        doubles[3::_FIELDS_PER_RECORD] = result_column
+        view[_CODE_OFFSET::RECORD_SIZE] = bytes(codes)
+        view[_FLAGS_OFFSET::RECORD_SIZE] = flags
+    finally:
+        view.release()
+    return data
+
+
+def index_path(path: str) -> str:
+    """Return the path of the sidecar index for the log at ``path``."""
+    return path + '.idx'
+
+
+class HistoryRecorder:
+    """Batched writer of an append-only history log."""
+
+    def __init__(self, path: str, batch_size: int = 256, index_interval: int = 1024):
+        """
+        Open (or create) the log at ``path`` for appending.
+
+        Args:
+            path: Log file; the index is written to ``path + '.idx'``
+            batch_size: Records buffered in memory before they are written
+            index_interval: Every n-th record gets an index entry
+
+        Raises:
+            ValueError: If the file exists but is not a history log
+        """
+        if batch_size < 1 or index_interval < 1:
+            raise ValueError("Batch size and index interval must be positive")
+        self.path = path
+        self.batch_size = batch_size
+        self.index_interval = index_interval
+        self._lock = threading.Lock()
+        self._pending: List[tuple] = []
+        self._last_ns = 0
+
+        with open(path, 'ab') as f:
+            if f.tell() == 0:
+                f.write(_HEADER.pack(MAGIC, VERSION, RECORD_SIZE, 0).ljust(HEADER_SIZE, b'\0'))
+        self._file = open(path, 'r+b')
+        self._capacity = 0
+        self._map: Optional[mmap.mmap] = None
+        self._remap(os.path.getsize(path))
+
+        magic, version, record_size, self._count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+            self._map.close()
+            self._file.close()
+            raise ValueError(f"Not a calculation history log: {path}")
+        self._operators: Dict[str, int] = {
+            symbol: code for code, symbol in enumerate(_read_operator_table(self._map))
+        }
+        start_ns = time.time_ns()
+        if self._count:
+            start_ns = max(start_ns, _RECORD.unpack_from(self._map, HEADER_SIZE + (self._count - 1) * RECORD_SIZE)[0])
+        self._clock_offset = start_ns - time.monotonic_ns()
+        self._last_ns = start_ns
+        self._index = open(index_path(path), 'ab')
+
+    def __len__(self) -> int:
+        """Number of records, including buffered ones."""
+        return self._count + len(self._pending)
+
+    def record(self, a: Any, operator: str, b: Any, result: Any = None, error: bool = False) -> None:
+        """Append one calculation (buffered until the batch is full)."""
+        code = self._operators.get(operator)
+        if code is None:
+            with self._lock:
+                code = self._register_operator(operator)
+        # list.append is atomic, so the hot path takes no lock
+        pending = self._pending
+        pending.append((time.monotonic_ns() + self._clock_offset, a, b, result, code, error))
+        if len(pending) >= self.batch_size:
+            self.flush()
+
+    def record_many(self, a_values: Iterable[Any], operator: str, b_values: Iterable[Any], results: Iterable[Any]) -> None:
+        """Append one record per element of a batch calculation."""
+        for a, b, result in zip(a_values, b_values, results):
+            self.record(a, operator, b, result)
+
+    def flush(self) -> None:
+        """Write buffered records to the log and index."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush, trim the preallocated tail and close the files."""
+        with self._lock:
+            if self._map is None:
+                return
+            self._flush_locked()
+            self._close_files()
+            os.truncate(self.path, HEADER_SIZE + self._count * RECORD_SIZE)
+
+    def __enter__(self) -> 'HistoryRecorder':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getstate__(self):
+        raise TypeError("HistoryRecorder cannot be pickled; open a recorder per process")
+
+    def _register_operator(self, operator: str) -> int:
+        """Give ``operator`` the next free code and store it in the header."""
+        if operator in self._operators:
+            return self._operators[operator]
+        code = len(self._operators)
+        if code >= MAX_OPERATORS:
+            return OTHER_OPERATOR
+        _OPERATOR_SLOT.pack_into(self._map, _OPERATOR_TABLE_OFFSET + code * _OPERATOR_SLOT.size,
+                                 operator.encode('utf-8')[:_OPERATOR_SLOT.size])
+        self._operators[operator] = code
+        return code
+
+    def _flush_locked(self) -> None:
+        pending = self._pending
+        # Records appended by other threads meanwhile stay for the next batch
+        batch = pending[:]
+        if not batch:
+            return
+        del pending[:len(batch)]
+        # Threads may append slightly out of timestamp order; restore it
+        batch.sort(key=itemgetter(0))
+        if batch[0][0] < self._last_ns:
+            batch = [(max(record[0], self._last_ns),) + record[1:] for record in batch]
+        self._last_ns = batch[-1][0]
+        end = HEADER_SIZE + (self._count + len(batch)) * RECORD_SIZE
+        if end > self._capacity:
+            self._remap(max(end, HEADER_SIZE + 2 * self._count * RECORD_SIZE) + _GROWTH_RECORDS * RECORD_SIZE)
+        start = HEADER_SIZE + self._count * RECORD_SIZE
+        self._map[start:end] = pack_records(batch)
+        first = self._count
+        # Publish the records only after their bytes are in place
+        self._count += len(batch)
+        _HEADER.pack_into(self._map, 0, MAGIC, VERSION, RECORD_SIZE, self._count)
+
+        interval = self.index_interval
+        number = -(-first // interval) * interval  # First multiple of the interval in the batch
+        entries = []
+        while number < self._count:
+            entries.append(_INDEX_ENTRY.pack(batch[number - first][0], number))
+            number += interval
+        if entries:
+            self._index.write(b''.join(entries))
+            self._index.flush()
+
+    def _remap(self, size: int) -> None:
+        if self._map is not None:
+            self._map.close()
+        if os.path.getsize(self.path) < size:
+            self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        self._capacity = size
+
+    def _close_files(self) -> None:
+        self._map.close()
+        self._map = None
+        self._file.close()
+        self._index.close()
+
+
+def _read_operator_table(buffer) -> List[str]:
+    """Decode the operator symbols stored in a log header."""
+    symbols = []
+    for code in range(MAX_OPERATORS):
+        raw = _OPERATOR_SLOT.unpack_from(buffer, _OPERATOR_TABLE_OFFSET + code * _OPERATOR_SLOT.size)[0]
+        raw = raw.rstrip(b'\0')
+        if not raw:
+            break
+        symbols.append(raw.decode('utf-8', 'replace'))
+    return symbols
+
+
+class HistoryLogReader:
+    """
+    Read-only view of a history log.
+
+    Records are decoded one at a time from the memory map, so iterating or
+    searching never loads the whole file. The reader sees the records
+    committed when it was opened.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open the log at ``path``.
+
+        Raises:
+            ValueError: If the file is not a history log
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, self._count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+            self._map.close()
+            raise ValueError(f"Not a calculation history log: {path}")
+        self._operators = _read_operator_table(self._map)
+        self._index_times = array('q')
+        self._index_records = array('q')
+        try:
+            with open(index_path(path), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b''
+        for timestamp, number in _INDEX_ENTRY.iter_unpack(data[:len(data) - len(data) % _INDEX_ENTRY.size]):
+            # Entries for records that were never committed are ignored
+            if number < self._count:
+                self._index_times.append(timestamp)
+                self._index_records.append(number)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, number: int) -> HistoryRecord:
+        if number < 0:
+            number += self._count
+        if not 0 <= number < self._count:
+            raise IndexError("History record out of range")
+        return self._decode(_RECORD.unpack_from(self._map, HEADER_SIZE + number * RECORD_SIZE))
+
+    def __iter__(self) -> Iterator[HistoryRecord]:
+        return self.records(0, self._count)
+
+    def records(self, start: int, stop: int) -> Iterator[HistoryRecord]:
+        """Iterate records ``start`` to ``stop - 1`` lazily."""
+        start = max(0, start)
+        stop = min(stop, self._count)
+        view = memoryview(self._map)[HEADER_SIZE + start * RECORD_SIZE:HEADER_SIZE + max(start, stop) * RECORD_SIZE]
+        try:
+            for fields in _RECORD.iter_unpack(view):
+                yield self._decode(fields)
+        finally:
+            view.release()
+
+    def between(self, start_ns: int, end_ns: int) -> Iterator[HistoryRecord]:
+        """Iterate the records with ``start_ns <= timestamp_ns < end_ns``."""
+        first = self._first_at_or_after(start_ns)
+        last = self._first_at_or_after(end_ns)
+        return self.records(first, last)
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> 'HistoryLogReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _timestamp(self, number: int) -> int:
+        return struct.unpack_from('<q', self._map, HEADER_SIZE + number * RECORD_SIZE)[0]
+
+    def _first_at_or_after(self, timestamp_ns: int) -> int:
+        """Binary search for the first record not older than ``timestamp_ns``."""
+        # The index narrows the search to the records between two entries
+        block = bisect.bisect_left(self._index_times, timestamp_ns)
+        low = self._index_records[block - 1] if block > 0 else 0
+        high = self._index_records[block] if block < len(self._index_records) else self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._timestamp(middle) < timestamp_ns:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _decode(self, fields) -> HistoryRecord:
+        timestamp, a, b, result, code, flags = fields
+        operator = self._operators[code] if code < len(self._operators) else '?'
+        return HistoryRecord(timestamp, operator, a, b, result, flags)
@@ -0,0 +1,135 @@
+"""
+Application Layer: Per-operator call metrics.
+Counts calls and errors (by exception type) and keeps a log2-bucketed
+latency histogram for every operator a calculator service evaluates.
+"""
+
+import time
+from typing import Dict, NamedTuple, Tuple
+
+# Bucket i holds latencies in [2 ** (i - 1), 2 ** i) nanoseconds; bucket 0 holds 0 ns
+BUCKETS = 64
+
+
+class OperatorStats(NamedTuple):
+    """Snapshot of one operator's metrics."""
+
+    calls: int
+    errors: int
+    error_types: Dict[str, int]
+    total_ns: int
+    histogram: Tuple[int, ...]
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of calls that raised."""
+        return self.errors / self.calls if self.calls else 0.0
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean latency in nanoseconds."""
+        return self.total_ns / self.calls if self.calls else 0.0
+
+    def percentile(self, q: float) -> int:
+        """
+        Return an upper bound in nanoseconds for the ``q``-th latency percentile.
+
+        The bound is the upper edge of the histogram bucket the percentile
+        falls in, so it is exact to within a factor of two.
+
+        Raises:
+            ValueError: If q is not between 0 and 100
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        rank = q / 100 * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= rank:
+                return 1 << bucket
+        return 0
+
+    def buckets(self) -> Dict[int, int]:
+        """Return ``{upper bound in ns: count}`` for the non-empty buckets."""
+        return {1 << bucket: count for bucket, count in enumerate(self.histogram) if count}
+
+
+class OperatorMetrics:
+    """Mutable counters for one operator."""
+
+    __slots__ = ('histogram', 'total_ns', 'error_types')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        self.histogram = [0] * BUCKETS
+        self.total_ns = 0
+        self.error_types: Dict[str, int] = {}
+
+    def record(self, elapsed_ns: int) -> None:
+        """Count one call that took ``elapsed_ns``."""
+        self.histogram[elapsed_ns.bit_length()] += 1
+        self.total_ns += elapsed_ns
+
+    def record_error(self, error: BaseException, elapsed_ns: int) -> None:
+        """Count one call that raised ``error`` after ``elapsed_ns``."""
+        self.record(elapsed_ns)
+        name = type(error).__name__
+        self.error_types[name] = self.error_types.get(name, 0) + 1
+
+    def merge(self, stats: OperatorStats) -> None:
+        """Add the counts of ``stats`` (e.g. from another process) to these counters."""
+        for bucket, count in enumerate(stats.histogram):
+            self.histogram[bucket] += count
+        self.total_ns += stats.total_ns
+        for name, count in stats.error_types.items():
+            self.error_types[name] = self.error_types.get(name, 0) + count
+
+    def snapshot(self) -> OperatorStats:
+        """Return the current counts."""
+        histogram = tuple(self.histogram)
+        error_types = dict(self.error_types)
+        return OperatorStats(sum(histogram), sum(error_types.values()), error_types, self.total_ns, histogram)
+
+
+class ServiceMetrics:
+    """
+    Metrics for every operator of a calculator service.
+
+    Counters are updated without a lock to keep the measured path short;
+    under heavy multi-threaded use an occasional increment may be lost.
+    """
+
+    clock = staticmethod(time.perf_counter_ns)
+
+    def __init__(self):
+        self._operators: Dict[str, OperatorMetrics] = {}
+
+    def operator(self, symbol: str) -> OperatorMetrics:
+        """Return the counters for ``symbol``, creating them on first use."""
+        metrics = self._operators.get(symbol)
+        if metrics is None:
+            metrics = self._operators[symbol] = OperatorMetrics()
+        return metrics
+
+    def snapshot(self) -> Dict[str, OperatorStats]:
+        """Return the stats of every operator that has been called."""
+        result = {}
+        for symbol, metrics in list(self._operators.items()):
+            stats = metrics.snapshot()
+            if stats.calls:
+                result[symbol] = stats
+        return result
+
+    def merge(self, stats: Dict[str, OperatorStats]) -> None:
+        """Add a ``snapshot()`` taken elsewhere, e.g. in a worker process, to these metrics."""
+        for symbol, operator_stats in stats.items():
+            self.operator(symbol).merge(operator_stats)
+
+    def clear(self) -> None:
+        """Reset every counter."""
+        for metrics in self._operators.values():
+            metrics.reset()
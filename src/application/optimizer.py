@@ -0,0 +1,196 @@
+"""
+Application Layer: Expression tree optimizer.
+Folds constant subexpressions, applies identities and expands small integer
+powers into multiplications, for operators a calculator service evaluates
+with the built-in operation classes. Every rewrite is reported.
+"""
+
+from typing import List, NamedTuple, Optional, Tuple
+
+from src.application.calculator_service import CalculatorService
+from src.application.expression import (
+    BinaryNode,
+    NegateNode,
+    Node,
+    NumberNode,
+    VariableNode,
+    unparse,
+)
+from src.domain.operations import (
+    Addition,
+    Division,
+    Multiplication,
+    Operation,
+    Power,
+    Root,
+    Subtraction,
+)
+
+BUILTIN_OPERATIONS = (Addition, Subtraction, Multiplication, Division, Power, Root)
+
+# Largest exponent expanded into a chain of multiplications
+MAX_EXPANDED_POWER = 4
+
+
+class Rewrite(NamedTuple):
+    """One rewrite applied by the optimizer."""
+
+    rule: str
+    before: str
+    after: str
+
+
+class OptimizedExpression(NamedTuple):
+    """An optimized tree and the rewrites that produced it."""
+
+    tree: Node
+    rewrites: Tuple[Rewrite, ...]
+
+
+def plain_operation(service: CalculatorService, operator: str) -> Optional[Operation]:
+    """
+    Return the built-in operation behind ``operator`` if the service adds nothing to it.
+
+    That is the case when the operator is one of the built-in operation
+    classes and the service's dispatch entry is its bare ``execute`` (no
+    numeric backend, cache, metrics or history layer). Returns None
+    otherwise, including for unsupported operators.
+    """
+    try:
+        operation = service.get_operation(operator)
+        function = service.resolve(operator)
+    except ValueError:
+        return None
+    if type(operation) in BUILTIN_OPERATIONS and function == operation.execute:
+        return operation
+    return None
+
+
+def _is_number(node: Node, value) -> bool:
+    """True for a literal equal to ``value`` with the same type (``1`` but not ``1.0``)."""
+    return isinstance(node, NumberNode) and type(node.value) is type(value) and node.value == value
+
+
+class _Optimizer:
+    """Bottom-up rewriting of one tree."""
+
+    def __init__(self, service: CalculatorService):
+        self.service = service
+        self.rewrites: List[Rewrite] = []
+
+    def _record(self, rule: str, before: Node, after: Node) -> Node:
+        self.rewrites.append(Rewrite(rule, unparse(before), unparse(after)))
+        return after
+
+    def visit(self, node: Node) -> Node:
+        if isinstance(node, NegateNode):
+            return self._negate(node)
+        if isinstance(node, BinaryNode):
+            return self._binary(node)
+        return node
+
+    def _negate(self, node: NegateNode) -> Node:
+        operand = self.visit(node.operand)
+        if isinstance(operand, NumberNode):
+            if operand is node.operand:
+                # A negative literal such as -1; not worth reporting
+                return NumberNode(-operand.value)
+            return self._record('fold', node, NumberNode(-operand.value))
+        if isinstance(operand, NegateNode):
+            return self._record('double negation', node, operand.operand)
+        return node if operand is node.operand else NegateNode(operand)
+
+    def _binary(self, node: BinaryNode) -> Node:
+        left = self.visit(node.left)
+        right = self.visit(node.right)
+        if left is not node.left or right is not node.right:
+            node = BinaryNode(left, node.operator, right)
+        operation = plain_operation(self.service, node.operator)
+        if operation is None:
+            return node
+
+        if isinstance(left, NumberNode) and isinstance(right, NumberNode):
+            try:
+                value = operation.execute(left.value, right.value)
+            except (ArithmeticError, ValueError):
+                # Keep the node so the error is raised when it is evaluated
+                return node
+            if isinstance(value, (int, float)):
+                return self._record('fold', node, NumberNode(value))
+            return node
+
+        # Only identities that give the same value and type for every int
+        # and float operand; Division and Root are never simplified away,
+        # so their errors are raised as before.
+        kind = type(operation)
+        if kind is Multiplication:
+            if _is_number(right, 1):
+                return self._record('x * 1', node, left)
+            if _is_number(left, 1):
+                return self._record('1 * x', node, right)
+            if _is_number(right, -1):
+                return self._record('x * -1', node, NegateNode(left))
+            if _is_number(left, -1):
+                return self._record('-1 * x', node, NegateNode(right))
+        elif kind is Addition:
+            if _is_number(right, 0):
+                return self._record('x + 0', node, left)
+            if _is_number(left, 0):
+                return self._record('0 + x', node, right)
+        elif kind is Subtraction:
+            if _is_number(right, 0):
+                return self._record('x - 0', node, left)
+        elif kind is Power:
+            if _is_number(right, 1):
+                return self._record('x ^ 1', node, left)
+            if (
+                isinstance(left, VariableNode)
+                and isinstance(right, NumberNode)
+                and type(right.value) is int
+                and 2 <= right.value <= MAX_EXPANDED_POWER
+            ):
+                return self._record(f"x ^ {right.value}", node, self._product(left, right.value))
+        return node
+
+    def _product(self, base: Node, exponent: int) -> Node:
+        """Return ``base * base * ...`` if the service multiplies plainly, else ``base ^ exponent``."""
+        symbol = Multiplication().symbol()
+        if not isinstance(plain_operation(self.service, symbol), Multiplication):
+            return BinaryNode(base, Power().symbol(), NumberNode(exponent))
+        product = base
+        for _ in range(exponent - 1):
+            product = BinaryNode(product, symbol, base)
+        return product
+
+
+def optimize(tree: Node, service: CalculatorService) -> OptimizedExpression:
+    """
+    Return an equivalent tree for ``service`` and the rewrites applied.
+
+    Rewrites, applied bottom-up:
+
+    - constant subexpressions are evaluated (``2 ^ 10`` -> ``1024``); ones
+      that raise (e.g. ``1 / 0``) are kept so the error still surfaces
+    - ``x * 1``, ``1 * x``, ``x + 0``, ``0 + x``, ``x - 0`` and ``x ^ 1``
+      become ``x`` (integer literals only, so operand types are kept);
+      ``x * -1`` becomes ``-x`` and ``--x`` becomes ``x``
+    - ``x ^ 2`` to ``x ^ 4`` on a variable become multiplication chains
+
+    Only operators evaluated by a bare built-in operation are rewritten;
+    custom operations and services with a numeric backend, cache, metrics
+    or history are left alone. Differences from unoptimized evaluation are
+    limited to float corner cases: ``-0.0 + 0`` gives ``-0.0``, a chain may
+    differ from ``**`` in the last bit, and a float power that overflows
+    gives ``inf`` instead of raising ``OverflowError``.
+
+    Args:
+        tree: Expression tree, e.g. from ``compile_expression``
+        service: The service the tree will be evaluated with
+
+    Returns:
+        The optimized tree and the rewrites as ``(rule, before, after)``
+        tuples
+    """
+    optimizer = _Optimizer(service)
+    result = optimizer.visit(tree)
+    return OptimizedExpression(result, tuple(optimizer.rewrites))
@@ -0,0 +1,256 @@
+"""
+Application Layer: Operation plugin discovery.
+Operations are found through the ``niwpi_calculator.operations`` entry point
+group and in plugin directories, and recorded in an on-disk manifest keyed
+by the modification times of the installed distributions. While the
+environment is unchanged, startup reads only the manifest; each plugin
+module is imported the first time its operator is used.
+"""
+
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import warnings
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from src.domain.operations import Operation
+
+ENTRY_POINT_GROUP = 'niwpi_calculator.operations'
+MANIFEST_VERSION = 1
+
+PathLike = Union[str, 'os.PathLike[str]']
+
+
+def default_manifest_path() -> Path:
+    """Return ``$XDG_CACHE_HOME/niwpi-calculator/plugins.json`` (``~/.cache`` by default)."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(cache_home) / 'niwpi-calculator' / 'plugins.json'
+
+
+class LazyOperation(Operation):
+    """
+    Stand-in for a plugin operation whose module has not been imported yet.
+
+    ``target`` is ``'module:attribute'`` or ``'path/to/file.py:attribute'``;
+    the attribute is an ``Operation`` subclass or instance.
+    """
+
+    __slots__ = ('_symbol', 'target')
+
+    def __init__(self, symbol: str, target: str):
+        self._symbol = symbol
+        self.target = target
+
+    def symbol(self) -> str:
+        return self._symbol
+
+    def load(self) -> Operation:
+        """
+        Import the plugin and return its operation.
+
+        Raises:
+            ValueError: If the plugin cannot be imported or does not provide
+                an operation for this symbol
+        """
+        location, _, attribute = self.target.rpartition(':')
+        try:
+            module = _import_plugin_file(location) if location.endswith('.py') else importlib.import_module(location)
+            operation = getattr(module, attribute)
+            if inspect.isclass(operation):
+                operation = operation()
+        except Exception as e:
+            raise ValueError(f"Cannot load plugin {self.target} for operator '{self._symbol}': {e}") from None
+        if not isinstance(operation, Operation) or operation.symbol() != self._symbol:
+            raise ValueError(f"Plugin {self.target} does not provide an operation for '{self._symbol}'")
+        return operation
+
+    def execute(self, a, b):
+        return self.load().execute(a, b)
+
+    def __repr__(self) -> str:
+        return f"LazyOperation({self._symbol!r}, {self.target!r})"
+
+
+def _import_plugin_file(path: str):
+    """Import a plugin directory module once, under a name derived from its path."""
+    name = '_calculator_plugin_' + hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:16]
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"not a Python module: {path}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return module
+
+
+def _plugin_files(plugin_dirs: Iterable[PathLike]) -> List[str]:
+    files = []
+    for directory in plugin_dirs:
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            continue
+        files.extend(
+            os.path.abspath(os.path.join(directory, name))
+            for name in names
+            if name.endswith('.py') and not name.startswith('_')
+        )
+    return files
+
+
+def environment_key(plugin_dirs: Iterable[PathLike] = ()) -> str:
+    """
+    Fingerprint the installed distributions and plugin files.
+
+    Only directory listings and ``stat`` calls are used (no metadata is
+    parsed), so the key is cheap to compute on every startup.
+    """
+    plugin_dirs = list(plugin_dirs)
+    digest = hashlib.sha1()
+    digest.update(sys.version.encode('utf-8'))
+    for entry in sys.path:
+        digest.update(b'\0' + entry.encode('utf-8', 'surrogateescape'))
+        try:
+            with os.scandir(entry or '.') as scan:
+                listing = sorted(
+                    (item.name, item.stat().st_mtime_ns)
+                    for item in scan
+                    if item.name.endswith(('.dist-info', '.egg-info'))
+                )
+        except OSError:
+            continue
+        for name, mtime in listing:
+            digest.update(f"\0{name}\0{mtime}".encode('utf-8', 'surrogateescape'))
+    for path in _plugin_files(plugin_dirs):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        digest.update(f"\0{path}\0{mtime}".encode('utf-8', 'surrogateescape'))
+    for directory in plugin_dirs:
+        digest.update(b'\0' + os.path.abspath(directory).encode('utf-8', 'surrogateescape'))
+    return digest.hexdigest()
+
+
+def _entry_point_targets(group: str) -> Dict[str, str]:
+    """Return ``{symbol: 'module:attribute'}`` for the entry points in ``group``."""
+    from importlib import metadata
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        selected = entry_points.select(group=group)
+    else:  # Python < 3.10
+        selected = entry_points.get(group, ())
+    return {entry_point.name: entry_point.value.replace(' ', '') for entry_point in selected}
+
+
+def _directory_targets(plugin_dirs: Iterable[PathLike]) -> Dict[str, str]:
+    """
+    Return ``{symbol: 'file.py:ClassName'}`` for the operations in plugin directories.
+
+    Each module is imported once here to learn the symbols of the
+    ``Operation`` subclasses it defines.
+    """
+    targets = {}
+    for path in _plugin_files(plugin_dirs):
+        try:
+            module = _import_plugin_file(path)
+        except Exception as e:
+            warnings.warn(f"Skipping plugin {path}: {e}", RuntimeWarning)
+            continue
+        for name, value in vars(module).items():
+            if (
+                inspect.isclass(value)
+                and issubclass(value, Operation)
+                and value.__module__ == module.__name__
+                and not inspect.isabstract(value)
+            ):
+                try:
+                    symbol = value().symbol()
+                except Exception as e:
+                    warnings.warn(f"Skipping plugin {path}:{name}: {e}", RuntimeWarning)
+                    continue
+                targets[symbol] = f"{path}:{name}"
+    return targets
+
+
+def discover_plugins(
+    plugin_dirs: Iterable[PathLike] = (),
+    manifest_path: Optional[PathLike] = None,
+    group: str = ENTRY_POINT_GROUP,
+) -> Dict[str, str]:
+    """
+    Return ``{symbol: target}`` for every plugin operation.
+
+    The manifest at ``manifest_path`` (``default_manifest_path()`` when
+    omitted) is used when its key matches ``environment_key``; otherwise
+    entry points and plugin directories are scanned and the manifest is
+    rewritten. Directory plugins take precedence over entry points with the
+    same symbol. A manifest that cannot be written is skipped silently.
+    """
+    plugin_dirs = list(plugin_dirs)
+    manifest_path = Path(manifest_path) if manifest_path is not None else default_manifest_path()
+    key = environment_key(plugin_dirs)
+    manifest = _read_manifest(manifest_path)
+    if manifest is not None and manifest.get('key') == key and manifest.get('group') == group:
+        return dict(manifest['operations'])
+
+    operations = _entry_point_targets(group)
+    operations.update(_directory_targets(plugin_dirs))
+    _write_manifest(manifest_path, {
+        'version': MANIFEST_VERSION,
+        'key': key,
+        'group': group,
+        'operations': operations,
+    })
+    return operations
+
+
+def _read_manifest(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, encoding='utf-8') as source:
+            manifest = json.load(source)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+        return None
+    if not isinstance(manifest.get('operations'), dict):
+        return None
+    return manifest
+
+
+def _write_manifest(path: Path, manifest: Dict[str, Any]) -> None:
+    """Write the manifest atomically so concurrent startups never read a partial file."""
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary, 'w', encoding='utf-8') as target:
+            json.dump(manifest, target, indent=1, sort_keys=True)
+        os.replace(temporary, path)
+    except OSError:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+
+
+def plugin_operations(
+    plugin_dirs: Iterable[PathLike] = (),
+    manifest_path: Optional[PathLike] = None,
+    group: str = ENTRY_POINT_GROUP,
+) -> List[LazyOperation]:
+    """Return a ``LazyOperation`` for every discovered plugin, ready for ``add_operation``."""
+    return [
+        LazyOperation(symbol, target)
+        for symbol, target in sorted(discover_plugins(plugin_dirs, manifest_path, group).items())
+    ]
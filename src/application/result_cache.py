@@ -0,0 +1,142 @@
+"""
+Application Layer: Bounded memoization of calculation results.
+Results are kept in least-recently-used order and evicted once the cache
+exceeds its size bound.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Tuple, Union
+
+
+class CacheInfo(NamedTuple):
+    """Snapshot of result cache statistics."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _key_component(value: Any) -> Tuple[Any, ...]:
+    """Return a key part that also distinguishes types, the sign of float zeros and Decimal exponents."""
+    if value.__class__ is float and value == 0:
+        return (float, value, math.copysign(1.0, value))
+    if isinstance(value, Decimal):
+        # Decimal('1.0') == Decimal('1.00'), but results keep the exponent
+        return (value.__class__, value.as_tuple())
+    return (value.__class__, value)
+
+
+def _is_nan(value: Any) -> bool:
+    if isinstance(value, Decimal):
+        # Comparing a signalling NaN raises InvalidOperation
+        return value.is_nan()
+    return value != value
+
+
+def make_key(a: Any, operator: str, b: Any) -> Optional[Hashable]:
+    """
+    Build the cache key for a calculation.
+
+    Returns:
+        The key, or None when the operands are not hashable or are NaN
+    """
+    try:
+        key = (operator, _key_component(a), _key_component(b))
+        hash(key)
+        if _is_nan(a) or _is_nan(b):
+            return None
+    except TypeError:
+        return None
+    return key
+
+
+class ResultCache:
+    """LRU cache of ``(a, operator, b)`` results with hit statistics."""
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of results kept
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self,
+        a: Union[int, float],
+        operator: str,
+        b: Union[int, float],
+        compute: Callable[[Any, Any], Any],
+    ) -> Any:
+        """
+        Return the cached result for ``a operator b`` or compute and store it.
+
+        Operands that cannot be cached are passed straight to ``compute``.
+        Exceptions raised by ``compute`` are not cached.
+        """
+        key = make_key(a, operator, b)
+        if key is None:
+            return compute(a, b)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        result = compute(a, b)
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def discard_operator(self, operator: str) -> None:
+        """Drop every cached result computed with ``operator``."""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == operator]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached results and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle entries and statistics; the lock is recreated on load."""
+        with self._lock:
+            state = self.__dict__.copy()
+            state['_entries'] = self._entries.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def info(self) -> CacheInfo:
+        """Return the current cache statistics."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
@@ -0,0 +1,247 @@
+"""
+Application Layer: Expression templates.
+A template is an expression with named variables (e.g. ``x ^ 2 + y * 3``)
+compiled once into a specialized Python function for one calculator
+service, so evaluating it over many bindings costs about as much as a
+hand-written lambda. Columns of bindings can instead be evaluated with the
+operations' batch kernels.
+"""
+
+import keyword
+import math
+import operator as operators
+from array import array
+from itertools import starmap
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from src.application.calculator_service import CalculatorService
+from src.application.expression import (
+    BinaryNode,
+    ExpressionError,
+    NegateNode,
+    Node,
+    NumberNode,
+    VariableNode,
+    compile_expression,
+    variables as expression_variables,
+)
+from src.application.optimizer import Rewrite, optimize as optimize_tree, plain_operation
+from src.domain.operations import Addition, Multiplication, Power, Subtraction
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; columns fall back to array.array
+    np = None
+
+# Operations whose ``execute`` is exactly this Python operator; they are
+# inlined when the service adds no layers (numeric backend, cache, ...)
+_INLINE_OPERATORS = {
+    Addition: '+',
+    Subtraction: '-',
+    Multiplication: '*',
+    Power: '**',
+}
+
+
+class _CodeGenerator:
+    """Turns an expression tree into the source of one Python function."""
+
+    def __init__(self, service: CalculatorService):
+        self.service = service
+        self.namespace: Dict[str, Any] = {}
+        self._names: Dict[Any, str] = {}
+
+    def _bind(self, prefix: str, key: Any, value: Any) -> str:
+        """Put ``value`` into the function's globals and return its name."""
+        name = self._names.get(key)
+        if name is None:
+            name = self._names[key] = f"__{prefix}{len(self._names)}"
+            self.namespace[name] = value
+        return name
+
+    def emit(self, node: Node) -> str:
+        if isinstance(node, NumberNode):
+            value = node.value
+            if type(value) is int or (type(value) is float and math.isfinite(value)):
+                literal = repr(value)
+                # -2 ** x parses as -(2 ** x); negative literals need parentheses
+                return f"({literal})" if literal.startswith('-') else literal
+            return self._bind('c', ('constant', id(value)), value)
+        if isinstance(node, VariableNode):
+            return node.name
+        if isinstance(node, NegateNode):
+            return f"(-{self.emit(node.operand)})"
+        if isinstance(node, BinaryNode):
+            left = self.emit(node.left)
+            right = self.emit(node.right)
+            inline = _INLINE_OPERATORS.get(type(plain_operation(self.service, node.operator)))
+            if inline is not None:
+                return f"({left} {inline} {right})"
+            name = self._bind('op', ('operator', node.operator), self.service.resolve(node.operator))
+            return f"{name}({left}, {right})"
+        raise ExpressionError(f"Cannot compile {node!r}")
+
+
+def _check_variable_names(names: Sequence[str]) -> None:
+    for name in names:
+        if not name.isidentifier() or keyword.iskeyword(name) or name.startswith('__'):
+            raise ExpressionError(f"'{name}' cannot be used as a variable name")
+
+
+class ExpressionTemplate:
+    """An expression with named variables, compiled for one calculator service."""
+
+    def __init__(
+        self,
+        source: str,
+        service: CalculatorService,
+        variables: Optional[Sequence[str]] = None,
+        optimize: bool = True,
+    ):
+        """
+        Compile ``source`` into a Python function of its variables.
+
+        Args:
+            source: Expression text such as ``x ^ 2 + y * 3``
+            service: Calculator service providing the operations
+            variables: Parameter order of the function; by default the
+                variables in order of first appearance
+            optimize: Fold constants and simplify the tree first (see
+                ``src.application.optimizer.optimize``); the rewrites are
+                listed in ``rewrites``
+
+        Raises:
+            ExpressionError: If the expression is malformed, a variable is
+                missing from ``variables`` or a name is not usable
+            ValueError: If an operator is not supported
+        """
+        self.source = source
+        self.service = service
+        tree = compile_expression(source)
+        used = expression_variables(tree)
+        if variables is None:
+            variables = used
+        missing = [name for name in used if name not in variables]
+        if missing:
+            raise ExpressionError(f"Unlisted variable(s): {', '.join(missing)}")
+        self.variables: Tuple[str, ...] = tuple(variables)
+        _check_variable_names(self.variables)
+        if len(set(self.variables)) != len(self.variables):
+            raise ExpressionError("Duplicate variable names")
+        self.rewrites: Tuple[Rewrite, ...] = ()
+        if optimize:
+            tree, self.rewrites = optimize_tree(tree, service)
+        self.tree = tree
+
+        generator = _CodeGenerator(service)
+        body = generator.emit(self.tree)
+        self.code = f"def template({', '.join(self.variables)}):\n    return {body}\n"
+        namespace = generator.namespace
+        exec(compile(self.code, f"<template {source!r}>", 'exec'), namespace)
+        self.function: Callable[..., Any] = namespace['template']
+
+    def __call__(self, *args: Any, **bindings: Any) -> Any:
+        """Evaluate for one binding, given positionally or by name."""
+        return self.function(*args, **bindings)
+
+    def evaluate_rows(self, rows: Iterable[Sequence[Any]]) -> List[Any]:
+        """Evaluate for every row of values, ordered like ``variables``."""
+        return list(starmap(self.function, rows))
+
+    def evaluate_columns(self, *columns: Sequence[Any], **named_columns: Sequence[Any]) -> Sequence[Any]:
+        """
+        Evaluate element-wise over columns of bindings with the batch kernels.
+
+        Every binary operation is one ``calculate_many`` call on whole
+        columns, so the per-element work runs in the operations' float64
+        kernels (NumPy-backed when installed).
+
+        Args:
+            columns: One column per variable, ordered like ``variables``
+            named_columns: Columns by variable name
+
+        Returns:
+            A vector like ``calculate_many`` returns
+
+        Raises:
+            ValueError: If a column is missing or the columns differ in length
+        """
+        bound = dict(zip(self.variables, columns))
+        bound.update(named_columns)
+        missing = [name for name in self.variables if name not in bound]
+        if missing:
+            raise ValueError(f"Missing column(s): {', '.join(missing)}")
+        if not self.variables:
+            raise ValueError("A template without variables has no columns to evaluate")
+        lengths = {len(bound[name]) for name in self.variables}
+        if len(lengths) != 1:
+            raise ValueError("Columns must have the same length")
+        size = lengths.pop()
+        is_column, value = self._vector(self.tree, bound, size)
+        return value if is_column else self._full(value, size)
+
+    def _vector(self, node: Node, columns: Mapping[str, Sequence[Any]], size: int) -> Tuple[bool, Any]:
+        """Return ``(True, column)`` or ``(False, scalar)`` for a subtree."""
+        if isinstance(node, NumberNode):
+            return False, node.value
+        if isinstance(node, VariableNode):
+            return True, columns[node.name]
+        if isinstance(node, NegateNode):
+            is_column, value = self._vector(node.operand, columns, size)
+            if not is_column:
+                return False, -value
+            if np is not None and isinstance(value, np.ndarray):
+                return True, -value
+            if isinstance(value, array):
+                return True, array(value.typecode, map(operators.neg, value))
+            return True, [-item for item in value]
+        left_column, left = self._vector(node.left, columns, size)
+        right_column, right = self._vector(node.right, columns, size)
+        if not (left_column or right_column):
+            return False, self.service.calculate(left, node.operator, right)
+        if not left_column:
+            left = self._full(left, size)
+        if not right_column:
+            right = self._full(right, size)
+        return True, self.service.calculate_many(left, node.operator, right)
+
+    def _full(self, value: Any, size: int) -> Sequence[Any]:
+        """Broadcast a constant to a column."""
+        numeric = self.service.numeric
+        if numeric is not None and numeric.name != 'float':
+            return [value] * size
+        if np is not None:
+            return np.full(size, value, dtype=np.float64)
+        return array('d', [value]) * size
+
+    def __repr__(self) -> str:
+        return f"ExpressionTemplate({self.source!r}, variables={self.variables!r})"
+
+
+def compile_template(
+    source: str,
+    service: CalculatorService,
+    variables: Optional[Sequence[str]] = None,
+    optimize: bool = True,
+) -> ExpressionTemplate:
+    """
+    Compile (or fetch from cache) a template for ``service``.
+
+    Templates are cached by the service (see ``CalculatorService.compiled``)
+    and recompiled after its registry changes (e.g. ``add_operation``).
+
+    Args:
+        source: Expression text with named variables
+        service: Calculator service providing the operations
+        variables: Parameter order; by default order of first appearance
+        optimize: Fold constants and simplify the tree before generating code
+
+    Returns:
+        The compiled template
+
+    Raises:
+        ExpressionError: If the expression or a variable name is invalid
+        ValueError: If an operator is not supported
+    """
+    key = ('template', source, tuple(variables) if variables is not None else None, optimize)
+    return service.compiled(key, lambda: ExpressionTemplate(source, service, variables, optimize))
@@ -0,0 +1,159 @@
+"""
+Application Layer: Bulk numeric tokenizer.
+One regular expression scans a whole buffer of expressions (``str`` or
+UTF-8 ``bytes``) in a single pass. Numbers come out already converted to
+``int`` or ``float`` and operators, names and parentheses as ``str``, so
+tokens can be handed straight to the service or the expression parser.
+"""
+
+import re
+from typing import Dict, Iterator, List, Pattern, Tuple, Union
+
+Token = Union[int, float, str]
+Buffer = Union[str, bytes]
+
+# Group numbers of the token pattern; match.lastindex selects the kind
+_FLOAT, _INT, _SPECIAL, _NAME, _NEWLINE, _SYMBOL = range(1, 7)
+
+_SPECIAL_VALUES = {'inf': float('inf'), 'infinity': float('inf'), 'nan': float('nan')}
+
+
+def _number_source(separator: str) -> str:
+    """Return the float, int and special-value groups for a decimal ``separator``."""
+    point = re.escape(separator)
+    exponent = r'[eE][+-]?\d+'
+    return (
+        rf'(\d+{point}\d*(?:{exponent})?|{point}\d+(?:{exponent})?|\d+{exponent})'  # float
+        r'|(\d+)'  # int
+        r'|((?i:inf(?:inity)?|nan)(?!\w))'  # inf and nan
+    )
+
+
+def _token_source(separator: str, binary: bool) -> str:
+    # In bytes, a multi-byte UTF-8 character is kept together as one symbol
+    symbol = r'[\xc0-\xff][\x80-\xbf]*|\S' if binary else r'\S'
+    return (
+        r'[ \t\r\f\v]*(?:'
+        + _number_source(separator)
+        + r'|([A-Za-z_]\w*)'  # name
+        r'|(\n)'  # end of line
+        rf'|({symbol}))'  # operator or parenthesis
+    )
+
+
+_PATTERNS: Dict[Tuple[str, bool], Pattern] = {
+    (separator, binary): re.compile(
+        _token_source(separator, binary).encode('latin-1') if binary else _token_source(separator, binary)
+    )
+    for separator in ('.', ',')
+    for binary in (False, True)
+}
+# A single signed number; group 1 is the sign, so number groups are shifted by one
+_NUMBER_PATTERNS: Dict[str, Pattern] = {
+    separator: re.compile(r'\s*([+-]?)(?:' + _number_source(separator) + r')\s*')
+    for separator in ('.', ',')
+}
+
+
+def _to_float(text: Buffer, decimal_comma: bool) -> float:
+    if decimal_comma:
+        text = text.replace(b',', b'.') if isinstance(text, bytes) else text.replace(',', '.')
+    return float(text)
+
+
+def parse_number(value: str, decimal_comma: bool = False) -> Union[int, float]:
+    """
+    Parse one number, optionally signed and surrounded by whitespace.
+
+    Accepts integers, decimals (``1.5``, ``.5``, ``2.``), exponents
+    (``1e5``, ``2.5E-3``) and ``inf``/``infinity``/``nan`` in any case.
+
+    Args:
+        value: Text of the number
+        decimal_comma: Use ``,`` instead of ``.`` as the decimal separator
+
+    Returns:
+        An ``int`` for integer literals (so powers and roots stay exact),
+        otherwise a ``float``
+
+    Raises:
+        ValueError: If the text is not a single number
+    """
+    # Fast paths for the common cases; everything float() accepts here also
+    # matches the pattern below
+    if value.isdigit() and value.isascii():
+        return int(value)
+    if not decimal_comma and '.' in value and value.isascii() and '_' not in value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    match = _NUMBER_PATTERNS[',' if decimal_comma else '.'].fullmatch(value)
+    if match is None:
+        raise ValueError(f"'{value}' is not a valid number")
+    number = _number(match, decimal_comma, offset=1)
+    return -number if match.group(1) == '-' else number
+
+
+def _number(match: 're.Match', decimal_comma: bool, offset: int = 0) -> Union[int, float]:
+    """Convert the number group of a token match."""
+    kind = match.lastindex - offset
+    text = match.group(match.lastindex)
+    if kind == _INT:
+        return int(text)
+    if kind == _FLOAT:
+        return _to_float(text, decimal_comma)
+    if isinstance(text, bytes):
+        text = text.decode('ascii')
+    return _SPECIAL_VALUES[text.lower()]
+
+
+def scan(buffer: Buffer, decimal_comma: bool = False) -> Iterator[List[Token]]:
+    """
+    Tokenize a buffer of newline-separated expressions in one pass.
+
+    Yields one token list per line, in order (an empty list for a blank
+    line). A final line without a trailing newline is yielded as well.
+    Numbers are ``int`` or ``float``; everything else is a ``str``
+    (``bytes`` input is decoded as UTF-8).
+
+    Args:
+        buffer: Text or UTF-8 bytes holding one expression per line
+        decimal_comma: Use ``,`` instead of ``.`` as the decimal separator
+
+    Yields:
+        The tokens of each line
+    """
+    binary = isinstance(buffer, bytes)
+    pattern = _PATTERNS[(',' if decimal_comma else '.', binary)]
+    names: Dict[Buffer, str] = {}  # decoded operators and names, for bytes input
+    line: List[Token] = []
+    append = line.append
+    for match in pattern.finditer(buffer):
+        kind = match.lastindex
+        if kind == _INT:
+            append(int(match.group(_INT)))
+        elif kind == _SYMBOL or kind == _NAME:
+            text = match.group(kind)
+            if binary:
+                decoded = names.get(text)
+                if decoded is None:
+                    decoded = names[text] = text.decode('utf-8', 'replace')
+                text = decoded
+            append(text)
+        elif kind == _NEWLINE:
+            yield line
+            line = []
+            append = line.append
+        else:
+            append(_number(match, decimal_comma))
+    if buffer and not buffer.endswith(b'\n' if binary else '\n'):
+        yield line
+
+
+def tokenize(source: str, decimal_comma: bool = False) -> List[Token]:
+    """Return the tokens of a single expression (newlines are treated as spaces)."""
+    tokens: List[Token] = []
+    for line in scan(source, decimal_comma):
+        tokens.extend(line)
+    return tokens
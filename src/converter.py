@@ -1,35 +1,139 @@
-def wizualizacja_c_to_f(c):
-    f = c_to_f(c)
-
-    print("\n   [ Konwersja ]")
-    print(f"   {c}°C  ─────▶  {f}°F")
-    print("        🔥")
-
-
-
-def c_to_f(c):
-    return (c * 9/5) + 32
-
-def f_to_c(f):
-    return (f - 32) * 5/9
-
-
-def konwerter_temperatur():
-    print("=== Konwerter temperatur ===")
-    print("1. Celsjusz → Fahrenheit")
-    print("2. Fahrenheit → Celsjusz")
-
-    wybor = input("Wybierz opcję: ")
-
-    if wybor == "1":
-        c = float(input("Podaj °C: "))
-        f = c_to_f(c)
-        print(f"{c}°C = {f}°F")
-
-    elif wybor == "2":
-        f = float(input("Podaj °F: "))
-        c = f_to_c(f)
-        print(f"{f}°F = {c}°C")
-
-    else:
-        print("Niepoprawny wybór.")
+import mmap
+import os
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; bulk conversion falls back to array.array
+    np = None
+
+
+# Number of float64 values converted per chunk in the bulk APIs
+CHUNK_ITEMS = 1 << 16
+
+# Each conversion as an affine map: value * scale + offset
+C_TO_F = (9 / 5, 32.0)
+F_TO_C = (5 / 9, -160 / 9)
+
+
+def wizualizacja_c_to_f(c):
+    f = c_to_f(c)
+
+    print("\n   [ Konwersja ]")
+    print(f"   {c}°C  ─────▶  {f}°F")
+    print("        🔥")
+
+
+
+def c_to_f(c):
+    return (c * 9/5) + 32
+
+def f_to_c(f):
+    return (f - 32) * 5/9
+
+
+def _as_float64_view(buffer):
+    view = memoryview(buffer)
+    if view.format != 'd':
+        view = view.cast('B')
+        if view.nbytes % 8:
+            raise ValueError("Buffer size is not a multiple of 8 bytes")
+        view = view.cast('d')
+    return view
+
+
+def convert_buffer(src, dst=None, conversion=C_TO_F, chunk_items=CHUNK_ITEMS):
+    """
+    Convert native-endian float64 values from ``src`` into ``dst`` in chunks.
+
+    ``src`` and ``dst`` may be any buffers (bytes, bytearray, array('d'),
+    mmap, memoryview); without ``dst`` the conversion is done in place.
+    Uses NumPy when available. Returns a float64 memoryview of ``dst``.
+    """
+    scale, offset = conversion
+    src_view = _as_float64_view(src)
+    dst_view = src_view if dst is None else _as_float64_view(dst)
+    if dst_view.readonly:
+        raise ValueError("Destination buffer is read-only")
+    if len(dst_view) != len(src_view):
+        raise ValueError("Source and destination sizes differ")
+
+    for start in range(0, len(src_view), chunk_items):
+        end = min(start + chunk_items, len(src_view))
+        if np is not None:
+            values = np.frombuffer(src_view[start:end], dtype=np.float64)
+            out = np.frombuffer(dst_view[start:end], dtype=np.float64)
+            np.multiply(values, scale, out=out)
+            np.add(out, offset, out=out)
+        else:
+            dst_view[start:end] = array('d', [value * scale + offset for value in src_view[start:end]])
+    return dst_view
+
+
+def c_to_f_buffer(src, dst=None):
+    return convert_buffer(src, dst, C_TO_F)
+
+
+def f_to_c_buffer(src, dst=None):
+    return convert_buffer(src, dst, F_TO_C)
+
+
+def convert_file(src_path, dst_path=None, conversion=C_TO_F, chunk_items=CHUNK_ITEMS):
+    """
+    Convert a binary file of native-endian float64 readings via mmap.
+
+    Without ``dst_path`` the file is rewritten in place; otherwise the
+    output file is created (or truncated) with the same size and mapped as
+    well. Only one chunk of values is touched at a time.
+    """
+    size = os.path.getsize(src_path)
+    if size % 8:
+        raise ValueError("File size is not a multiple of 8 bytes")
+
+    if dst_path is None:
+        if size == 0:
+            return
+        with open(src_path, 'r+b') as f, mmap.mmap(f.fileno(), 0) as mapped:
+            view = memoryview(mapped)
+            try:
+                convert_buffer(view, None, conversion, chunk_items)
+            finally:
+                view.release()
+            mapped.flush()
+        return
+
+    with open(dst_path, 'w+b') as out:
+        out.truncate(size)
+        if size == 0:
+            return
+        with open(src_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as src_map, \
+                mmap.mmap(out.fileno(), 0) as dst_map:
+            src_view, dst_view = memoryview(src_map), memoryview(dst_map)
+            try:
+                convert_buffer(src_view, dst_view, conversion, chunk_items)
+            finally:
+                src_view.release()
+                dst_view.release()
+            dst_map.flush()
+
+
+def konwerter_temperatur():
+    print("=== Konwerter temperatur ===")
+    print("1. Celsjusz → Fahrenheit")
+    print("2. Fahrenheit → Celsjusz")
+
+    wybor = input("Wybierz opcję: ")
+
+    if wybor == "1":
+        c = float(input("Podaj °C: "))
+        f = c_to_f(c)
+        print(f"{c}°C = {f}°F")
+
+    elif wybor == "2":
+        f = float(input("Podaj °F: "))
+        c = f_to_c(f)
+        print(f"{f}°F = {c}°C")
+
+    else:
+        print("Niepoprawny wybór.")
@@ -0,0 +1,380 @@
+"""
+Domain Layer: Numeric backends.
+A backend fixes the number type a calculation runs in (float, Decimal,
+Fraction or int): it coerces operands and provides a kernel for every
+built-in operation.
+"""
+
+import math
+import operator
+from abc import ABC, abstractmethod
+from decimal import Context, Decimal, DecimalException, ROUND_HALF_EVEN
+from fractions import Fraction
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from .operations import (
+    Operation,
+    Addition,
+    Subtraction,
+    Multiplication,
+    Division,
+    Power,
+    Root,
+    integer_nth_root,
+)
+
+Kernel = Callable[[Any, Any], Any]
+
+
+def _check_root_operands(a, b) -> None:
+    """Raise the errors shared by every root kernel."""
+    if b == 0:
+        raise ValueError("Root degree cannot be zero")
+    if a < 0:
+        raise ValueError("Cannot extract root of negative number")
+
+
+def _check_divisor(b) -> None:
+    if b == 0:
+        raise ValueError("Cannot divide by zero")
+
+
+class NumericBackend(ABC):
+    """Number type used by a calculator service, with one kernel per operation."""
+
+    name = ''
+
+    @abstractmethod
+    def coerce(self, value: Any) -> Any:
+        """
+        Convert an operand to the backend's number type.
+
+        Raises:
+            ValueError: If the value cannot be represented
+        """
+
+    @abstractmethod
+    def kernels(self) -> Dict[type, Kernel]:
+        """Return the kernel for each built-in operation class."""
+
+    def kernel(self, operation: Operation) -> Kernel:
+        """
+        Return the callable evaluating ``operation`` in this backend.
+
+        Operations without a dedicated kernel (e.g. user-defined ones) run
+        their own ``execute`` on coerced operands.
+        """
+        return self.kernels().get(type(operation), operation.execute)
+
+    def bind(self, operation: Operation) -> Kernel:
+        """Return a callable that coerces both operands and applies the kernel."""
+        kernel = self.kernel(operation)
+        coerce = self.coerce
+
+        def evaluate(a, b):
+            return kernel(coerce(a), coerce(b))
+        return evaluate
+
+    def execute_many(self, operation: Operation, a_values: Iterable[Any], b_values: Iterable[Any]) -> List[Any]:
+        """
+        Apply ``operation`` element-wise, returning a list of backend numbers.
+
+        Raises:
+            ValueError: If the sequences differ in length
+        """
+        a_values = list(a_values)
+        b_values = list(b_values)
+        if len(a_values) != len(b_values):
+            raise ValueError(f"Operand sequences must have the same length ({len(a_values)} != {len(b_values)})")
+        coerce = self.coerce
+        return list(map(self.kernel(operation), map(coerce, a_values), map(coerce, b_values)))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class FloatBackend(NumericBackend):
+    """Binary floating point; batches use the operations' float64 kernels."""
+
+    name = 'float'
+
+    def __init__(self):
+        self._kernels: Dict[type, Kernel] = {
+            Addition: operator.add,
+            Subtraction: operator.sub,
+            Multiplication: operator.mul,
+            Division: Division().execute,
+            Power: self._power,
+            Root: Root().execute,
+        }
+
+    def coerce(self, value: Any) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"Not a number: {value!r}") from None
+
+    def kernels(self) -> Dict[type, Kernel]:
+        return self._kernels
+
+    def execute_many(self, operation: Operation, a_values: Iterable[Any], b_values: Iterable[Any]):
+        """Use the operation's vectorized float64 kernel."""
+        return operation.execute_many(a_values, b_values)
+
+    @staticmethod
+    def _power(a: float, b: float) -> float:
+        try:
+            return math.pow(a, b)
+        except (OverflowError, ValueError) as e:
+            raise ValueError(f"Invalid power operands: {e}") from None
+
+
+class DecimalBackend(NumericBackend):
+    """
+    Decimal floating point with a fixed precision and rounding.
+
+    The ``decimal.Context`` is created once and every kernel calls its
+    methods directly, so no per-call context switching takes place.
+    """
+
+    name = 'decimal'
+
+    def __init__(self, precision: int = 28, rounding: str = ROUND_HALF_EVEN):
+        """
+        Initialize the backend.
+
+        Args:
+            precision: Significant digits kept by every result
+            rounding: A ``decimal`` rounding mode
+        """
+        self.context = Context(prec=precision, rounding=rounding)
+        # Root estimates are computed with guard digits and then rounded once
+        self._wide_context = Context(prec=precision + 10, rounding=rounding)
+        self._kernels: Dict[type, Kernel] = {
+            Addition: self._add,
+            Subtraction: self._subtract,
+            Multiplication: self._multiply,
+            Division: self._divide,
+            Power: self._power,
+            Root: self._root,
+        }
+
+    def coerce(self, value: Any) -> Decimal:
+        """Convert exactly; floats are read as the decimal they print as (0.1 -> Decimal('0.1'))."""
+        if isinstance(value, Decimal):
+            return value
+        if isinstance(value, float):
+            value = repr(value)
+        elif isinstance(value, Fraction):
+            return self.context.divide(Decimal(value.numerator), Decimal(value.denominator))
+        try:
+            result = Decimal(value)
+        except (TypeError, ValueError, DecimalException):
+            raise ValueError(f"Not a number: {value!r}") from None
+        if not result.is_finite():
+            raise ValueError(f"Not a finite number: {value!r}")
+        return result
+
+    def kernels(self) -> Dict[type, Kernel]:
+        return self._kernels
+
+    # Context methods signal overflow and invalid operations with
+    # DecimalException (an ArithmeticError); kernels raise ValueError
+    def _add(self, a: Decimal, b: Decimal) -> Decimal:
+        try:
+            return self.context.add(a, b)
+        except DecimalException as e:
+            raise ValueError(f"Invalid addition operands: {type(e).__name__}") from None
+
+    def _subtract(self, a: Decimal, b: Decimal) -> Decimal:
+        try:
+            return self.context.subtract(a, b)
+        except DecimalException as e:
+            raise ValueError(f"Invalid subtraction operands: {type(e).__name__}") from None
+
+    def _multiply(self, a: Decimal, b: Decimal) -> Decimal:
+        try:
+            return self.context.multiply(a, b)
+        except DecimalException as e:
+            raise ValueError(f"Invalid multiplication operands: {type(e).__name__}") from None
+
+    def _divide(self, a: Decimal, b: Decimal) -> Decimal:
+        _check_divisor(b)
+        try:
+            return self.context.divide(a, b)
+        except DecimalException as e:
+            raise ValueError(f"Invalid division operands: {type(e).__name__}") from None
+
+    def _power(self, a: Decimal, b: Decimal) -> Decimal:
+        try:
+            return self.context.power(a, b)
+        except DecimalException as e:
+            raise ValueError(f"Invalid power operands: {type(e).__name__}") from None
+
+    def _root(self, a: Decimal, b: Decimal) -> Decimal:
+        _check_root_operands(a, b)
+        if b == b.to_integral_value() and b > 0:
+            degree = int(b)
+            if a == a.to_integral_value():
+                root = integer_nth_root(int(a), degree)
+                if root ** degree == a:
+                    return self.context.plus(Decimal(root))
+            if degree == 2:
+                return self.context.sqrt(a)
+        wide = self._wide_context
+        try:
+            return self.context.plus(wide.power(a, wide.divide(1, b)))
+        except DecimalException as e:
+            raise ValueError(f"Invalid root operands: {type(e).__name__}") from None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'precision': self.context.prec, 'rounding': self.context.rounding}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state['precision'], state['rounding'])
+
+    def __repr__(self) -> str:
+        return f"DecimalBackend(precision={self.context.prec}, rounding={self.context.rounding!r})"
+
+
+def _rational_root(a: Fraction, n: int) -> Fraction:
+    """
+    Return the exact n-th root of a non-negative fraction.
+
+    Raises:
+        ValueError: If the root is irrational
+    """
+    numerator = integer_nth_root(a.numerator, n)
+    denominator = integer_nth_root(a.denominator, n)
+    if numerator ** n != a.numerator or denominator ** n != a.denominator:
+        raise ValueError(f"Root of {a} is not rational")
+    return Fraction(numerator, denominator)
+
+
+class FractionBackend(NumericBackend):
+    """Exact rational arithmetic; powers and roots must have rational results."""
+
+    name = 'fraction'
+
+    def __init__(self):
+        self._kernels: Dict[type, Kernel] = {
+            Addition: operator.add,
+            Subtraction: operator.sub,
+            Multiplication: operator.mul,
+            Division: self._divide,
+            Power: self._power,
+            Root: self._root,
+        }
+
+    def coerce(self, value: Any) -> Fraction:
+        """Convert exactly; floats are read as the decimal they print as (0.1 -> 1/10)."""
+        if isinstance(value, Fraction):
+            return value
+        try:
+            if isinstance(value, float):
+                value = repr(value)
+            return Fraction(value)
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"Not a number: {value!r}") from None
+
+    def kernels(self) -> Dict[type, Kernel]:
+        return self._kernels
+
+    @staticmethod
+    def _divide(a: Fraction, b: Fraction) -> Fraction:
+        _check_divisor(b)
+        return a / b
+
+    @staticmethod
+    def _power(a: Fraction, b: Fraction) -> Fraction:
+        if a == 0 and b < 0:
+            raise ValueError("Cannot raise zero to a negative power")
+        if b.denominator == 1:
+            return a ** b.numerator
+        if a < 0:
+            raise ValueError("Cannot raise negative number to a fractional power")
+        return _rational_root(a, b.denominator) ** b.numerator
+
+    @classmethod
+    def _root(cls, a: Fraction, b: Fraction) -> Fraction:
+        _check_root_operands(a, b)
+        return cls._power(a, 1 / b)
+
+
+class IntBackend(NumericBackend):
+    """Arbitrary-precision integers; division and roots round down."""
+
+    name = 'int'
+
+    def __init__(self):
+        self._kernels: Dict[type, Kernel] = {
+            Addition: operator.add,
+            Subtraction: operator.sub,
+            Multiplication: operator.mul,
+            Division: self._divide,
+            Power: self._power,
+            Root: self._root,
+        }
+
+    def coerce(self, value: Any) -> int:
+        """Convert integral values (including ``2.0`` and ``'42'``) to int."""
+        if isinstance(value, int):
+            return value
+        try:
+            if isinstance(value, str):
+                return int(value)
+            if value == int(value):
+                return int(value)
+        except (TypeError, ValueError, OverflowError):
+            pass
+        raise ValueError(f"Not an integer: {value!r}")
+
+    def kernels(self) -> Dict[type, Kernel]:
+        return self._kernels
+
+    @staticmethod
+    def _divide(a: int, b: int) -> int:
+        _check_divisor(b)
+        return a // b
+
+    @staticmethod
+    def _power(a: int, b: int) -> int:
+        if b < 0:
+            raise ValueError("Integer power requires a non-negative exponent")
+        return a ** b
+
+    @staticmethod
+    def _root(a: int, b: int) -> int:
+        _check_root_operands(a, b)
+        if b < 0:
+            raise ValueError("Root degree must be a positive integer")
+        return integer_nth_root(a, b)
+
+
+_BACKEND_TYPES = {
+    backend.name: backend
+    for backend in (FloatBackend, DecimalBackend, FractionBackend, IntBackend)
+}
+_shared_backends: Dict[str, NumericBackend] = {}
+
+
+def get_numeric_backend(numeric: Union[str, NumericBackend, None]) -> Optional[NumericBackend]:
+    """
+    Resolve a backend name ('float', 'decimal', 'fraction', 'int') or instance.
+
+    Named backends are created once and shared, so e.g. the default Decimal
+    context is built a single time per process.
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if numeric is None or isinstance(numeric, NumericBackend):
+        return numeric
+    backend = _shared_backends.get(numeric)
+    if backend is None:
+        try:
+            backend = _BACKEND_TYPES[numeric]()
+        except KeyError:
+            raise ValueError(f"Unknown numeric backend: {numeric}. Available: {', '.join(_BACKEND_TYPES)}") from None
+        _shared_backends[numeric] = backend
+    return backend
@@ -3,13 +3,134 @@ Domain Layer: Core business logic for calculator operations.
 This layer contains the fundamental calculator operations without any dependencies.
 """
 
+import math
+import operator
 from abc import ABC, abstractmethod
-from typing import Union
+from array import array
+from typing import Dict, Iterable, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch kernels fall back to array.array
+    np = None
+
+
+Vector = Sequence[float]
+
+
+def _is_float64(values: Iterable[float]) -> bool:
+    """True for an ``array('d')`` or a one-dimensional float64 memoryview, used without copying."""
+    if isinstance(values, array):
+        return values.typecode == 'd'
+    return isinstance(values, memoryview) and values.format == 'd' and values.ndim == 1
+
+
+def _as_vectors(a_values: Iterable[float], b_values: Iterable[float]) -> Tuple[Vector, Vector]:
+    """
+    Convert two operand sequences to float64 vectors of equal length.
+
+    With NumPy installed the result is a pair of ``ndarray`` objects (no copy is
+    made for float64 buffers); otherwise it is a pair of ``array('d')`` objects,
+    or the operands themselves if they already are ``array('d')`` objects or
+    float64 memoryviews.
+
+    Raises:
+        ValueError: If the sequences differ in length
+    """
+    if np is not None:
+        a_vector = np.asarray(a_values, dtype=np.float64)
+        b_vector = np.asarray(b_values, dtype=np.float64)
+    else:
+        a_vector = a_values if _is_float64(a_values) else array('d', a_values)
+        b_vector = b_values if _is_float64(b_values) else array('d', b_values)
+    if len(a_vector) != len(b_vector):
+        raise ValueError(f"Operand sequences must have the same length ({len(a_vector)} != {len(b_vector)})")
+    return a_vector, b_vector
+
+
+def integer_nth_root(a: int, n: int) -> int:
+    """
+    Return ``floor(a ** (1 / n))`` computed exactly with integer arithmetic.
+    
+    Uses ``math.isqrt`` for square roots and Newton iteration seeded from a
+    floating-point estimate otherwise.
+    
+    Raises:
+        ValueError: If ``a`` is negative or ``n`` is not positive
+    """
+    if a < 0:
+        raise ValueError("Cannot extract root of negative number")
+    if n < 1:
+        raise ValueError("Root degree must be a positive integer")
+    if n == 1 or a < 2:
+        return a
+    if n == 2:
+        return math.isqrt(a)
+    if n >= a.bit_length():
+        return 1
+
+    exponent = math.log2(a) / n
+    if exponent < 1000:
+        x = int(2.0 ** exponent)
+    else:
+        whole = int(exponent)
+        x = int(2.0 ** (exponent - whole) * (1 << 52)) << (whole - 52)
+
+    # One Newton step from any positive start lands on or above the root;
+    # from there the iteration decreases monotonically to the floor.
+    x = ((n - 1) * x + a // x ** (n - 1)) // n
+    while True:
+        y = ((n - 1) * x + a // x ** (n - 1)) // n
+        if y >= x:
+            return x
+        x = y
+
+
+def _root_of_integer(a: int, n: int) -> Union[int, float]:
+    """
+    Return the n-th root of a non-negative integer.
+    
+    Perfect powers give an exact ``int``; other values give the correctly
+    rounded ``float``, except for degrees so large that rounding exactly
+    would need more than ``_MAX_SCALED_ROOT_BITS`` extra bits, which fall
+    back to floating point.
+    
+    Raises:
+        OverflowError: If an inexact root is too large for a float
+    """
+    if n >= a.bit_length():
+        # The root is 0, 1 (both exact) or lies strictly between 1 and 2
+        return a if a < 2 else _float_root(a, n)
+    root = integer_nth_root(a, n)
+    if root ** n == a:
+        return root
+    # The root is irrational, so it lies strictly between scaled and
+    # scaled + 1. With at least 55 bits, scaled + 1/2 rounds the same way.
+    shift = max(0, 55 - root.bit_length())
+    if n * shift > _MAX_SCALED_ROOT_BITS:
+        return _float_root(a, n)
+    scaled = integer_nth_root(a << (n * shift), n) if shift else root
+    return (2 * scaled + 1) / (1 << (shift + 1))
+
+
+# Largest scaling (in bits) used to round an inexact integer root exactly;
+# the cost of the exact path grows with it
+_MAX_SCALED_ROOT_BITS = 1 << 14
+
+
+def _float_root(a: int, n: int) -> float:
+    """Floating-point n-th root of a non-negative integer, also for integers beyond the float range."""
+    try:
+        return a ** (1 / n)
+    except OverflowError:
+        return 2.0 ** (math.log2(a) / n)
 
 
 class Operation(ABC):
     """Abstract base class for all calculator operations."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def execute(self, a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         """Execute the operation on two numbers."""
@@ -20,9 +141,46 @@ class Operation(ABC):
         """Return the symbol representing this operation."""
         pass
 
+    def execute_many(self, a_values: Iterable[float], b_values: Iterable[float]) -> Vector:
+        """
+        Execute the operation element-wise over two operand sequences.
+
+        Operands are processed as float64. Subclasses override this with a
+        dedicated kernel; the default applies ``execute`` to every pair.
+
+        Returns:
+            A NumPy ``ndarray`` when NumPy is installed, otherwise ``array('d')``
+        """
+        a_vector, b_vector = _as_vectors(a_values, b_values)
+        if np is not None:
+            results = map(self.execute, a_vector.tolist(), b_vector.tolist())
+            return np.fromiter(results, dtype=np.float64, count=len(a_vector))
+        return array('d', map(self.execute, a_vector, b_vector))
 
-class Addition(Operation):
+
+class StatelessOperation(Operation):
+    """
+    Base class for operations without per-instance state.
+    
+    Instances are flyweights: every instantiation of a subclass returns the
+    same shared object.
+    """
+    
+    __slots__ = ()
+    _instances: Dict[type, 'StatelessOperation'] = {}
+    
+    def __new__(cls):
+        instance = StatelessOperation._instances.get(cls)
+        if instance is None:
+            instance = super().__new__(cls)
+            StatelessOperation._instances[cls] = instance
+        return instance
+
+
+class Addition(StatelessOperation):
     """Addition operation."""
+
+    __slots__ = ()
     
     def execute(self, a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         return a + b  # tu była zmianka na minusika
@@ -30,9 +188,17 @@ class Addition(Operation):
     def symbol(self) -> str:
         return "+"
 
+    def execute_many(self, a_values: Iterable[float], b_values: Iterable[float]) -> Vector:
+        a_vector, b_vector = _as_vectors(a_values, b_values)
+        if np is not None:
+            return np.add(a_vector, b_vector)
+        return array('d', map(operator.add, a_vector, b_vector))
 
-class Subtraction(Operation):
+
+class Subtraction(StatelessOperation):
     """Subtraction operation."""
+
+    __slots__ = ()
     
     def execute(self, a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         return a - b
@@ -40,9 +206,17 @@ class Subtraction(Operation):
     def symbol(self) -> str:
         return "-"
 
+    def execute_many(self, a_values: Iterable[float], b_values: Iterable[float]) -> Vector:
+        a_vector, b_vector = _as_vectors(a_values, b_values)
+        if np is not None:
+            return np.subtract(a_vector, b_vector)
+        return array('d', map(operator.sub, a_vector, b_vector))
+
 
-class Multiplication(Operation):
+class Multiplication(StatelessOperation):
     """Multiplication operation."""
+
+    __slots__ = ()
     
     def execute(self, a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         return a * b
@@ -50,9 +224,17 @@ class Multiplication(Operation):
     def symbol(self) -> str:
         return "*"
 
+    def execute_many(self, a_values: Iterable[float], b_values: Iterable[float]) -> Vector:
+        a_vector, b_vector = _as_vectors(a_values, b_values)
+        if np is not None:
+            return np.multiply(a_vector, b_vector)
+        return array('d', map(operator.mul, a_vector, b_vector))
+
 
-class Division(Operation):
+class Division(StatelessOperation):
     """Division operation."""
+
+    __slots__ = ()
     
     def execute(self, a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         if b == 0:
@@ -62,26 +244,129 @@ class Division(Operation):
     def symbol(self) -> str:
         return "/"
 
+    def execute_many(self, a_values: Iterable[float], b_values: Iterable[float]) -> Vector:
+        a_vector, b_vector = _as_vectors(a_values, b_values)
+        if np is not None:
+            if not b_vector.all():
+                raise ValueError("Cannot divide by zero")
+            return np.divide(a_vector, b_vector)
+        if 0 in b_vector:
+            raise ValueError("Cannot divide by zero")
+        return array('d', map(operator.truediv, a_vector, b_vector))
+
 
-class Power(Operation):
+class Power(StatelessOperation):
     """Exponentiation operation."""
 
+    __slots__ = ()
+
     def execute(self, a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         return a ** b
 
     def symbol(self) -> str:
         return "^"
 
+    def execute_many(self, a_values: Iterable[float], b_values: Iterable[float]) -> Vector:
+        a_vector, b_vector = _as_vectors(a_values, b_values)
+        try:
+            if np is not None:
+                with np.errstate(over='raise', invalid='raise', divide='raise'):
+                    return np.power(a_vector, b_vector)
+            return array('d', map(math.pow, a_vector, b_vector))
+        except (ArithmeticError, ValueError) as e:
+            raise ValueError(f"Invalid power operands: {e}") from None
 
-class Root(Operation):
+
+class Root(StatelessOperation):
     """Root extraction operation (nth root)."""
 
+    __slots__ = ()
+
     def execute(self, a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
         if b == 0:
             raise ValueError("Root degree cannot be zero")
         if a < 0:
             raise ValueError("Cannot extract root of negative number")
-        return a ** (1 / b)
+        if isinstance(b, float) and b.is_integer():
+            b = int(b)
+        try:
+            if isinstance(b, int) and b > 0:
+                if isinstance(a, int):
+                    return _root_of_integer(a, b)
+                if isinstance(a, float) and a.is_integer():
+                    return float(_root_of_integer(int(a), b))
+            return a ** (1 / b)
+        except OverflowError as e:
+            raise ValueError(f"Invalid root operands: {e}") from None
 
     def symbol(self) -> str:
         return "root"
+
+    def execute_many(self, a_values: Iterable[float], b_values: Iterable[float]) -> Vector:
+        a_vector, b_vector = _as_vectors(a_values, b_values)
+        if np is not None:
+            has_zero_degree = not b_vector.all()
+            has_negative = bool((a_vector < 0).any())
+        else:
+            has_zero_degree = 0 in b_vector
+            has_negative = bool(a_vector) and min(a_vector) < 0
+        if has_zero_degree:
+            raise ValueError("Root degree cannot be zero")
+        if has_negative:
+            raise ValueError("Cannot extract root of negative number")
+        try:
+            if np is not None:
+                with np.errstate(over='raise'):
+                    results = np.power(a_vector, np.reciprocal(b_vector))
+                # pow(a, 1 / b) is off by several ulps because 1 / b is
+                # rounded; sqrt, cbrt and one Newton step are within one ulp
+                squares, cubes = b_vector == 2, b_vector == 3
+                results[squares] = np.sqrt(a_vector[squares])
+                results[cubes] = np.cbrt(a_vector[cubes])
+                refine = np.flatnonzero(~(squares | cubes) & (results > 0) & np.isfinite(results))
+                if len(refine):
+                    roots, values, degrees = results[refine], a_vector[refine], b_vector[refine]
+                    with np.errstate(all='ignore'):
+                        refined = roots + roots * (values / roots ** degrees - 1) / degrees
+                    results[refine] = np.where(np.isfinite(refined), refined, roots)
+                # Integral operands with a positive integer degree need the
+                # exact path only where the float root may miss a perfect
+                # power, or the operand is beyond float's integer precision
+                rounded = np.rint(results)
+                exact = np.flatnonzero(
+                    (b_vector > 0) & (b_vector == np.floor(b_vector))
+                    & np.isfinite(a_vector) & (a_vector == np.floor(a_vector))
+                    & ((np.abs(results - rounded) <= rounded * _PERFECT_POWER_TOLERANCE)
+                       | (a_vector > _FLOAT_INTEGER_LIMIT))
+                )
+                for index in exact.tolist():
+                    results[index] = _root_of_integer(int(a_vector[index]), int(b_vector[index]))
+                return results
+            return array('d', map(_root_of_float, a_vector, b_vector))
+        except (ArithmeticError, ValueError) as e:
+            raise ValueError(f"Invalid root operands: {e}") from None
+
+
+# A float root this close to an integer may be a rounded perfect power
+_PERFECT_POWER_TOLERANCE = 2.0 ** -40
+# Floats above this are not all integers, so their roots are checked exactly
+_FLOAT_INTEGER_LIMIT = 2.0 ** 53
+
+
+def _root_of_float(a: float, b: float) -> float:
+    """Element kernel of ``Root.execute_many`` without NumPy; exact where the float root may miss a perfect power."""
+    if b == 2:
+        result = math.sqrt(a)
+    else:
+        result = math.pow(a, 1.0 / b)
+        if 0 < result < math.inf:
+            # One Newton step: pow(a, 1 / b) is off by several ulps
+            try:
+                result += result * (a / result ** b - 1) / b
+            except (OverflowError, ZeroDivisionError):
+                pass
+    if b > 0 and b.is_integer() and a.is_integer():
+        rounded = round(result)
+        if abs(result - rounded) <= rounded * _PERFECT_POWER_TOLERANCE or a > _FLOAT_INTEGER_LIMIT:
+            return float(_root_of_integer(int(a), int(b)))
+    return result
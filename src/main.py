@@ -1,35 +1,209 @@
 """
 Main entry point for the calculator application.
 This file wires together all the layers and starts the application.
-Supports both CLI and GUI modes.
+Supports CLI, GUI, non-interactive batch, binary batch and server modes.
+
+The GUI (tkinter), the process pool and the asyncio server are imported only
+when their mode is requested, so CLI and batch startup never pay for them.
 """
 
+import argparse
+import functools
 import sys
-from pathlib import Path
-
-# Add project root to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+from typing import Sequence
 
 from src.application.calculator_service import CalculatorService
+from src.application.history_log import HistoryRecorder
+from src.application.plugins import plugin_operations
+from src.domain.operations import Operation
+from src.presentation.batch import CalculatorBatch
 from src.presentation.cli import CalculatorCLI
-from src.presentation.gui import CalculatorGUI
 
 
-def main():
-    """Main function to start the calculator application."""
-    # Check command line arguments for mode selection
-    if len(sys.argv) > 1 and sys.argv[1] == '--gui':
+def parse_arguments(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Simple Calculator")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--gui', action='store_true', help="start the graphical interface")
+    mode.add_argument(
+        '--batch',
+        nargs='?',
+        const='-',
+        metavar='FILE',
+        help="evaluate one expression per line from FILE (or stdin when omitted or '-')",
+    )
+    mode.add_argument(
+        '--binary',
+        nargs=4,
+        metavar=('A', 'OP', 'B', 'OUT'),
+        help="calculate A[i] OP B[i] over binary array files into the new file OUT",
+    )
+    mode.add_argument(
+        '--serve',
+        action='store_true',
+        help="serve newline-delimited JSON requests on TCP localhost or a Unix socket",
+    )
+    parser.add_argument('--host', default='127.0.0.1', help="server host (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8765, help="server TCP port (default: 8765)")
+    parser.add_argument('--socket', metavar='PATH', help="serve on the Unix socket at PATH instead of TCP")
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        metavar='N',
+        help="evaluate a batch FILE with N worker processes (default: 1)",
+    )
+    parser.add_argument(
+        '--decimal-comma',
+        action='store_true',
+        help="in batch mode, read ',' as the decimal separator (1,5 is one and a half)",
+    )
+    parser.add_argument(
+        '--dtype',
+        choices=('float64', 'int64'),
+        default='float64',
+        help="element type of the --binary operand files, little-endian (default: float64)",
+    )
+    parser.add_argument(
+        '--output-dtype',
+        choices=('float64', 'int64'),
+        default='float64',
+        help="element type of the --binary output file (default: float64)",
+    )
+    parser.add_argument(
+        '--numeric',
+        choices=('float', 'decimal', 'fraction', 'int'),
+        help="evaluate in this number type (default: operands as parsed)",
+    )
+    parser.add_argument(
+        '--history',
+        metavar='PATH',
+        help="append every calculation to the binary history log at PATH",
+    )
+    parser.add_argument(
+        '--metrics',
+        action='store_true',
+        help="collect per-operator call counts, errors and latency (shown by ':stats' in the CLI)",
+    )
+    parser.add_argument(
+        '--plugins',
+        action='append',
+        default=[],
+        metavar='DIR',
+        help="also load operation plugins from the .py files in DIR (repeatable)",
+    )
+    parser.add_argument(
+        '--no-plugins',
+        action='store_true',
+        help="do not load operation plugins",
+    )
+    arguments = parser.parse_args(argv)
+    if arguments.workers < 1:
+        parser.error("--workers must be a positive integer")
+    if arguments.workers > 1 and arguments.batch in (None, '-'):
+        parser.error("--workers requires --batch FILE (stdin cannot be split into shards)")
+    if arguments.workers > 1 and arguments.history:
+        parser.error("--history cannot be combined with --workers (shard workers do not record)")
+    return arguments
+
+
+def run_batch(
+    calculator_service: CalculatorService,
+    path: str,
+    workers: int = 1,
+    operations: Sequence[Operation] = (),
+    decimal_comma: bool = False,
+) -> int:
+    """
+    Run batch mode on ``path`` (``-`` for stdin) and return the exit status.
+
+    Input is read as bytes and tokenized in bulk. Worker processes build
+    their own services with the same numeric backend and extra ``operations``.
+    """
+    if workers > 1:
+        from src.presentation.parallel_batch import ParallelCalculatorBatch
+        service_factory = functools.partial(
+            CalculatorService,
+            numeric=calculator_service.numeric,
+            operations=tuple(operations),
+        )
+        batch = ParallelCalculatorBatch(workers, service_factory, decimal_comma=decimal_comma)
+        error_count = batch.run(path, sys.stdout)
+    elif path == '-':
+        source = getattr(sys.stdin, 'buffer', sys.stdin)
+        error_count = CalculatorBatch(calculator_service, decimal_comma=decimal_comma).run(source, sys.stdout)
+    else:
+        with open(path, 'rb') as source:
+            error_count = CalculatorBatch(calculator_service, decimal_comma=decimal_comma).run(source, sys.stdout)
+    return 1 if error_count else 0
+
+
+def run_binary(
+    calculator_service: CalculatorService,
+    files: Sequence[str],
+    dtype: str = 'float64',
+    output_dtype: str = 'float64',
+) -> int:
+    """Run binary batch mode on ``(a_path, operator, b_path, output_path)``; returns the exit status."""
+    from src.presentation.binary_batch import calculate_files
+    a_path, operator, b_path, output_path = files
+    try:
+        calculate_files(calculator_service, a_path, operator, b_path, output_path, dtype, output_dtype)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv=None) -> int:
+    """Main function to start the calculator application; returns the exit status."""
+    arguments = parse_arguments(argv)
+    operations = [] if arguments.no_plugins else plugin_operations(arguments.plugins)
+    history = HistoryRecorder(arguments.history) if arguments.history else None
+    try:
+        calculator_service = CalculatorService(
+            numeric=arguments.numeric,
+            history=history,
+            metrics=arguments.metrics,
+            operations=operations,
+        )
+        return run(calculator_service, arguments, operations)
+    finally:
+        if history is not None:
+            history.close()
+
+
+def run(
+    calculator_service: CalculatorService,
+    arguments: argparse.Namespace,
+    operations: Sequence[Operation] = (),
+) -> int:
+    """Start the mode selected by ``arguments``; returns the exit status."""
+    if arguments.serve:
+        # Start the calculation server
+        import asyncio
+        from src.presentation.server import serve
+        try:
+            asyncio.run(serve(calculator_service, arguments.host, arguments.port, arguments.socket))
+        except KeyboardInterrupt:
+            pass
+    elif arguments.batch is not None:
+        # Start non-interactive batch mode
+        return run_batch(calculator_service, arguments.batch, arguments.workers, operations, arguments.decimal_comma)
+    elif arguments.binary is not None:
+        # Start binary batch mode
+        return run_binary(calculator_service, arguments.binary, arguments.dtype, arguments.output_dtype)
+    elif arguments.gui:
         # Start GUI mode
-        calculator_service = CalculatorService()
+        from src.presentation.gui import CalculatorGUI
         calculator_gui = CalculatorGUI(calculator_service)
         calculator_gui.run()
     else:
         # Start CLI mode (default)
-        calculator_service = CalculatorService()
         calculator_cli = CalculatorCLI(calculator_service)
         calculator_cli.run()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
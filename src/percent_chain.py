@@ -0,0 +1,160 @@
+"""
+Chains of percentage adjustments.
+
+A sequence of raises, discounts and "percent of" steps is a product of
+per-step multipliers, so any chain collapses into one precomputed factor:
+
+    PercentChain().raise_by(10).discount(5).raise_by(3).apply(100)
+
+Applying a 20-step chain costs one multiplication per value, the same as a
+single step. In exact mode the factor is a ``Fraction`` and money amounts are
+computed without binary rounding, then quantized to ``Decimal``.
+"""
+
+from array import array
+from decimal import Decimal, InvalidOperation
+from fractions import Fraction
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from src.converter import convert_buffer
+from src.percent_test import obnizka_procentowa, podwyzka_procentowa, procent_z_liczby
+
+PERCENT_MODES = {
+    'of': procent_z_liczby,
+    'raise': podwyzka_procentowa,
+    'discount': obnizka_procentowa,
+}
+
+Number = Union[int, float, str, Decimal, Fraction]
+Step = Tuple[str, Fraction]
+
+
+def _ratio(value: Number) -> Tuple[int, int]:
+    """
+    Return ``value`` as an exact ``(numerator, denominator)`` pair.
+
+    Strings and floats are read as the decimal they spell (0.1 -> 1/10).
+
+    Raises:
+        ValueError: If the value is not a finite number
+    """
+    if isinstance(value, (int, Fraction)):
+        return value.numerator, value.denominator
+    try:
+        if not isinstance(value, Decimal):
+            value = Decimal(repr(value) if isinstance(value, float) else value.strip())
+        return value.as_integer_ratio()
+    except (InvalidOperation, OverflowError):
+        raise ValueError(f"Not a finite number: {value!r}") from None
+
+
+def _exact(value: Number) -> Fraction:
+    """Convert to a Fraction, reading floats as the decimal they print as."""
+    return Fraction(*_ratio(value))
+
+
+class PercentChain:
+    """Immutable sequence of percentage steps folded into one multiplier."""
+
+    __slots__ = ('_steps', '_exact_factor', '_factor', 'exact')
+
+    def __init__(self, steps: Iterable[Tuple[str, Number]] = (), exact: bool = False):
+        """
+        Initialize a chain.
+
+        Args:
+            steps: ``(mode, percent)`` pairs; modes are 'of', 'raise' and 'discount'
+            exact: Apply the chain with fractions instead of floats
+
+        Raises:
+            ValueError: If a mode is unknown
+        """
+        parsed: List[Step] = []
+        factor = Fraction(1)
+        for mode, percent in steps:
+            if mode not in PERCENT_MODES:
+                raise ValueError(f"Unknown mode: {mode}. Supported modes: {', '.join(PERCENT_MODES)}")
+            percent = _exact(percent)
+            parsed.append((mode, percent))
+            # The step formulas are exact when given fractions
+            factor *= PERCENT_MODES[mode](Fraction(1), percent)
+        self._steps: Tuple[Step, ...] = tuple(parsed)
+        self._exact_factor = factor
+        self._factor = float(factor)
+        self.exact = exact
+
+    @property
+    def steps(self) -> Tuple[Step, ...]:
+        """The ``(mode, percent)`` steps, with percents as fractions."""
+        return self._steps
+
+    @property
+    def factor(self) -> Union[float, Fraction]:
+        """The combined multiplier: a Fraction in exact mode, otherwise the nearest float."""
+        return self._exact_factor if self.exact else self._factor
+
+    def then(self, mode: str, percent: Number) -> 'PercentChain':
+        """Return a new chain with one more step."""
+        return PercentChain(self._steps + ((mode, percent),), self.exact)
+
+    def raise_by(self, percent: Number) -> 'PercentChain':
+        """Return a new chain that also raises by ``percent``."""
+        return self.then('raise', percent)
+
+    def discount(self, percent: Number) -> 'PercentChain':
+        """Return a new chain that also discounts by ``percent``."""
+        return self.then('discount', percent)
+
+    def percent_of(self, percent: Number) -> 'PercentChain':
+        """Return a new chain that also takes ``percent`` of the value."""
+        return self.then('of', percent)
+
+    def apply(self, value: Number, digits: Optional[int] = None) -> Union[float, Decimal]:
+        """
+        Apply the whole chain to one value.
+
+        Args:
+            value: The value to adjust
+            digits: Round the result to this many decimal places
+
+        Returns:
+            A float, or in exact mode a Decimal (rounded half-even when
+            ``digits`` is given)
+        """
+        if self.exact:
+            return self._exact_apply(value, digits)
+        result = float(value) * self._factor
+        return result if digits is None else round(result, digits)
+
+    def apply_many(self, values: Sequence[Number], digits: Optional[int] = None) -> Union[array, List[Decimal]]:
+        """
+        Apply the chain to a batch of values.
+
+        Returns:
+            An ``array('d')``, or in exact mode a list of Decimals
+        """
+        if self.exact:
+            return [self._exact_apply(value, digits) for value in values]
+        result = array('d', values)
+        convert_buffer(result, conversion=(self._factor, 0.0))
+        if digits is not None:
+            for i, value in enumerate(result):
+                result[i] = round(value, digits)
+        return result
+
+    def _exact_apply(self, value: Number, digits: Optional[int]) -> Decimal:
+        # Plain integer arithmetic; Fraction objects are several times slower
+        numerator, denominator = _ratio(value)
+        numerator *= self._exact_factor.numerator
+        denominator *= self._exact_factor.denominator
+        if digits is None:
+            return Decimal(numerator) / Decimal(denominator)
+        # Round the exact value half-even, avoiding double rounding via a quotient
+        quotient, remainder = divmod(numerator * 10 ** digits, denominator)
+        if 2 * remainder > denominator or (2 * remainder == denominator and quotient & 1):
+            quotient += 1
+        return Decimal(quotient).scaleb(-digits)
+
+    def __repr__(self) -> str:
+        steps = ', '.join(f"{mode} {percent}%" for mode, percent in self._steps)
+        return f"PercentChain([{steps}], exact={self.exact})"
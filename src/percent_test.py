@@ -1,31 +1,41 @@
-def procent_z_liczby():
-    liczba = float(input("Podaj liczbę: "))
-    procent = float(input("Podaj procent (1–100): "))
-
-    wynik = liczba * (procent / 100)
-
-    print(f"{procent}% z {liczba} = {wynik}")
-
-procent_z_liczby()
-if __name__ == "__main__":
-    procent_z_liczby()
-    
-    
-    
-def podwyzka_procentowa():
-    liczba = float(input("Podaj liczbę: "))
-    procent = float(input("Podaj procent podwyżki: "))
-
-    wynik = liczba * (1 + procent / 100)
-
-    print(f"Po podwyżce o {procent}%: {wynik}")
-
-
-
-def obnizka_procentowa():
-    liczba = float(input("Podaj liczbę: "))
-    procent = float(input("Podaj procent obniżki: "))
-
-    wynik = liczba * (1 - procent / 100)
-
-    print(f"Po obniżce o {procent}%: {wynik}")
+def procent_z_liczby(liczba, procent):
+    return liczba * (procent / 100)
+
+
+def podwyzka_procentowa(liczba, procent):
+    return liczba * (1 + procent / 100)
+
+
+def obnizka_procentowa(liczba, procent):
+    return liczba * (1 - procent / 100)
+
+
+def procent_z_liczby_interaktywnie():
+    liczba = float(input("Podaj liczbę: "))
+    procent = float(input("Podaj procent (1–100): "))
+
+    wynik = procent_z_liczby(liczba, procent)
+
+    print(f"{procent}% z {liczba} = {wynik}")
+
+
+def podwyzka_procentowa_interaktywnie():
+    liczba = float(input("Podaj liczbę: "))
+    procent = float(input("Podaj procent podwyżki: "))
+
+    wynik = podwyzka_procentowa(liczba, procent)
+
+    print(f"Po podwyżce o {procent}%: {wynik}")
+
+
+def obnizka_procentowa_interaktywnie():
+    liczba = float(input("Podaj liczbę: "))
+    procent = float(input("Podaj procent obniżki: "))
+
+    wynik = obnizka_procentowa(liczba, procent)
+
+    print(f"Po obniżce o {procent}%: {wynik}")
+
+
+if __name__ == "__main__":
+    procent_z_liczby_interaktywnie()
@@ -1,6 +1,18 @@
-"""Presentation layer package."""
+"""
+Presentation layer package.
 
+``CalculatorGUI`` is resolved lazily so importing the package (for the CLI or
+batch interfaces) does not import tkinter.
+"""
+
+from .batch import CalculatorBatch
 from .cli import CalculatorCLI
-from .gui import CalculatorGUI
 
-__all__ = ['CalculatorCLI', 'CalculatorGUI']
+__all__ = ['CalculatorBatch', 'CalculatorCLI', 'CalculatorGUI']
+
+
+def __getattr__(name):
+    if name == 'CalculatorGUI':
+        from .gui import CalculatorGUI
+        return CalculatorGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
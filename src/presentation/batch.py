@@ -0,0 +1,148 @@
+"""
+Presentation Layer: Non-interactive batch interface for the calculator.
+Input is read in large blocks that the bulk tokenizer scans in one pass;
+results are written in buffered chunks, so memory use stays constant
+regardless of input size.
+"""
+
+from itertools import islice
+from typing import IO, Iterable, Iterator, List, TextIO, Union
+
+from src.application.calculator_service import CalculatorService
+from src.application.expression import parse_tokens
+from src.application.tokenizer import Token, scan, tokenize
+
+_PARENTHESES = ('(', ')')
+
+
+class CalculatorBatch:
+    """Batch interface evaluating one expression per input line."""
+
+    def __init__(
+        self,
+        calculator_service: CalculatorService,
+        chunk_size: int = 4096,
+        decimal_comma: bool = False,
+        block_size: int = 1024 * 1024,
+    ):
+        """
+        Initialize the batch interface with a calculator service.
+
+        Args:
+            calculator_service: The calculator service to use
+            chunk_size: Number of result lines written per output chunk
+            decimal_comma: Read ``1,5`` as one and a half
+            block_size: Number of characters (or bytes) read and tokenized at once
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive")
+        if block_size < 1:
+            raise ValueError("Block size must be positive")
+        self.calculator_service = calculator_service
+        self.chunk_size = chunk_size
+        self.decimal_comma = decimal_comma
+        self.block_size = block_size
+        self.error_count = 0
+
+    def run(self, source: IO, output: TextIO) -> int:
+        """
+        Evaluate every line of ``source`` and write one result line per input line.
+
+        Blank input lines produce blank output lines so results stay aligned
+        with the input; failing lines produce ``Error: <message>``.
+
+        Args:
+            source: Text or binary (UTF-8) stream with one expression per line
+            output: Text stream receiving the results
+
+        Returns:
+            Number of lines that failed to evaluate
+        """
+        self.error_count = 0
+        results = (line for block in self._blocks(source) for line in self.evaluate_buffer(block))
+        for chunk in self._chunks(results):
+            output.write(''.join(chunk))
+        output.flush()
+        return self.error_count
+
+    def evaluate_buffer(self, buffer: Union[str, bytes]) -> Iterator[str]:
+        """
+        Evaluate a buffer of newline-separated expressions.
+
+        The whole buffer is tokenized in one pass. Lines of the form
+        ``number operator number`` go straight to the service; other lines
+        are parsed from their tokens.
+
+        Args:
+            buffer: Text or UTF-8 bytes
+
+        Yields:
+            The formatted result (or error) for each line
+        """
+        calculate = self.calculator_service.calculate
+        for tokens in scan(buffer, self.decimal_comma):
+            if len(tokens) == 3:
+                a, operator, b = tokens
+                if (
+                    isinstance(operator, str)
+                    and not isinstance(a, str)
+                    and not isinstance(b, str)
+                    and operator not in _PARENTHESES
+                ):
+                    try:
+                        # Formatting can fail too (an int over Python's digit limit)
+                        line = f"{calculate(a, operator, b)}\n"
+                    except Exception as e:
+                        self.error_count += 1
+                        line = f"Error: {e}\n"
+                    yield line
+                    continue
+            yield self._evaluate_tokens(tokens) if tokens else '\n'
+
+    def evaluate_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Lazily evaluate expressions, yielding newline-terminated result lines.
+
+        Args:
+            lines: Iterable of expression lines
+
+        Yields:
+            The formatted result (or error) for each line
+        """
+        for line in lines:
+            tokens = tokenize(line, self.decimal_comma)
+            if not tokens:
+                yield '\n'
+                continue
+            yield self._evaluate_tokens(tokens)
+
+    def _evaluate_tokens(self, tokens: List[Token]) -> str:
+        try:
+            return f"{parse_tokens(tokens).evaluate(self.calculator_service)}\n"
+        except Exception as e:
+            self.error_count += 1
+            return f"Error: {e}\n"
+
+    def _blocks(self, source: IO) -> Iterator[Union[str, bytes]]:
+        """Read ``source`` in blocks that end at a line boundary."""
+        remainder = None
+        while True:
+            block = source.read(self.block_size)
+            if not block:
+                break
+            if remainder:
+                block = remainder + block
+            cut = block.rfind(b'\n' if isinstance(block, bytes) else '\n') + 1
+            remainder = block[cut:]
+            if cut:
+                yield block[:cut]
+        if remainder:
+            yield remainder
+
+    def _chunks(self, results: Iterator[str]) -> Iterator[List[str]]:
+        """Group result lines into lists of at most ``chunk_size`` items."""
+        while True:
+            chunk = list(islice(results, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
@@ -0,0 +1,296 @@
+"""
+Presentation Layer: Binary batch interface for the calculator.
+Operands are raw little-endian float64 or int64 arrays (files or in-memory
+buffers) that are read through ``mmap``/``memoryview`` without copying;
+results are written straight into a preallocated output mapping. Any
+operator registered with the calculator service can be used. int64 values
+stay exact: chunks holding values that float64 cannot represent exactly are
+calculated with Python integers.
+"""
+
+import mmap
+import sys
+from array import array
+from itertools import repeat
+from typing import Any, Sequence, Union
+
+from src.application.calculator_service import CalculatorService
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; results are then array.array
+    np = None
+
+# Element types of the binary format: name -> struct/array typecode. The
+# batch kernels work in float64, which holds integers exactly only below
+# 2**53; larger int64 values take an exact, per-element path (BinaryBatch.run)
+DTYPES = {'float64': 'd', 'int64': 'q'}
+ITEMSIZE = 8
+_FLOAT64_EXACT_LIMIT = 2 ** 53
+
+# memoryview.cast uses the native byte order; big-endian hosts need a swap
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap, array]
+
+
+def _typecode(dtype: str) -> str:
+    try:
+        return DTYPES[dtype]
+    except KeyError:
+        raise ValueError(f"Unsupported dtype: {dtype}. Supported dtypes: {', '.join(DTYPES)}") from None
+
+
+def as_array(buffer: Buffer, dtype: str = 'float64') -> Sequence[Any]:
+    """
+    View a buffer of raw little-endian values as a one-dimensional array.
+
+    On little-endian hosts no data is copied: the result is a memoryview
+    over ``buffer`` (writable if the buffer is). Big-endian hosts get a
+    byte-swapped ``array`` copy instead.
+
+    Args:
+        buffer: Any object supporting the buffer protocol, e.g. ``bytes``,
+            ``bytearray``, ``mmap`` or an existing ``array``
+        dtype: ``'float64'`` or ``'int64'``
+
+    Returns:
+        A memoryview with format ``'d'`` or ``'q'``; int64 values keep their
+        full precision (``BinaryBatch.run`` does not round them to float64)
+
+    Raises:
+        ValueError: If the dtype is unknown or the buffer size is not a
+            multiple of 8 bytes
+    """
+    typecode = _typecode(dtype)
+    view = memoryview(buffer).cast('B')
+    if len(view) % ITEMSIZE:
+        raise ValueError(f"Buffer size {len(view)} is not a multiple of {ITEMSIZE} bytes")
+    if _NATIVE_LITTLE_ENDIAN:
+        return view.cast(typecode)
+    values = array(typecode, view.tobytes())
+    values.byteswap()
+    return memoryview(values)
+
+
+def open_array(path: str, dtype: str = 'float64') -> Sequence[Any]:
+    """
+    Map a binary array file read-only and return it as an array (see ``as_array``).
+
+    The file stays mapped while the returned view is referenced; call its
+    ``release()`` method to unmap it early.
+
+    Raises:
+        OSError: If the file cannot be opened
+        ValueError: If the dtype is unknown or the file size is not a
+            multiple of 8 bytes
+    """
+    _typecode(dtype)
+    with open(path, 'rb') as source:
+        size = source.seek(0, 2)
+        if size == 0:  # mmap cannot map an empty file
+            return as_array(b'', dtype)
+        mapping = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    return as_array(mapping, dtype)
+
+
+def create_array(path: str, length: int, dtype: str = 'float64') -> Sequence[Any]:
+    """
+    Create (or truncate) a file of ``length`` elements and map it writable.
+
+    Values written to the returned view go straight to the file; call
+    ``view.obj.flush()`` to write them to disk and ``view.release()`` to
+    unmap it early.
+
+    Raises:
+        OSError: If the file cannot be created
+        ValueError: If the dtype is unknown, length is negative or the host
+            is big-endian
+    """
+    typecode = _typecode(dtype)
+    if length < 0:
+        raise ValueError("Length cannot be negative")
+    if not _NATIVE_LITTLE_ENDIAN:
+        raise ValueError("Writable mappings require a little-endian host")
+    with open(path, 'w+b') as target:
+        target.truncate(length * ITEMSIZE)
+        if length == 0:
+            return memoryview(bytearray()).cast(typecode)
+        mapping = mmap.mmap(target.fileno(), 0, access=mmap.ACCESS_WRITE)
+    return memoryview(mapping).cast(typecode)
+
+
+class BinaryBatch:
+    """Batch interface evaluating ``a[i] op b[i]`` over binary arrays."""
+
+    def __init__(self, calculator_service: CalculatorService, chunk_size: int = 65536):
+        """
+        Initialize the binary batch interface with a calculator service.
+
+        Args:
+            calculator_service: The calculator service to use
+            chunk_size: Number of elements passed to ``calculate_many`` at once
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive")
+        self.calculator_service = calculator_service
+        self.chunk_size = chunk_size
+
+    def run(self, a_values: Sequence[Any], operator: str, b_values: Sequence[Any], output: memoryview) -> int:
+        """
+        Write ``a_values[i] operator b_values[i]`` into ``output[i]`` for every element.
+
+        Operands are sliced into zero-copy chunks and evaluated with
+        ``CalculatorService.calculate_many``, so every registered operation
+        works and float64 operands reach the batch kernels without being
+        copied. Each chunk of results is written into ``output`` directly.
+
+        The kernels compute in float64, which is exact for integers below
+        2**53 only. A chunk with int64 operands beyond that, or (for an int64
+        output) with results beyond it, is calculated element by element with
+        ``CalculatorService.calculate`` on Python integers instead.
+
+        Args:
+            a_values: First operands, e.g. from ``open_array``
+            operator: Operation symbol
+            b_values: Second operands, same length
+            output: Writable memoryview of format ``'d'`` or ``'q'``, same length
+
+        Returns:
+            Number of elements calculated
+
+        Raises:
+            ValueError: If the operator is not supported, the lengths differ,
+                an element is invalid for the operation (the message names
+                the chunk) or a result does not fit an int64 output
+        """
+        self.calculator_service.get_operation(operator)
+        length = len(a_values)
+        if len(b_values) != length or len(output) != length:
+            raise ValueError(
+                f"Operands and output must have the same length ({length}, {len(b_values)}, {len(output)})"
+            )
+        if output.readonly:
+            raise ValueError("Output buffer is read-only")
+        typecode = output.format
+        if typecode not in DTYPES.values():
+            raise ValueError(f"Unsupported output format: {typecode!r}")
+        integers = _is_int64(a_values) or _is_int64(b_values)
+        target = output.cast('B')
+        error = None
+        try:
+            for start in range(0, length, self.chunk_size):
+                stop = min(start + self.chunk_size, length)
+                try:
+                    if integers:
+                        results = self._calculate_integers(a_values[start:stop], operator, b_values[start:stop], typecode)
+                    else:
+                        results = self.calculator_service.calculate_many(a_values[start:stop], operator, b_values[start:stop])
+                except ValueError as e:
+                    error = f"Elements {start}-{stop - 1}: {e}"
+                    break
+                target[start * ITEMSIZE:stop * ITEMSIZE] = memoryview(self._to_buffer(results, typecode)).cast('B')
+        finally:
+            # Drop every view of the output so its mapping can be closed
+            target.release()
+        if error is not None:
+            # Raised outside the handler, so no traceback keeps chunk views alive
+            raise ValueError(error)
+        return length
+
+    def _calculate_integers(self, a_values: Sequence[Any], operator: str, b_values: Sequence[Any], typecode: str) -> Sequence[Any]:
+        """Calculate a chunk with int64 operands, falling back to Python integers where float64 would round."""
+        if all(_below_float64_limit(values) for values in (a_values, b_values) if _is_int64(values)):
+            results = self.calculator_service.calculate_many(a_values, operator, b_values)
+            if typecode == 'd' or _below_float64_limit(results):
+                return results
+        return list(map(self.calculator_service.calculate, _to_list(a_values), repeat(operator), _to_list(b_values)))
+
+    @staticmethod
+    def _to_buffer(results: Sequence[Any], typecode: str) -> Any:
+        """Return ``results`` as a contiguous buffer of ``typecode``, converting only if needed."""
+        if typecode == 'd':
+            if isinstance(results, array) and results.typecode == 'd':
+                return results
+            if np is not None and isinstance(results, np.ndarray) and results.dtype == np.float64:
+                return np.ascontiguousarray(results)
+            try:
+                return array('d', results)
+            except OverflowError:
+                raise ValueError("Result does not fit in float64") from None
+        try:
+            return array('q', map(_as_int, results))
+        except OverflowError:
+            raise ValueError("Result does not fit in int64") from None
+
+
+def _is_int64(values: Sequence[Any]) -> bool:
+    return getattr(values, 'format', None) == 'q' or getattr(values, 'typecode', None) == 'q'
+
+
+def _to_list(values: Sequence[Any]) -> list:
+    return values.tolist() if hasattr(values, 'tolist') else list(values)
+
+
+def _below_float64_limit(values: Sequence[Any]) -> bool:
+    """True if every value is smaller than 2**53 in magnitude, so float64 holds it exactly."""
+    if not len(values):
+        return True
+    if np is not None:
+        vector = np.asarray(values)
+        return bool(vector.min() > -_FLOAT64_EXACT_LIMIT and vector.max() < _FLOAT64_EXACT_LIMIT)
+    return -_FLOAT64_EXACT_LIMIT < min(values) and max(values) < _FLOAT64_EXACT_LIMIT
+
+
+def _as_int(value: Any) -> int:
+    if isinstance(value, int):
+        return value
+    if float(value).is_integer():
+        return int(value)
+    raise ValueError(f"Result {value} is not an integer; use a float64 output")
+
+
+def calculate_files(
+    calculator_service: CalculatorService,
+    a_path: str,
+    operator: str,
+    b_path: str,
+    output_path: str,
+    dtype: str = 'float64',
+    output_dtype: str = 'float64',
+    chunk_size: int = 65536,
+) -> int:
+    """
+    Calculate two binary array files element-wise into a new output file.
+
+    Args:
+        calculator_service: The calculator service to use
+        a_path: File of first operands
+        operator: Operation symbol
+        b_path: File of second operands
+        output_path: File created with one result per element
+        dtype: Element type of both operand files
+        output_dtype: Element type of the output file
+        chunk_size: Number of elements calculated at once
+
+    Returns:
+        Number of elements calculated
+
+    Raises:
+        OSError: If a file cannot be read or written
+        ValueError: As for ``BinaryBatch.run``
+    """
+    a_values = open_array(a_path, dtype)
+    b_values = open_array(b_path, dtype)
+    try:
+        output = create_array(output_path, len(a_values), output_dtype)
+        try:
+            count = BinaryBatch(calculator_service, chunk_size).run(a_values, operator, b_values, output)
+            if count:
+                output.obj.flush()
+            return count
+        finally:
+            output.release()
+    finally:
+        a_values.release()
+        b_values.release()
@@ -3,8 +3,11 @@ Presentation Layer: Command-line interface for the calculator.
 This layer handles user interaction and input/output.
 """
 
-from typing import Union
+from typing import Dict, Union
 from src.application.calculator_service import CalculatorService
+from src.application.expression import evaluate_expression
+from src.application.metrics import OperatorStats
+from src.application.tokenizer import parse_number
 
 
 class CalculatorCLI:
@@ -26,7 +29,8 @@ class CalculatorCLI:
         print("=" * 50)
         print(f"Supported operators: {', '.join(self.calculator_service.get_supported_operators())}")
         print("Use 'root' for nth root (e.g., 9 root 2) and '^' for power (e.g., 2 ^ 3)")
-        print("Type 'quit' or 'exit' to exit the calculator")
+        print("Expressions may use parentheses and precedence (e.g., (2 + 3) * 4 ^ 2)")
+        print("Type ':stats' for per-operator metrics, 'quit' or 'exit' to exit the calculator")
         print("=" * 50)
         
         while True:
@@ -37,6 +41,10 @@ class CalculatorCLI:
                     print("Thank you for using the calculator. Goodbye!")
                     break
                 
+                if user_input == ':stats':
+                    print(self._format_stats())
+                    continue
+                
                 result = self._process_input(user_input)
                 if result is not None:
                     print(f"Result: {result}")
@@ -51,35 +59,47 @@ class CalculatorCLI:
         """
         Process user input and calculate result.
         
+        The input is a full expression with operator precedence, parentheses
+        and unary minus, e.g. ``2 + 3 * 4 ^ 2`` or ``-(27 root 3)``.
+        
         Args:
             user_input: Raw user input string
             
         Returns:
             Calculation result or None if input is invalid
         """
-        parts = user_input.split()
-        
-        if len(parts) != 3:
-            print("Invalid input format. Please use format: number operator number")
-            print("Example: 5 + 3 or 9 root 2")
-            return None
-        
         try:
-            a = self._parse_number(parts[0])
-            operator = parts[1]
-            b = self._parse_number(parts[2])
-            
-            return self.calculator_service.calculate(a, operator, b)
-            
+            return evaluate_expression(user_input, self.calculator_service)
         except ValueError as e:
             print(f"Invalid input: {e}")
+            print("Example: 5 + 3, 9 root 2 or (2 + 3) * 4 ^ 2")
             return None
     
+    def _format_stats(self) -> str:
+        """Render ``calculator_service.stats()`` as a table, one row per operator."""
+        if not self.calculator_service.metrics_enabled:
+            return "Metrics are disabled (start with --metrics)"
+        stats: Dict[str, OperatorStats] = self.calculator_service.stats()
+        if not stats:
+            return "No calculations yet"
+        lines = [f"{'Operator':<8} {'Calls':>8} {'Errors':>8} {'Mean':>10} {'p50':>10} {'p99':>10}  Error types"]
+        for operator, entry in sorted(stats.items(), key=lambda item: -item[1].calls):
+            error_types = ', '.join(f"{name}={count}" for name, count in sorted(entry.error_types.items()))
+            lines.append(
+                f"{operator:<8} {entry.calls:>8} {entry.errors:>8} "
+                f"{_format_ns(entry.mean_ns):>10} {'<' + _format_ns(entry.percentile(50)):>10} "
+                f"{'<' + _format_ns(entry.percentile(99)):>10}  {error_types}".rstrip()
+            )
+        return '\n'.join(lines)
+    
     @staticmethod
     def _parse_number(value: str) -> Union[int, float]:
         """
         Parse a string to a number (int or float).
         
+        Integers, decimals, exponents (``1e5``) and ``inf``/``nan`` are
+        accepted; see ``src.application.tokenizer.parse_number``.
+        
         Args:
             value: String representation of a number
             
@@ -89,10 +109,12 @@ class CalculatorCLI:
         Raises:
             ValueError: If value cannot be parsed as a number
         """
-        try:
-            # Try to parse as int first
-            if '.' not in value:
-                return int(value)
-            return float(value)
-        except ValueError:
-            raise ValueError(f"'{value}' is not a valid number")
+        return parse_number(value)
+
+
+def _format_ns(nanoseconds: float) -> str:
+    """Format a duration with a unit suited to its size."""
+    for unit, scale in (('s', 1e9), ('ms', 1e6), ('us', 1e3)):
+        if nanoseconds >= scale:
+            return f"{nanoseconds / scale:.1f}{unit}"
+    return f"{nanoseconds:.0f}ns"
@@ -1,19 +1,26 @@
 """
 Presentation Layer: Graphical User Interface for the calculator.
 This layer provides a modern GUI using tkinter.
+Calculations run in a background worker process; the window polls for the
+result and Esc abandons a calculation that takes too long.
 """
 
-import sys
-from pathlib import Path
+import math
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional
-
-# Add project root to Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+from typing import Any, Callable, Optional, Tuple, Union
 
 from src.application.calculator_service import CalculatorService
+from src.application.tokenizer import parse_number
+from src.presentation.gui_worker import BackgroundCalculator
+from src.presentation.history import CalculationHistory, HistoryEntry
+from src.presentation.history_panel import HistoryPanel
+
+
+# Milliseconds between checks for a finished background calculation
+POLL_INTERVAL_MS = 20
+
+OPERATORS = ('+', '-', '*', '/', '^', 'root')
 
 
 class CalculatorGUI:
@@ -27,23 +34,31 @@ class CalculatorGUI:
             calculator_service: The calculator service to use
         """
         self.calculator_service = calculator_service
+        self.background = BackgroundCalculator(calculator_service)
+        self.history = CalculationHistory()
         self.window = tk.Tk()
         self.window.title("Simple Calculator")
-        self.window.geometry("400x550")
+        self.window.geometry("680x620")
         self.window.resizable(False, False)
         
         # Variables
         self.display_var = tk.StringVar(value="0")
         self.current_input = ""
-        self.first_operand: Optional[float] = None
+        self.first_operand: Optional[Any] = None
         self.current_operator: Optional[str] = None
         self.reset_display = False
         self.show_expression = False  # Flag to show full expression
+        # (text, value) when current_input shows an approximation of value
+        self._exact_input: Optional[Tuple[str, Any]] = None
+        self._on_result: Optional[Callable[[Any], None]] = None
+        self._pending_expression = ""
+        self._display_before_calculation = ""
         
         # Configure style
         self._configure_style()
         
         # Create UI elements
+        self._create_history_panel()
         self._create_display()
         self._create_buttons()
         
@@ -57,6 +72,13 @@ class CalculatorGUI:
         style = ttk.Style()
         style.theme_use('clam')
         
+    def _create_history_panel(self):
+        """Create the scrollable history on the right-hand side."""
+        self.history_panel = HistoryPanel(
+            self.window, self.history, self._recall, bg='#2C3E50', padx=10, pady=20,
+        )
+        self.history_panel.pack(side=tk.RIGHT, fill=tk.Y)
+        
     def _create_display(self):
         """Create the display area for showing numbers and results."""
         display_frame = tk.Frame(self.window, bg='#2C3E50', pady=20, padx=20)
@@ -94,6 +116,8 @@ class CalculatorGUI:
             (3, 0, 1, '1'), (3, 1, 1, '2'), (3, 2, 1, '3'), (3, 3, 1, '+'),
             # Row 4 - 0 button spans 2 columns
             (4, 0, 2, '0'), (4, 2, 1, '.'), (4, 3, 1, '='),
+            # Row 5
+            (5, 0, 2, '^'), (5, 2, 2, 'root'),
         ]
         
         for row, col, colspan, button_text in button_definitions:
@@ -101,7 +125,7 @@ class CalculatorGUI:
             if button_text in ['C', '⌫', '±']:
                 bg_color = '#E74C3C'  # Red for special operations
                 fg_color = '#FFFFFF'
-            elif button_text in ['+', '-', '*', '/', '=']:
+            elif button_text in OPERATORS or button_text == '=':
                 bg_color = '#3498DB'  # Blue for operators
                 fg_color = '#FFFFFF'
             else:
@@ -131,7 +155,7 @@ class CalculatorGUI:
             )
         
         # Configure grid weights for responsive layout
-        for i in range(5):
+        for i in range(6):
             button_frame.grid_rowconfigure(i, weight=1)
         for i in range(4):
             button_frame.grid_columnconfigure(i, weight=1)
@@ -147,8 +171,9 @@ class CalculatorGUI:
         """Setup keyboard shortcuts."""
         self.window.bind('<Key>', self._on_key_press)
         self.window.bind('<Return>', lambda e: self._on_button_click('='))
-        self.window.bind('<Escape>', lambda e: self._on_button_click('C'))
+        self.window.bind('<Escape>', lambda e: self._on_escape())
         self.window.bind('<BackSpace>', lambda e: self._on_button_click('⌫'))
+        self.window.protocol('WM_DELETE_WINDOW', self._on_close)
     
     def _on_key_press(self, event):
         """Handle keyboard input."""
@@ -156,8 +181,10 @@ class CalculatorGUI:
         
         if key.isdigit() or key == '.':
             self._on_button_click(key)
-        elif key in ['+', '-', '*', '/']:
+        elif key in OPERATORS:
             self._on_button_click(key)
+        elif key.lower() == 'r':
+            self._on_button_click('root')
         elif key.lower() == 'c':
             self._on_button_click('C')
     
@@ -168,12 +195,18 @@ class CalculatorGUI:
         Args:
             button_text: The text of the clicked button
         """
+        if self.background.busy:
+            # Only clearing is allowed while a calculation is running
+            if button_text == 'C':
+                self._cancel_calculation()
+                self._handle_clear()
+            return
         try:
             if button_text.isdigit():
                 self._handle_digit(button_text)
             elif button_text == '.':
                 self._handle_decimal()
-            elif button_text in ['+', '-', '*', '/']:
+            elif button_text in OPERATORS:
                 self._handle_operator(button_text)
             elif button_text == '=':
                 self._handle_equals()
@@ -216,58 +249,120 @@ class CalculatorGUI:
     def _handle_operator(self, operator: str):
         """Handle operator button press."""
         if self.current_input:
-            current_value = self._parse_number(self.current_input)
+            current_value = self._input_value()
             
             if self.first_operand is not None and self.current_operator and not self.reset_display:
                 # Chain operations
-                result = self.calculator_service.calculate(
-                    self.first_operand,
-                    self.current_operator,
-                    current_value
-                )
-                self.first_operand = result
-                self.current_input = str(result)
+                def chain(result):
+                    self.first_operand = result
+                    self._set_input(self._format_result(result), result)
+                    self._set_operator(operator)
+                self._start_calculation(self.first_operand, self.current_operator, current_value, chain)
             else:
                 self.first_operand = current_value
-            
-            self.current_operator = operator
-            self.reset_display = True
-            self.show_expression = True
-            
-            # Show the expression in display
-            self._update_display_with_operator()
+                self._set_operator(operator)
+    
+    def _set_operator(self, operator: str):
+        """Make ``operator`` pending and show the expression so far."""
+        self.current_operator = operator
+        self.reset_display = True
+        self.show_expression = True
+        
+        # Show the expression in display
+        self._update_display_with_operator()
     
     def _handle_equals(self):
         """Handle equals button press."""
         if self.first_operand is not None and self.current_operator and self.current_input:
-            try:
-                current_value = self._parse_number(self.current_input)
-                result = self.calculator_service.calculate(
-                    self.first_operand,
-                    self.current_operator,
-                    current_value
-                )
-                
-                # Format result
-                if isinstance(result, float) and result.is_integer():
-                    result = int(result)
-                
-                self.current_input = str(result)
-                
-                # Reset for next calculation
-                self.first_operand = None
-                self.current_operator = None
-                self.reset_display = True
-                self.show_expression = False
-                self._update_display()
-                
-            except ValueError as e:
-                messagebox.showerror("Error", str(e))
-                self._handle_clear()
+            current_value = self._input_value()
+            self._start_calculation(self.first_operand, self.current_operator, current_value, self._show_result)
+    
+    def _show_result(self, result: Any):
+        """Display the result of ``=`` and reset for the next calculation."""
+        self._set_input(self._format_result(result), result)
+        
+        # Reset for next calculation
+        self.first_operand = None
+        self.current_operator = None
+        self.reset_display = True
+        self.show_expression = False
+        self._update_display()
+    
+    def _start_calculation(self, a: Any, operator: str, b: Any, on_result: Callable[[Any], None]):
+        """
+        Evaluate ``a operator b`` in the background and show the computing state.
+        
+        Args:
+            a: First operand
+            operator: Operation symbol
+            b: Second operand
+            on_result: Called on the Tk thread with the result
+        """
+        self._on_result = on_result
+        self._pending_expression = f"{self._format_result(a)} {operator} {self._format_result(b)}"
+        self._display_before_calculation = self.display_var.get()
+        self.background.submit(a, operator, b)
+        self.display_var.set("Computing…")
+        self.window.config(cursor='watch')
+        self.window.after(POLL_INTERVAL_MS, self._poll_calculation)
+    
+    def _poll_calculation(self):
+        """Check for the background result; reschedules itself while running."""
+        if not self.background.busy:
+            return  # Cancelled
+        outcome = self.background.poll()
+        if outcome is None:
+            self.window.after(POLL_INTERVAL_MS, self._poll_calculation)
+            return
+        self.window.config(cursor='')
+        status, value = outcome
+        on_result, self._on_result = self._on_result, None
+        if status == 'error':
+            messagebox.showerror("Error", value)
+            self._handle_clear()
+            return
+        text = self._format_result(value)
+        self.history.append(self._pending_expression, text, self._exact_value(text, value))
+        self.history_panel.refresh()
+        try:
+            on_result(value)
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            self._handle_clear()
+    
+    def _cancel_calculation(self):
+        """Abandon the running calculation and restore the previous display."""
+        self.background.cancel()
+        self._on_result = None
+        self.window.config(cursor='')
+        self.display_var.set(self._display_before_calculation)
+    
+    def _recall(self, entry: HistoryEntry):
+        """Put a result from the history into the current input."""
+        if self.background.busy:
+            return
+        self._set_input(entry.result, entry.value)
+        # With an operator pending the recalled value is its second operand
+        self.reset_display = self.current_operator is None
+        self.show_expression = False
+        self._update_display()
+    
+    def _on_escape(self):
+        """Cancel a running calculation, otherwise clear."""
+        if self.background.busy:
+            self._cancel_calculation()
+        else:
+            self._on_button_click('C')
+    
+    def _on_close(self):
+        """Stop the worker process and close the window."""
+        self.background.close()
+        self.window.destroy()
     
     def _handle_clear(self):
         """Handle clear button press."""
         self.current_input = ""
+        self._exact_input = None
         self.first_operand = None
         self.current_operator = None
         self.reset_display = False
@@ -310,27 +405,80 @@ class CalculatorGUI:
         """Update display to show the expression with operator."""
         if self.first_operand is not None and self.current_operator:
             # Format the first operand
-            first_op_str = str(int(self.first_operand) if isinstance(self.first_operand, float) and self.first_operand.is_integer() else self.first_operand)
+            first_op_str = self._format_result(self.first_operand)
             
             # Show expression like "5 +"
             expression = f"{first_op_str} {self.current_operator}"
             self.display_var.set(expression)
     
+    def _set_input(self, text: str, value: Any = None):
+        """Show ``text`` as the current input; ``value`` is used instead while it stays unedited."""
+        self.current_input = text
+        value = self._exact_value(text, value) if value is not None else None
+        self._exact_input = (text, value) if value is not None else None
+    
+    def _input_value(self) -> Any:
+        """Return the number in the current input, exact for a shown or recalled approximation."""
+        if self._exact_input is not None and self._exact_input[0] == self.current_input:
+            return self._exact_input[1]
+        return self._parse_number(self.current_input)
+    
+    @classmethod
+    def _exact_value(cls, text: str, value: Any) -> Any:
+        """
+        Return ``value`` if ``text`` does not parse back to it, else None.
+        
+        Huge integers are shown in scientific notation; parsing that text
+        would give ``inf`` or a rounded float instead of the result.
+        """
+        try:
+            if cls._parse_number(text) == value:
+                return None
+        except ValueError:
+            pass
+        return value
+    
     @staticmethod
-    def _parse_number(value: str) -> float:
+    def _parse_number(value: str) -> Union[int, float]:
         """
-        Parse a string to a number.
+        Parse a string to a number (see ``src.application.tokenizer.parse_number``).
         
         Args:
-            value: String representation of a number
+            value: String representation of a number, e.g. ``-5``, ``2.5`` or ``1e5``
             
         Returns:
-            Parsed number as float
+            Parsed number as int for whole numbers (so powers and roots stay
+            exact), otherwise as float
+            
+        Raises:
+            ValueError: If value cannot be parsed as a number
         """
-        try:
-            return float(value)
-        except ValueError:
-            raise ValueError(f"'{value}' is not a valid number")
+        return parse_number(value)
+    
+    @staticmethod
+    def _format_result(value: Any, max_digits: int = 15) -> str:
+        """
+        Format a result for the display.
+        
+        Integral floats are shown without a fraction and integers too long
+        for the display in scientific notation, computed from the logarithm
+        so that huge results (which ``str`` would convert slowly or refuse)
+        format instantly.
+        """
+        if isinstance(value, float) and value.is_integer() and abs(value) < 10 ** max_digits:
+            value = int(value)
+        if isinstance(value, int) and not -10 ** max_digits < value < 10 ** max_digits:
+            exponent = math.log10(abs(value))
+            whole = int(exponent)
+            sign = '-' if value < 0 else ''
+            suffix = f"e+{whole}"
+            # Keep sign, "d." and the exponent within the display width
+            decimals = max(0, max_digits - len(sign) - 2 - len(suffix))
+            mantissa = f"{10 ** (exponent - whole):.{decimals}f}"
+            if mantissa.startswith('10'):
+                mantissa, suffix = f"{1:.{decimals}f}", f"e+{whole + 1}"
+            return f"{sign}{mantissa}{suffix}"
+        return str(value)
     
     def run(self):
         """Start the GUI application."""
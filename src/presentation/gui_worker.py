@@ -0,0 +1,111 @@
+"""
+Presentation Layer: Background evaluation for the GUI.
+Calculations run in a single worker process so that long operations (e.g.
+``9 ^ 9999999``) never block the Tk event loop and can be cancelled by
+terminating the worker. The GUI polls for results from ``window.after``.
+"""
+
+import multiprocessing
+from multiprocessing.pool import AsyncResult, Pool
+from typing import Any, Optional, Tuple
+
+from src.application.calculator_service import CalculatorService
+
+
+# Per-process service for the worker, built by the pool initializer.
+_worker_service: Optional[CalculatorService] = None
+
+
+def _initialize_worker(calculator_service: CalculatorService) -> None:
+    """Install the service copy used by the worker process."""
+    global _worker_service
+    _worker_service = calculator_service
+
+
+def _calculate_in_worker(a: Any, operator: str, b: Any) -> Tuple[str, Any]:
+    """Evaluate one calculation; errors are returned rather than raised."""
+    try:
+        return 'result', _worker_service.calculate(a, operator, b)
+    except Exception as e:
+        return 'error', str(e)
+
+
+class BackgroundCalculator:
+    """Runs one calculation at a time in a worker process."""
+
+    def __init__(self, calculator_service: CalculatorService):
+        """
+        Initialize the calculator; the worker process starts on first use.
+
+        Args:
+            calculator_service: The calculator service, copied into the worker
+        """
+        self.calculator_service = calculator_service
+        self._pool: Optional[Pool] = None
+        self._job: Optional[AsyncResult] = None
+        self._calculation: Tuple[Any, str, Any] = (None, '', None)
+
+    @property
+    def busy(self) -> bool:
+        """True while a submitted calculation has not been collected."""
+        return self._job is not None
+
+    def submit(self, a: Any, operator: str, b: Any) -> None:
+        """
+        Start evaluating ``a operator b`` in the worker.
+
+        Raises:
+            RuntimeError: If a calculation is already running
+        """
+        if self._job is not None:
+            raise RuntimeError("A calculation is already running")
+        if self._pool is None:
+            # A copy without history: a forked worker must not write to the parent's log
+            worker_service = self.calculator_service.with_history(None)
+            self._pool = multiprocessing.Pool(1, _initialize_worker, (worker_service,))
+        self._calculation = (a, operator, b)
+        self._job = self._pool.apply_async(_calculate_in_worker, (a, operator, b))
+
+    def poll(self) -> Optional[Tuple[str, Any]]:
+        """
+        Collect the running calculation without blocking.
+
+        Returns:
+            None while it is still running, otherwise ``('result', value)``
+            or ``('error', message)``
+        """
+        if self._job is None or not self._job.ready():
+            return None
+        job, self._job = self._job, None
+        try:
+            outcome = job.get()
+        except Exception as e:
+            outcome = 'error', str(e)
+        history = self.calculator_service.history
+        if history is not None:
+            # The worker's copy of the service does not record; record here
+            a, operator, b = self._calculation
+            status, value = outcome
+            if status == 'error':
+                history.record(a, operator, b, error=True)
+            else:
+                history.record(a, operator, b, value)
+        return outcome
+
+    def cancel(self) -> None:
+        """Abandon the running calculation by terminating the worker process."""
+        if self._job is None:
+            return
+        self._job = None
+        self._terminate()
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        self._job = None
+        self._terminate()
+
+    def _terminate(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
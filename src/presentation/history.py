@@ -0,0 +1,81 @@
+"""
+Presentation Layer: Compact in-memory calculation history.
+Entries are packed into one UTF-8 byte buffer indexed by an offset array,
+so a long-running GUI can keep hundreds of thousands of entries without
+one Python object per entry. Results whose text is only an approximation
+(e.g. a huge integer shown in scientific notation) also keep their exact value.
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List, NamedTuple
+
+# Separates expression and result inside a packed entry
+_SEPARATOR = b'\x1f'
+
+
+class HistoryEntry(NamedTuple):
+    """One completed calculation, as shown to the user."""
+
+    expression: str
+    result: str
+    value: Any = None  # The exact result when ``result`` is only an approximation
+
+
+class CalculationHistory:
+    """Append-only list of calculations backed by a byte buffer and an offset array."""
+
+    def __init__(self):
+        self._data = bytearray()
+        self._offsets = array('Q', [0])
+        self._values: Dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def append(self, expression: str, result: str, value: Any = None) -> None:
+        """
+        Add a calculation to the end of the history.
+
+        Args:
+            expression: The calculation as shown
+            result: The result as shown
+            value: The exact result, if ``result`` does not convert back to it
+        """
+        if value is not None:
+            self._values[len(self)] = value
+        self._data += expression.encode('utf-8') + _SEPARATOR + result.encode('utf-8')
+        self._offsets.append(len(self._data))
+
+    def __getitem__(self, index: int) -> HistoryEntry:
+        """
+        Return the entry at ``index`` (negative indexes count from the end).
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("History index out of range")
+        record = self._data[self._offsets[index]:self._offsets[index + 1]]
+        expression, result = record.decode('utf-8').split('\x1f', 1)
+        return HistoryEntry(expression, result, self._values.get(index))
+
+    def __iter__(self) -> Iterator[HistoryEntry]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def window(self, start: int, count: int) -> List[HistoryEntry]:
+        """Return up to ``count`` entries starting at ``start`` (clamped to the history)."""
+        start = max(0, start)
+        return [self[index] for index in range(start, min(start + count, len(self)))]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._data = bytearray()
+        self._offsets = array('Q', [0])
+        self._values = {}
+
+    def nbytes(self) -> int:
+        """Return the memory used by the packed entries and their offsets."""
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
@@ -0,0 +1,113 @@
+"""
+Presentation Layer: Virtualized history panel for the GUI.
+Only the rows that fit in the panel exist as canvas items; scrolling just
+changes their text, so memory and redraw cost do not grow with the history.
+"""
+
+import tkinter as tk
+from typing import Callable, List
+
+from src.presentation.history import CalculationHistory, HistoryEntry
+
+
+class HistoryPanel(tk.Frame):
+    """Scrollable list of past calculations; clicking a row recalls its result."""
+
+    def __init__(
+        self,
+        parent: tk.Misc,
+        history: CalculationHistory,
+        on_select: Callable[[HistoryEntry], None],
+        row_height: int = 22,
+        **options,
+    ):
+        """
+        Initialize the panel.
+
+        Args:
+            parent: Parent widget
+            history: The history to display
+            on_select: Called with the entry of a clicked row
+            row_height: Height of one row in pixels
+            options: Frame options
+        """
+        super().__init__(parent, **options)
+        self.history = history
+        self.on_select = on_select
+        self.row_height = row_height
+        self.top = 0  # Index of the first visible entry
+        self._rows: List[int] = []  # Canvas text items, one per visible row
+
+        self.canvas = tk.Canvas(self, bg='#34495E', highlightthickness=0, width=260)
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.canvas.bind('<Configure>', self._on_resize)
+        self.canvas.bind('<Button-1>', self._on_click)
+        self.canvas.bind('<MouseWheel>', lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        self.canvas.bind('<Button-4>', lambda e: self.scroll(-1))
+        self.canvas.bind('<Button-5>', lambda e: self.scroll(1))
+
+    @property
+    def visible_rows(self) -> int:
+        """Number of rows that fit in the panel."""
+        return len(self._rows)
+
+    def refresh(self) -> None:
+        """Redraw after the history grew; follows the end if it was showing."""
+        following = self.top + self.visible_rows >= len(self.history) - 1
+        if following:
+            self.top = self._max_top()
+        self._redraw()
+
+    def scroll(self, rows: int) -> None:
+        """Scroll by ``rows`` (negative scrolls up)."""
+        self._scroll_to(self.top + rows)
+
+    def _max_top(self) -> int:
+        return max(0, len(self.history) - self.visible_rows)
+
+    def _scroll_to(self, top: int) -> None:
+        self.top = min(max(0, top), self._max_top())
+        self._redraw()
+
+    def _on_resize(self, event: tk.Event) -> None:
+        """Keep exactly one canvas item per visible row."""
+        needed = max(1, event.height // self.row_height)
+        while len(self._rows) < needed:
+            y = len(self._rows) * self.row_height + self.row_height // 2
+            self._rows.append(self.canvas.create_text(
+                8, y, anchor='w', fill='#ECF0F1', font=('Arial', 11),
+            ))
+        while len(self._rows) > needed:
+            self.canvas.delete(self._rows.pop())
+        self._scroll_to(self.top)
+
+    def _redraw(self) -> None:
+        entries = self.history.window(self.top, self.visible_rows)
+        for index, item in enumerate(self._rows):
+            if index < len(entries):
+                entry = entries[index]
+                text = f"{entry.expression} = {entry.result}"
+            else:
+                text = ''
+            self.canvas.itemconfigure(item, text=text)
+        total = len(self.history)
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + self.visible_rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_scrollbar(self, action: str, amount: str, unit: str = 'units') -> None:
+        """Handle the scrollbar protocol: ``moveto fraction`` or ``scroll n units|pages``."""
+        if action == 'moveto':
+            self._scroll_to(int(float(amount) * len(self.history)))
+        elif action == 'scroll':
+            step = self.visible_rows if unit == 'pages' else 1
+            self.scroll(int(amount) * step)
+
+    def _on_click(self, event: tk.Event) -> None:
+        index = self.top + event.y // self.row_height
+        if index < len(self.history):
+            self.on_select(self.history[index])
@@ -0,0 +1,118 @@
+"""
+Presentation Layer: Multi-core batch interface for the calculator.
+An input file is split into byte-range shards at line boundaries, each shard
+is evaluated by a worker process holding its own CalculatorService, and the
+results are merged back in the original order.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Deque, Iterator, Optional, TextIO, Tuple
+
+from src.application.calculator_service import CalculatorService
+from src.presentation.batch import CalculatorBatch
+
+
+# Per-process batch interface, built once by the pool initializer.
+_worker_batch: Optional[CalculatorBatch] = None
+
+
+def _initialize_worker(service_factory: Callable[[], CalculatorService], decimal_comma: bool = False) -> None:
+    """Build the calculator service used by this worker process."""
+    global _worker_batch
+    _worker_batch = CalculatorBatch(service_factory(), decimal_comma=decimal_comma)
+
+
+def _evaluate_shard(path: str, start: int, end: int) -> Tuple[str, int]:
+    """Evaluate the lines in ``[start, end)`` of ``path``; return output text and error count."""
+    with open(path, 'rb') as source:
+        source.seek(start)
+        data = source.read(end - start)
+    _worker_batch.error_count = 0
+    text = ''.join(_worker_batch.evaluate_buffer(data))
+    return text, _worker_batch.error_count
+
+
+def iter_shards(path: str, shard_size: int) -> Iterator[Tuple[int, int]]:
+    """
+    Yield ``(start, end)`` byte ranges of roughly ``shard_size`` bytes.
+
+    Every boundary is moved forward to just after the next newline, so each
+    shard holds whole lines.
+    """
+    file_size = os.path.getsize(path)
+    with open(path, 'rb') as source:
+        start = 0
+        while start < file_size:
+            source.seek(min(start + shard_size, file_size))
+            source.readline()
+            end = min(source.tell(), file_size)
+            yield start, end
+            start = end
+
+
+class ParallelCalculatorBatch:
+    """Batch interface evaluating shards of a file in a process pool."""
+
+    def __init__(
+        self,
+        workers: int,
+        service_factory: Callable[[], CalculatorService] = CalculatorService,
+        shard_size: int = 4 * 1024 * 1024,
+        decimal_comma: bool = False,
+    ):
+        """
+        Initialize the parallel batch interface.
+
+        Args:
+            workers: Number of worker processes
+            service_factory: Picklable callable building each worker's service
+            shard_size: Approximate number of input bytes per shard
+            decimal_comma: Read ``1,5`` as one and a half
+        """
+        if workers < 1:
+            raise ValueError("Number of workers must be positive")
+        if shard_size < 1:
+            raise ValueError("Shard size must be positive")
+        self.workers = workers
+        self.service_factory = service_factory
+        self.shard_size = shard_size
+        self.decimal_comma = decimal_comma
+
+    def run(self, path: str, output: TextIO) -> int:
+        """
+        Evaluate every line of the file at ``path`` and write results in order.
+
+        At most two shards per worker are in flight, which bounds memory use
+        independently of the file size.
+
+        Args:
+            path: Path of a file with one expression per line
+            output: Text stream receiving the results
+
+        Returns:
+            Number of lines that failed to evaluate
+        """
+        error_count = 0
+        pending: Deque[Future] = deque()
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_initialize_worker,
+            initargs=(self.service_factory, self.decimal_comma),
+        ) as executor:
+            for start, end in iter_shards(path, self.shard_size):
+                pending.append(executor.submit(_evaluate_shard, path, start, end))
+                if len(pending) >= 2 * self.workers:
+                    error_count += self._write_result(pending.popleft(), output)
+            while pending:
+                error_count += self._write_result(pending.popleft(), output)
+        output.flush()
+        return error_count
+
+    @staticmethod
+    def _write_result(future: Future, output: TextIO) -> int:
+        """Write a finished shard's output and return its error count."""
+        text, error_count = future.result()
+        output.write(text)
+        return error_count
@@ -0,0 +1,321 @@
+"""
+Presentation Layer: Asyncio calculation server.
+Many local clients share one CalculatorService over a Unix socket or TCP
+localhost, speaking newline-delimited JSON.
+
+Requests (one JSON object per line):
+    {"id": 1, "a": 2, "op": "^", "b": 10}
+    {"id": 2, "expr": "(2 + 3) * 4"}
+    {"id": 3, "batch": [{"a": 1, "op": "+", "b": 2}, {"expr": "9 root 2"}]}
+
+Responses echo the ``id`` and carry ``result`` or ``error`` (``results`` for
+batches). Requests on one connection may be pipelined; responses are written
+in request order.
+"""
+
+import asyncio
+import functools
+import json
+import math
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.application.calculator_service import CalculatorService
+from src.application.expression import evaluate_expression
+from src.application.metrics import OperatorStats
+
+
+# Operators slow enough on large operands to be evaluated off the event loop.
+OFFLOADED_OPERATORS = frozenset({'^', 'root'})
+
+# Per-process service for offloaded requests, built by the pool initializer.
+_worker_service: Optional[CalculatorService] = None
+_worker_history: Optional['_CollectedHistory'] = None
+
+# One calculation for the history log: (a, operator, b, result, error)
+HistoryItem = Tuple[Any, str, Any, Any, bool]
+
+
+class _CollectedHistory:
+    """Stands in for the history recorder in a worker; the parent writes the records."""
+
+    def __init__(self):
+        self.records: List[HistoryItem] = []
+
+    def record(self, a: Any, operator: str, b: Any, result: Any = None, error: bool = False) -> None:
+        self.records.append((a, operator, b, result, error))
+
+    def record_many(self, a_values: Iterable[Any], operator: str, b_values: Iterable[Any], results: Iterable[Any]) -> None:
+        for a, b, result in zip(a_values, b_values, results):
+            self.record(a, operator, b, result)
+
+
+def _initialize_worker(calculator_service: CalculatorService, collect_history: bool = False) -> None:
+    """
+    Install the service copy used by this worker process.
+
+    The copy never records to the parent's log itself; with
+    ``collect_history`` its calculations are returned to the parent instead.
+    Its metrics start from zero so that only the worker's own calls are
+    returned.
+    """
+    global _worker_service, _worker_history
+    _worker_history = _CollectedHistory() if collect_history else None
+    _worker_service = calculator_service.with_history(_worker_history)
+    _worker_service.stats_clear()
+
+
+def _handle_in_worker(request: Dict[str, Any]) -> Tuple[Dict[str, Any], List[HistoryItem], Dict[str, OperatorStats]]:
+    """Evaluate an offloaded request in a worker process; also return its history records and metrics."""
+    response = handle_request(_worker_service, request)
+    stats = _worker_service.stats()
+    if stats:
+        _worker_service.stats_clear()
+    if _worker_history is None:
+        return response, [], stats
+    records, _worker_history.records = _worker_history.records, []
+    return response, records, stats
+
+
+def _evaluate_item(calculator_service: CalculatorService, item: Any) -> Dict[str, Any]:
+    """Evaluate a single calculation and return ``{'result': ...}`` or ``{'error': ...}``."""
+    if not isinstance(item, dict):
+        return {'error': "Request must be a JSON object"}
+    try:
+        if 'expr' in item:
+            if not isinstance(item['expr'], str):
+                return {'error': "'expr' must be a string"}
+            result = evaluate_expression(item['expr'], calculator_service)
+        else:
+            a, operator, b = item['a'], item['op'], item['b']
+            for operand in (a, b):
+                if isinstance(operand, bool) or not isinstance(operand, (int, float)):
+                    return {'error': f"Operand {operand!r} is not a number"}
+            result = calculator_service.calculate(a, operator, b)
+    except KeyError as e:
+        return {'error': f"Missing field {e}"}
+    except Exception as e:
+        return {'error': str(e)}
+    if isinstance(result, bool) or not isinstance(result, (int, float)):
+        result = str(result)
+    elif isinstance(result, float) and not math.isfinite(result):
+        # JSON has no Infinity or NaN
+        return {'error': f"Result {result} is not a finite number"}
+    return {'result': result}
+
+
+def handle_request(calculator_service: CalculatorService, request: Any) -> Dict[str, Any]:
+    """
+    Evaluate one decoded request.
+
+    Args:
+        calculator_service: The calculator service to use
+        request: Decoded JSON request
+
+    Returns:
+        The response object
+    """
+    if not isinstance(request, dict):
+        return {'id': None, 'error': "Request must be a JSON object"}
+    response = {'id': request.get('id')}
+    if 'batch' in request:
+        if not isinstance(request['batch'], list):
+            response['error'] = "'batch' must be a list"
+        else:
+            response['results'] = [_evaluate_item(calculator_service, item) for item in request['batch']]
+    else:
+        response.update(_evaluate_item(calculator_service, request))
+    return response
+
+
+def _needs_offload(request: Any) -> bool:
+    """Return True if the request uses an operator that may run for long."""
+    if not isinstance(request, dict):
+        return False
+    items = request['batch'] if isinstance(request.get('batch'), list) else [request]
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        if item.get('op') in OFFLOADED_OPERATORS:
+            return True
+        expression = item.get('expr')
+        if isinstance(expression, str) and any(symbol in expression for symbol in OFFLOADED_OPERATORS):
+            return True
+    return False
+
+
+def _encode(response: Dict[str, Any]) -> bytes:
+    """Serialize a response as one JSON line; non-finite results (not valid JSON) become errors."""
+    try:
+        return json.dumps(response, allow_nan=False).encode('utf-8') + b'\n'
+    except (TypeError, ValueError) as e:
+        return json.dumps({'id': response.get('id'), 'error': f"Result cannot be encoded: {e}"}).encode('utf-8') + b'\n'
+
+
+class CalculationServer:
+    """Newline-delimited JSON server sharing one calculator service."""
+
+    def __init__(
+        self,
+        calculator_service: CalculatorService,
+        max_concurrency: int = 64,
+        max_pipeline: int = 128,
+        offload_executor: Optional[Executor] = None,
+        max_line_bytes: int = 16 * 1024 * 1024,
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            calculator_service: The calculator service to share
+            max_concurrency: Maximum requests evaluated at once across all connections
+            max_pipeline: Maximum unanswered requests per connection; once
+                reached the connection is not read until responses are written
+            offload_executor: Executor for ``^``/``root`` requests; by default a
+                process pool whose workers hold a copy of the service
+            max_line_bytes: Maximum size of one request line
+        """
+        if max_concurrency < 1 or max_pipeline < 1:
+            raise ValueError("Concurrency and pipeline limits must be positive")
+        self.calculator_service = calculator_service
+        self.max_concurrency = max_concurrency
+        self.max_pipeline = max_pipeline
+        self.max_line_bytes = max_line_bytes
+        self._offload_executor = offload_executor
+        self._owns_executor = offload_executor is None
+        self._pending_offloads: Set[Future] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = 0) -> asyncio.AbstractServer:
+        """Start listening on TCP ``host:port`` (port 0 picks a free port)."""
+        return await asyncio.start_server(self.handle_connection, host, port, limit=self.max_line_bytes)
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """Start listening on the Unix socket at ``path``."""
+        return await asyncio.start_unix_server(self.handle_connection, path, limit=self.max_line_bytes)
+
+    def close(self) -> None:
+        """Shut down the offload executor if the server created it, cancelling queued requests."""
+        if self._owns_executor and self._offload_executor is not None:
+            # By hand: shutdown(cancel_futures=True) needs Python 3.9
+            for future in list(self._pending_offloads):
+                future.cancel()
+            self._offload_executor.shutdown(wait=False)
+            self._offload_executor = None
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve pipelined requests from one client until it disconnects."""
+        pending: asyncio.Queue = asyncio.Queue(self.max_pipeline)
+        writer_task = asyncio.create_task(self._write_responses(pending, writer))
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    await pending.put(self._completed({'id': None, 'error': "Request line too long"}))
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    # Blocks while max_pipeline responses are outstanding (backpressure)
+                    await pending.put(asyncio.create_task(self._respond(line)))
+        except ConnectionError:
+            pass
+        finally:
+            await pending.put(None)
+            await writer_task
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _write_responses(self, pending: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+        """
+        Write responses in request order as they complete.
+
+        After the client goes away, responses are still consumed (and
+        dropped) so the reading side never blocks on a full queue.
+        """
+        connected = True
+        while True:
+            task = await pending.get()
+            if task is None:
+                return
+            response = await task
+            if not connected:
+                continue
+            try:
+                writer.write(response)
+                await writer.drain()
+            except ConnectionError:
+                connected = False
+
+    @staticmethod
+    def _completed(response: Dict[str, Any]) -> 'asyncio.Future[bytes]':
+        """Wrap an immediate response in a finished future."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(_encode(response))
+        return future
+
+    async def _respond(self, line: bytes) -> bytes:
+        """Decode, evaluate and encode one request line."""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return _encode({'id': None, 'error': f"Invalid JSON: {e}"})
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            if not _needs_offload(request):
+                return _encode(handle_request(self.calculator_service, request))
+            try:
+                response = await self._offload(request)
+            except Exception as e:
+                response = {'id': request.get('id'), 'error': f"Evaluation failed: {e}"}
+        return _encode(response)
+
+    async def _offload(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Evaluate a request in the offload executor without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        if self._owns_executor:
+            history = self.calculator_service.history
+            if self._offload_executor is None:
+                # Workers get a copy of the service without history once, at
+                # start-up; with fork they would otherwise share the live log
+                self._offload_executor = ProcessPoolExecutor(
+                    initializer=_initialize_worker,
+                    initargs=(self.calculator_service.with_history(None), history is not None),
+                )
+            future = self._offload_executor.submit(_handle_in_worker, request)
+            self._pending_offloads.add(future)
+            future.add_done_callback(self._pending_offloads.discard)
+            response, records, stats = await asyncio.wrap_future(future)
+            if history is not None:
+                for a, operator, b, result, error in records:
+                    history.record(a, operator, b, result, error)
+            if stats:
+                self.calculator_service.stats_merge(stats)
+            return response
+        handler = functools.partial(handle_request, self.calculator_service)
+        return await loop.run_in_executor(self._offload_executor, handler, request)
+
+
+async def serve(
+    calculator_service: CalculatorService,
+    host: str = '127.0.0.1',
+    port: int = 8765,
+    socket_path: Optional[str] = None,
+) -> None:
+    """Run a calculation server until cancelled."""
+    server = CalculationServer(calculator_service)
+    if socket_path is not None:
+        listener = await server.start_unix(socket_path)
+    else:
+        listener = await server.start_tcp(host, port)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
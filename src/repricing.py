@@ -0,0 +1,211 @@
+"""
+Streaming repricing of a numeric CSV column.
+
+Applies a percentage operation from ``percent_test`` ("of", "raise" or
+"discount"), or a whole ``PercentChain`` of them, to one column of a CSV
+file, row by row, in constant memory.
+
+Usage:
+    python -m src.repricing prices.csv repriced.csv --column price --mode raise --percent 10
+    python -m src.repricing prices.csv repriced.csv --column price --step raise 10 --step discount 5 --exact --digits 2
+"""
+
+import argparse
+import csv
+import sys
+from typing import Iterator, List, NamedTuple, Optional, TextIO, Union
+
+from src.percent_chain import PERCENT_MODES, PercentChain
+
+
+class RepricingStats(NamedTuple):
+    """Summary of a repricing run."""
+
+    rows: int
+    repriced: int
+    skipped: int
+
+
+def percent_factor(mode: str, percent: float) -> float:
+    """
+    Return the multiplier equivalent to applying ``mode`` with ``percent``.
+
+    Every mode is ``value * factor``, so the factor is the formula applied
+    to 1.0 and multiplying by it gives bit-identical results.
+
+    Raises:
+        ValueError: If mode is unknown
+    """
+    try:
+        function = PERCENT_MODES[mode]
+    except KeyError:
+        raise ValueError(f"Unknown mode: {mode}. Supported modes: {', '.join(PERCENT_MODES)}") from None
+    return function(1.0, percent)
+
+
+class CsvRepricer:
+    """
+    Streams a CSV file, multiplying one numeric column by a fixed factor.
+
+    The factor may also be a ``PercentChain``; an exact chain reads values as
+    decimals and writes them as ``Decimal`` strings.
+    """
+
+    def __init__(
+        self,
+        column: Union[str, int],
+        factor: Union[float, PercentChain],
+        digits: Optional[int] = None,
+        delimiter: str = ',',
+        header: bool = True,
+    ):
+        """
+        Initialize the repricer.
+
+        Args:
+            column: Column name (requires a header) or zero-based index
+            factor: Multiplier applied to every value of the column, or a percent chain
+            digits: Round results to this many decimal places
+            delimiter: CSV field delimiter
+            header: Whether the first row is a header, copied unchanged
+        """
+        if isinstance(column, str) and not header:
+            raise ValueError("A column name requires a header row")
+        self.column = column
+        self.chain = factor if isinstance(factor, PercentChain) and factor.exact else None
+        self.factor = factor.factor if isinstance(factor, PercentChain) else factor
+        self.digits = digits
+        self.delimiter = delimiter
+        self.header = header
+        self.stats = RepricingStats(0, 0, 0)
+
+    def run(self, source: TextIO, target: TextIO) -> RepricingStats:
+        """
+        Reprice ``source`` into ``target``.
+
+        Rows whose column is missing or not a number are copied unchanged and
+        counted as skipped.
+        """
+        reader = csv.reader(source, delimiter=self.delimiter)
+        writer = csv.writer(target, delimiter=self.delimiter, lineterminator='\n')
+        index = self.column
+        if self.header:
+            header_row = next(reader, None)
+            if header_row is None:
+                return self.stats
+            writer.writerow(header_row)
+            if isinstance(index, str):
+                try:
+                    index = header_row.index(index)
+                except ValueError:
+                    raise ValueError(f"Column {self.column!r} not found in header") from None
+        writer.writerows(self._reprice_rows(reader, index))
+        return self.stats
+
+    def _reprice_rows(self, rows: Iterator[List[str]], index: int) -> Iterator[List[str]]:
+        if self.chain is not None:
+            yield from self._reprice_rows_exact(rows, index)
+            return
+        factor = self.factor
+        digits = self.digits
+        count = repriced = 0
+        for row in rows:
+            count += 1
+            try:
+                value = float(row[index]) * factor
+            except (IndexError, ValueError):
+                yield row
+                continue
+            row[index] = repr(value if digits is None else round(value, digits))
+            repriced += 1
+            yield row
+        self.stats = RepricingStats(count, repriced, count - repriced)
+
+    def _reprice_rows_exact(self, rows: Iterator[List[str]], index: int) -> Iterator[List[str]]:
+        chain = self.chain
+        count = repriced = 0
+        for row in rows:
+            count += 1
+            try:
+                value = chain.apply(row[index], self.digits)
+            except (IndexError, ValueError):
+                yield row
+                continue
+            row[index] = str(value)
+            repriced += 1
+            yield row
+        self.stats = RepricingStats(count, repriced, count - repriced)
+
+
+def reprice_csv(
+    source: TextIO,
+    target: TextIO,
+    column: Union[str, int],
+    mode: str,
+    percent: float,
+    digits: Optional[int] = None,
+    delimiter: str = ',',
+    header: bool = True,
+) -> RepricingStats:
+    """Apply ``mode`` with ``percent`` to ``column`` of a CSV stream."""
+    repricer = CsvRepricer(column, percent_factor(mode, percent), digits, delimiter, header)
+    return repricer.run(source, target)
+
+
+def parse_arguments(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Reprice a numeric column of a CSV file")
+    parser.add_argument('source', help="input CSV file ('-' for stdin)")
+    parser.add_argument('target', help="output CSV file ('-' for stdout)")
+    parser.add_argument('--column', required=True, help="column name, or zero-based index with --no-header")
+    parser.add_argument('--mode', choices=sorted(PERCENT_MODES))
+    parser.add_argument('--percent', type=float)
+    parser.add_argument('--step', nargs=2, action='append', default=[], metavar=('MODE', 'PERCENT'),
+                        help="add a chained step (repeatable), applied after --mode/--percent")
+    parser.add_argument('--exact', action='store_true', help="use exact decimal arithmetic")
+    parser.add_argument('--digits', type=int, help="round results to this many decimal places")
+    parser.add_argument('--delimiter', default=',')
+    parser.add_argument('--no-header', dest='header', action='store_false')
+    arguments = parser.parse_args(argv)
+    if (arguments.mode is None) != (arguments.percent is None):
+        parser.error("--mode and --percent must be given together")
+    if arguments.mode is None and not arguments.step:
+        parser.error("give --mode and --percent, or at least one --step")
+    return arguments
+
+
+def main(argv=None) -> int:
+    """Command-line entry point; returns the exit status."""
+    arguments = parse_arguments(argv)
+    column = arguments.column if arguments.header else int(arguments.column)
+    steps = arguments.step
+    if arguments.mode is not None:
+        steps = [(arguments.mode, arguments.percent)] + steps
+    try:
+        if len(steps) == 1 and not arguments.exact:
+            mode, percent = steps[0]
+            factor = percent_factor(mode, float(percent))
+        else:
+            factor = PercentChain(steps, exact=arguments.exact)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    source = sys.stdin if arguments.source == '-' else open(arguments.source, newline='', encoding='utf-8')
+    target = sys.stdout if arguments.target == '-' else open(arguments.target, 'w', newline='', encoding='utf-8')
+    try:
+        repricer = CsvRepricer(column, factor, arguments.digits, arguments.delimiter, arguments.header)
+        stats = repricer.run(source, target)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    print(f"{stats.repriced} of {stats.rows} rows repriced, {stats.skipped} skipped", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
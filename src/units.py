@@ -0,0 +1,107 @@
+"""
+Unit-conversion registry.
+
+Every unit is an affine map to the registry's base unit:
+
+    base = value * scale + offset
+
+Any A -> B conversion is composed exactly (with fractions) into a single
+fused ``(scale, offset)`` pair, cached, and applied as one multiply-add per
+value, for scalars and buffers alike.
+"""
+
+from fractions import Fraction
+from typing import Dict, Iterable, NamedTuple, Tuple, Union
+
+from src.converter import CHUNK_ITEMS, convert_buffer
+
+Number = Union[int, float, str, Fraction]
+
+
+class Unit(NamedTuple):
+    """A unit defined by its exact affine map to the base unit."""
+
+    name: str
+    scale: Fraction
+    offset: Fraction
+
+
+class UnitRegistry:
+    """Registry of units convertible to each other through a common base."""
+
+    def __init__(self, base: str, aliases: Iterable[str] = ()):
+        """
+        Initialize a registry containing only its base unit.
+
+        Args:
+            base: Name of the base unit
+            aliases: Alternative names of the base unit
+        """
+        self._units: Dict[str, Unit] = {}
+        self._conversions: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self.base = base
+        self.register(base, 1, 0, aliases)
+
+    def register(self, name: str, scale: Number, offset: Number = 0, aliases: Iterable[str] = ()) -> Unit:
+        """
+        Register a unit with ``base = value * scale + offset``.
+
+        Strings and fractions are taken exactly, e.g. ``scale='5/9'``.
+
+        Raises:
+            ValueError: If scale is zero
+        """
+        unit = Unit(name, Fraction(scale), Fraction(offset))
+        if unit.scale == 0:
+            raise ValueError("Unit scale cannot be zero")
+        for key in (name, *aliases):
+            self._units[key] = unit
+        self._conversions.clear()
+        return unit
+
+    def units(self) -> list:
+        """Return the names (including aliases) of all registered units."""
+        return list(self._units)
+
+    def conversion(self, source: str, target: str) -> Tuple[float, float]:
+        """
+        Return the fused ``(scale, offset)`` pair converting ``source`` to ``target``.
+
+        Raises:
+            ValueError: If either unit is unknown
+        """
+        key = (source, target)
+        fused = self._conversions.get(key)
+        if fused is None:
+            a = self._unit(source)
+            b = self._unit(target)
+            fused = (float(a.scale / b.scale), float((a.offset - b.offset) / b.scale))
+            self._conversions[key] = fused
+        return fused
+
+    def convert(self, value: float, source: str, target: str) -> float:
+        """Convert a single value."""
+        scale, offset = self.conversion(source, target)
+        return value * scale + offset
+
+    def convert_buffer(self, src, source: str, target: str, dst=None, chunk_items: int = CHUNK_ITEMS):
+        """Convert a float64 buffer in chunks, in place or into ``dst`` (see ``converter.convert_buffer``)."""
+        return convert_buffer(src, dst, self.conversion(source, target), chunk_items)
+
+    def _unit(self, name: str) -> Unit:
+        try:
+            return self._units[name]
+        except KeyError:
+            raise ValueError(f"Unknown unit: {name}. Known units: {', '.join(self._units)}") from None
+
+
+def temperature_registry() -> UnitRegistry:
+    """Return a registry of Kelvin, Celsius, Fahrenheit and Rankine."""
+    registry = UnitRegistry('K', aliases=('kelvin',))
+    registry.register('C', 1, '273.15', aliases=('celsius',))
+    registry.register('F', '5/9', '45967/180', aliases=('fahrenheit',))
+    registry.register('R', '5/9', 0, aliases=('rankine',))
+    return registry
+
+
+TEMPERATURE = temperature_registry()
@@ -0,0 +1,134 @@
+"""Unit tests for the batch presentation layer."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import io
+import os
+import tempfile
+import unittest
+from src.application.calculator_service import CalculatorService
+from src.presentation.batch import CalculatorBatch
+from src.presentation.parallel_batch import ParallelCalculatorBatch, iter_shards
+
+
+class TestCalculatorBatch(unittest.TestCase):
+    """Test cases for CalculatorBatch."""
+
+    def setUp(self):
+        self.batch = CalculatorBatch(CalculatorService(), chunk_size=2)
+
+    def run_batch(self, text):
+        output = io.StringIO()
+        errors = self.batch.run(io.StringIO(text), output)
+        return output.getvalue(), errors
+
+    def test_results_in_order(self):
+        output, errors = self.run_batch("1 + 1\n2 * 3\n2 + 3 * 4\n")
+        self.assertEqual(output, "2\n6\n14\n")
+        self.assertEqual(errors, 0)
+
+    def test_errors_reported_inline(self):
+        output, errors = self.run_batch("1 / 0\n5 +\n4 - 1\n")
+        lines = output.splitlines()
+        self.assertEqual(lines[0], "Error: Cannot divide by zero")
+        self.assertTrue(lines[1].startswith("Error: "))
+        self.assertEqual(lines[2], "3")
+        self.assertEqual(errors, 2)
+
+    def test_unprintable_result_reported_inline(self):
+        output, errors = self.run_batch("10 ^ 5000\n(10 ^ 5000) + 1\n1 + 1\n")
+        lines = output.splitlines()
+        self.assertTrue(lines[0].startswith("Error: "))
+        self.assertTrue(lines[1].startswith("Error: "))
+        self.assertEqual(lines[2], "2")
+        self.assertEqual(errors, 2)
+
+    def test_blank_lines_keep_alignment(self):
+        output, _ = self.run_batch("1 + 1\n\n   \n2 + 2")
+        self.assertEqual(output, "2\n\n\n4\n")
+
+    def test_evaluate_lines_is_lazy(self):
+        def lines():
+            yield "1 + 1"
+            raise AssertionError("input consumed eagerly")
+
+        results = self.batch.evaluate_lines(lines())
+        self.assertEqual(next(results), "2\n")
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            CalculatorBatch(CalculatorService(), chunk_size=0)
+        with self.assertRaises(ValueError):
+            CalculatorBatch(CalculatorService(), block_size=0)
+
+    def test_binary_input(self):
+        output = io.StringIO()
+        errors = self.batch.run(io.BytesIO("1e5 + 1\n9 root 2\n-3 ^ 2\n".encode('utf-8')), output)
+        self.assertEqual(output.getvalue(), "100001.0\n3\n-9\n")
+        self.assertEqual(errors, 0)
+
+    def test_decimal_comma(self):
+        batch = CalculatorBatch(CalculatorService(), decimal_comma=True)
+        output = io.StringIO()
+        batch.run(io.StringIO("2,5 * 2\n(1,5 + 1) * 2\n"), output)
+        self.assertEqual(output.getvalue(), "5.0\n5.0\n")
+
+    def test_small_blocks_split_lines(self):
+        text = "".join(f"{i} * 3 + 1\n" for i in range(50)) + "inf - 1"
+        expected = "".join(f"{i * 3 + 1}\n" for i in range(50)) + "inf\n"
+        for block_size in (1, 7, 64):
+            with self.subTest(block_size=block_size):
+                batch = CalculatorBatch(CalculatorService(), block_size=block_size)
+                for source in (io.StringIO(text), io.BytesIO(text.encode('utf-8'))):
+                    output = io.StringIO()
+                    batch.run(source, output)
+                    self.assertEqual(output.getvalue(), expected)
+
+
+class TestParallelCalculatorBatch(unittest.TestCase):
+    """Test cases for ParallelCalculatorBatch."""
+
+    def setUp(self):
+        lines = [f"{i} * 2 + 1" for i in range(200)] + ["1 / 0", "", "10 ^ 5000", "7 - 2"]
+        self.text = "\n".join(lines)
+        handle, self.path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handle, 'w', encoding='utf-8') as source:
+            source.write(self.text)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_shards_cover_file_at_line_boundaries(self):
+        shards = list(iter_shards(self.path, 100))
+        self.assertGreater(len(shards), 1)
+        self.assertEqual(shards[0][0], 0)
+        self.assertEqual(shards[-1][1], os.path.getsize(self.path))
+        with open(self.path, 'rb') as source:
+            data = source.read()
+        for (_, end), (next_start, _) in zip(shards, shards[1:]):
+            self.assertEqual(end, next_start)
+            self.assertEqual(data[end - 1:end], b'\n')
+
+    def test_matches_sequential_output(self):
+        expected = io.StringIO()
+        expected_errors = CalculatorBatch(CalculatorService()).run(io.StringIO(self.text), expected)
+
+        output = io.StringIO()
+        errors = ParallelCalculatorBatch(workers=2, shard_size=64).run(self.path, output)
+
+        self.assertEqual(output.getvalue(), expected.getvalue())
+        self.assertEqual(errors, expected_errors)
+        self.assertEqual(errors, 2)
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            ParallelCalculatorBatch(workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Unit tests for the benchmark harness."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+import tempfile
+import unittest
+from benchmarks.harness import Benchmark, compare, load_results, run_benchmarks, save_results
+
+
+def _document(**seconds):
+    return {'results': {name: {'seconds': value} for name, value in seconds.items()}}
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    """Test cases for benchmark timing and baseline comparison."""
+
+    def test_run_benchmarks_records_every_benchmark(self):
+        results = run_benchmarks([Benchmark('noop', lambda: None), Benchmark('sum', lambda: sum(range(10)), 10)],
+                                 repeat=1, min_time=0.001)
+        self.assertEqual(set(results['results']), {'noop', 'sum'})
+        self.assertEqual(results['results']['sum']['items'], 10)
+        self.assertGreater(results['results']['sum']['seconds'], 0)
+
+    def test_duplicate_names_rejected(self):
+        with self.assertRaises(ValueError):
+            run_benchmarks([Benchmark('a', lambda: None), Benchmark('a', lambda: None)], repeat=1, min_time=0.001)
+
+    def test_compare_flags_slowdown_above_threshold(self):
+        baseline = _document(fast=1.0, slow=1.0, gone=1.0)
+        current = _document(fast=1.05, slow=1.5, new=9.0)
+        regressions = compare(current, baseline, threshold=0.1)
+        self.assertEqual([regression.name for regression in regressions], ['slow'])
+        self.assertAlmostEqual(regressions[0].slowdown, 0.5)
+
+    def test_dispatch_suite_is_registered(self):
+        from benchmarks import bench_dispatch
+        from benchmarks.__main__ import SUITES
+        self.assertIn(bench_dispatch, SUITES)
+        results = run_benchmarks(bench_dispatch.benchmarks(), repeat=1, min_time=0.001)['results']
+        self.assertIn('dispatch.calculate[dict+abc]', results)
+        self.assertEqual(results['dispatch.calculate[table]']['budget'], bench_dispatch.DISPATCH_BUDGET)
+
+    def test_save_and_load_round_trip(self):
+        handle, path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        try:
+            save_results(_document(a=0.5), path)
+            self.assertEqual(load_results(path), _document(a=0.5))
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
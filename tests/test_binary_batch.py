@@ -0,0 +1,145 @@
+"""Unit tests for the binary batch presentation layer."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+import struct
+import tempfile
+import unittest
+from array import array
+from src.application.calculator_service import CalculatorService
+from src.domain.operations import Operation
+from src.presentation.binary_batch import BinaryBatch, as_array, calculate_files, create_array, open_array
+
+
+class Modulo(Operation):
+    def execute(self, a, b):
+        return a % b
+
+    def symbol(self):
+        return "%"
+
+
+class TestArrays(unittest.TestCase):
+    """Test cases for viewing buffers and files as arrays."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_as_array_does_not_copy(self):
+        buffer = bytearray(struct.pack('<3d', 1.0, 2.5, -4.0))
+        view = as_array(buffer)
+        self.assertEqual(view.tolist(), [1.0, 2.5, -4.0])
+        buffer[:8] = struct.pack('<d', 7.0)
+        self.assertEqual(view[0], 7.0)
+        self.assertEqual(as_array(struct.pack('<2q', -3, 2 ** 40), 'int64').tolist(), [-3, 2 ** 40])
+
+    def test_as_array_rejects_bad_input(self):
+        with self.assertRaises(ValueError):
+            as_array(b'\0' * 12)
+        with self.assertRaises(ValueError):
+            as_array(b'\0' * 8, 'float32')
+
+    def test_open_and_create(self):
+        with open(self.path('a.f64'), 'wb') as target:
+            target.write(struct.pack('<2d', 0.5, 8.0))
+        values = open_array(self.path('a.f64'))
+        self.assertEqual(values.tolist(), [0.5, 8.0])
+        self.assertTrue(values.readonly)
+        values.release()
+
+        output = create_array(self.path('out.i64'), 2, 'int64')
+        output[1] = 42
+        output.release()
+        with open(self.path('out.i64'), 'rb') as source:
+            self.assertEqual(struct.unpack('<2q', source.read()), (0, 42))
+
+    def test_empty_file(self):
+        open(self.path('empty'), 'wb').close()
+        self.assertEqual(len(open_array(self.path('empty'))), 0)
+        self.assertEqual(len(create_array(self.path('out'), 0)), 0)
+
+
+class TestBinaryBatch(unittest.TestCase):
+    """Test cases for BinaryBatch."""
+
+    def setUp(self):
+        self.batch = BinaryBatch(CalculatorService(), chunk_size=3)
+
+    def test_results_written_into_output(self):
+        a_values = as_array(array('d', [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]))
+        b_values = as_array(array('d', [2.0] * 7))
+        output = memoryview(bytearray(7 * 8)).cast('d')
+        self.assertEqual(self.batch.run(a_values, '^', b_values, output), 7)
+        self.assertEqual(output.tolist(), [1.0, 4.0, 9.0, 16.0, 25.0, 36.0, 49.0])
+
+    def test_int64_operands_and_output(self):
+        a_values = as_array(struct.pack('<3q', 7, 10, -9), 'int64')
+        b_values = as_array(struct.pack('<3q', 2, 5, 3), 'int64')
+        output = memoryview(bytearray(3 * 8)).cast('q')
+        self.batch.run(a_values, '-', b_values, output)
+        self.assertEqual(output.tolist(), [5, 5, -12])
+        with self.assertRaises(ValueError):
+            self.batch.run(a_values, '/', b_values, output)
+
+    def test_int64_beyond_float64_precision_is_exact(self):
+        big = 2 ** 60 + 1
+        a_values = as_array(struct.pack('<4q', big, -big, 2 ** 62, 3), 'int64')
+        b_values = as_array(struct.pack('<4q', 0, 2, 1, 3), 'int64')
+        output = memoryview(bytearray(4 * 8)).cast('q')
+        self.batch.run(a_values, '+', b_values, output)
+        self.assertEqual(output.tolist(), [big, 2 - big, 2 ** 62 + 1, 6])
+        # Small operands whose product exceeds 2**53 are recalculated exactly
+        a_values = as_array(struct.pack('<2q', 3 ** 20, 7), 'int64')
+        b_values = as_array(struct.pack('<2q', 3 ** 19 + 2, 1), 'int64')
+        self.batch.run(a_values[:2], '*', b_values, output[:2])
+        self.assertEqual(output[:2].tolist(), [3 ** 20 * (3 ** 19 + 2), 7])
+        with self.assertRaisesRegex(ValueError, "int64"):
+            self.batch.run(as_array(struct.pack('<q', 2 ** 62), 'int64'), '*', as_array(struct.pack('<q', 4), 'int64'), output[:1])
+
+    def test_added_operation(self):
+        service = CalculatorService()
+        service.add_operation(Modulo())
+        output = array('d', [0.0, 0.0])
+        BinaryBatch(service).run(array('d', [7.0, 9.5]), '%', array('d', [4.0, 2.0]), memoryview(output))
+        self.assertEqual(output.tolist(), [3.0, 1.5])
+
+    def test_errors(self):
+        a_values = array('d', [1.0, 2.0, 3.0, 4.0])
+        output = memoryview(array('d', [0.0] * 4))
+        with self.assertRaises(ValueError) as context:
+            self.batch.run(a_values, '/', array('d', [1.0, 1.0, 1.0, 0.0]), output)
+        self.assertEqual(str(context.exception), "Elements 3-3: Cannot divide by zero")
+        with self.assertRaises(ValueError):
+            self.batch.run(a_values, '+', array('d', [1.0]), output)
+        with self.assertRaises(ValueError):
+            self.batch.run(a_values, '?', a_values, output)
+        with self.assertRaises(ValueError):
+            self.batch.run(a_values, '+', a_values, memoryview(bytes(32)).cast('d'))
+        with self.assertRaises(ValueError):
+            BinaryBatch(CalculatorService(), chunk_size=0)
+
+    def test_calculate_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ('a', 'b', 'out')]
+            for path, values in zip(paths, ([16.0, 27.0], [2.0, 3.0])):
+                with open(path, 'wb') as target:
+                    target.write(struct.pack('<2d', *values))
+            count = calculate_files(CalculatorService(), paths[0], 'root', paths[1], paths[2], chunk_size=1)
+            with open(paths[2], 'rb') as source:
+                results = struct.unpack('<2d', source.read())
+        self.assertEqual(count, 2)
+        self.assertEqual(results, (4.0, 3.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -76,6 +76,33 @@ class TestCalculatorService(unittest.TestCase):
         
         operators = self.service.get_supported_operators()
         self.assertIn('^', operators)
+    
+    def test_services_share_operation_instances(self):
+        other = CalculatorService()
+        self.assertIs(self.service._operations['+'], other._operations['+'])
+    
+    def test_dispatch_table_is_read_only(self):
+        with self.assertRaises(TypeError):
+            self.service._dispatch['%'] = lambda a, b: a % b
+    
+    def test_add_operation_rebuilds_dispatch(self):
+        self.service.add_operation(MockPowerOperation())
+        self.assertEqual(self.service.calculate(3, '^', 2), 9)
+        self.assertIsInstance(self.service._operations['^'], MockPowerOperation)
+    
+    def test_calculate_many(self):
+        result = self.service.calculate_many([1, 2, 3], '*', [4, 5, 6])
+        self.assertEqual(list(result), [4.0, 10.0, 18.0])
+    
+    def test_calculate_many_custom_operation(self):
+        self.service.add_operation(MockPowerOperation())
+        result = self.service.calculate_many([2, 3], '^', [3, 2])
+        self.assertEqual(list(result), [8.0, 9.0])
+    
+    def test_calculate_many_unsupported_operator(self):
+        with self.assertRaises(ValueError) as context:
+            self.service.calculate_many([1], '%', [1])
+        self.assertIn("Unsupported operator", str(context.exception))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,92 @@
+"""Unit tests for the temperature converter."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import os
+import tempfile
+import unittest
+from array import array
+from src.converter import (
+    F_TO_C, c_to_f, c_to_f_buffer, convert_buffer, convert_file, f_to_c, f_to_c_buffer,
+)
+
+
+class TestScalarConversion(unittest.TestCase):
+    """Test cases for c_to_f and f_to_c."""
+
+    def test_known_points(self):
+        self.assertEqual(c_to_f(100), 212)
+        self.assertEqual(f_to_c(-40), -40)
+
+
+class TestBulkConversion(unittest.TestCase):
+    """Test cases for buffer and memory-mapped file conversion."""
+
+    def test_buffer_to_second_buffer(self):
+        out = bytearray(8 * 3)
+        c_to_f_buffer(array('d', [0.0, 100.0, -40.0]), out)
+        self.assertEqual(array('d', bytes(out)).tolist(), [32.0, 212.0, -40.0])
+
+    def test_in_place(self):
+        values = array('d', [32.0, 212.0])
+        f_to_c_buffer(values)
+        self.assertEqual(values.tolist(), [0.0, 100.0])
+
+    def test_matches_scalar_functions(self):
+        readings = array('d', (i / 7 - 50 for i in range(1000)))
+        converted = array('d', readings)
+        convert_buffer(converted, chunk_items=64)
+        for reading, value in zip(readings, converted):
+            self.assertAlmostEqual(value, c_to_f(reading), places=9)
+
+    def test_invalid_buffers(self):
+        with self.assertRaises(ValueError):
+            c_to_f_buffer(bytes(12))
+        with self.assertRaises(ValueError):
+            c_to_f_buffer(bytes(16))
+        with self.assertRaises(ValueError):
+            c_to_f_buffer(array('d', [1.0]), bytearray(16))
+
+    def test_convert_file(self):
+        directory = tempfile.mkdtemp()
+        source = os.path.join(directory, 'celsius.bin')
+        target = os.path.join(directory, 'fahrenheit.bin')
+        try:
+            with open(source, 'wb') as f:
+                array('d', [float(i) for i in range(-50, 50)]).tofile(f)
+            convert_file(source, target, chunk_items=16)
+            with open(target, 'rb') as f:
+                converted = array('d', f.read())
+            self.assertEqual(len(converted), 100)
+            self.assertAlmostEqual(converted[50], 32.0)
+
+            convert_file(target, conversion=F_TO_C)
+            with open(target, 'rb') as f:
+                restored = array('d', f.read())
+            for expected, value in zip(range(-50, 50), restored):
+                self.assertAlmostEqual(value, expected, places=9)
+        finally:
+            for path in (source, target):
+                if os.path.exists(path):
+                    os.remove(path)
+            os.rmdir(directory)
+
+    def test_convert_empty_file(self):
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            convert_file(path)
+            convert_file(path, path + '.out')
+            self.assertEqual(os.path.getsize(path + '.out'), 0)
+        finally:
+            os.remove(path)
+            os.remove(path + '.out')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Unit tests for the application layer expression engine."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import unittest
+from src.application.calculator_service import CalculatorService
+from src.application.expression import (
+    ExpressionError,
+    compile_expression,
+    evaluate_expression,
+)
+from src.domain.operations import Operation
+
+
+class ModuloOperation(Operation):
+    """Custom operation used to check registry dispatch."""
+
+    def execute(self, a, b):
+        return a % b
+
+    def symbol(self):
+        return "mod"
+
+
+class TestExpression(unittest.TestCase):
+    """Test cases for expression parsing and evaluation."""
+
+    def setUp(self):
+        self.service = CalculatorService()
+
+    def evaluate(self, source):
+        return evaluate_expression(source, self.service)
+
+    def test_single_operation(self):
+        self.assertEqual(self.evaluate("5 + 3"), 8)
+
+    def test_precedence(self):
+        self.assertEqual(self.evaluate("2 + 3 * 4 ^ 2"), 50)
+        self.assertEqual(self.evaluate("10 - 4 - 3"), 3)
+        self.assertEqual(self.evaluate("8 / 4 / 2"), 1.0)
+
+    def test_power_is_right_associative(self):
+        self.assertEqual(self.evaluate("2 ^ 3 ^ 2"), 512)
+
+    def test_parentheses(self):
+        self.assertEqual(self.evaluate("(2 + 3) * 4"), 20)
+        self.assertEqual(self.evaluate("((1))"), 1)
+
+    def test_unary_minus(self):
+        self.assertEqual(self.evaluate("-2 ^ 2"), -4)
+        self.assertEqual(self.evaluate("(-2) ^ 2"), 4)
+        self.assertEqual(self.evaluate("2 ^ -1"), 0.5)
+        self.assertEqual(self.evaluate("5 - -3"), 8)
+        self.assertEqual(self.evaluate("-3 * 2"), -6)
+
+    def test_root_infix(self):
+        self.assertEqual(self.evaluate("9 root 2 + 1"), 4.0)
+        self.assertEqual(self.evaluate("2 * 16 root 4"), 4.0)
+
+    def test_without_spaces(self):
+        self.assertEqual(self.evaluate("2+3*4"), 14)
+        self.assertEqual(self.evaluate("1.5*2"), 3.0)
+
+    def test_number_types(self):
+        self.assertIsInstance(self.evaluate("4"), int)
+        self.assertIsInstance(self.evaluate("4.0"), float)
+
+    def test_custom_operation(self):
+        self.service.add_operation(ModuloOperation())
+        self.assertEqual(self.evaluate("1 + 7 mod 4"), 4)
+
+    def test_unsupported_operator(self):
+        with self.assertRaises(ValueError) as context:
+            self.evaluate("5 % 3")
+        self.assertIn("Unsupported operator", str(context.exception))
+
+    def test_division_by_zero(self):
+        with self.assertRaises(ValueError) as context:
+            self.evaluate("1 / (2 - 2)")
+        self.assertIn("Cannot divide by zero", str(context.exception))
+
+    def test_malformed_expressions(self):
+        for source in ["", "   ", "5 +", "(1 + 2", "1 + 2)", "5 3", "* 2", "2 (3)"]:
+            with self.subTest(source=source):
+                with self.assertRaises(ExpressionError):
+                    compile_expression(source)
+
+    def test_compiled_expressions_are_cached(self):
+        compile_expression.cache_clear()
+        first = compile_expression("1 + 2 * 3")
+        second = compile_expression("1 + 2 * 3")
+        self.assertIs(first, second)
+        self.assertEqual(compile_expression.cache_info().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
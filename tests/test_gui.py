@@ -1,6 +1,9 @@
 """Unit tests for GUI presentation layer."""
 
+import os
 import sys
+import tempfile
+import time
 from pathlib import Path
 import unittest
 from unittest.mock import Mock, patch
@@ -10,6 +13,8 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.application.calculator_service import CalculatorService
+from src.application.history_log import HistoryLogReader, HistoryRecorder
+from src.presentation.gui_worker import BackgroundCalculator
 
 
 class TestCalculatorGUILogic(unittest.TestCase):
@@ -77,6 +82,105 @@ class TestCalculatorGUILogic(unittest.TestCase):
             self.service.calculate(10, '/', 0)
         self.assertIn("Cannot divide by zero", str(context.exception))
 
+    def test_whole_numbers_parse_as_int(self):
+        """Test that whole numbers stay exact for power and root."""
+        from src.presentation.gui import CalculatorGUI
+        
+        self.assertIsInstance(CalculatorGUI._parse_number("9"), int)
+        self.assertIsInstance(CalculatorGUI._parse_number("9.5"), float)
+    
+    def test_result_formatting(self):
+        """Test formatting of results for the display."""
+        from src.presentation.gui import CalculatorGUI
+        
+        self.assertEqual(CalculatorGUI._format_result(8.0), "8")
+        self.assertEqual(CalculatorGUI._format_result(2.5), "2.5")
+        self.assertEqual(CalculatorGUI._format_result(10 ** 20), "1.000000000e+20")
+        huge = CalculatorGUI._format_result(9 ** 99999)
+        self.assertTrue(huge.startswith("1.98"))
+        self.assertLessEqual(len(huge), 15)
+    
+    def test_approximate_results_keep_exact_value(self):
+        """Shown text that does not parse back to the result keeps the exact value."""
+        from src.presentation.gui import CalculatorGUI
+        
+        huge = 9 ** 99999
+        self.assertEqual(CalculatorGUI._exact_value(CalculatorGUI._format_result(huge), huge), huge)
+        self.assertEqual(CalculatorGUI._exact_value(CalculatorGUI._format_result(10 ** 20 + 1), 10 ** 20 + 1), 10 ** 20 + 1)
+        for value in (8.0, 2.5, 12345, -0.1):
+            self.assertIsNone(CalculatorGUI._exact_value(CalculatorGUI._format_result(value), value))
+        # A recalled entry is used exactly until its text is edited
+        gui = CalculatorGUI.__new__(CalculatorGUI)
+        gui._set_input(CalculatorGUI._format_result(huge), huge)
+        self.assertEqual(gui._input_value(), huge)
+        gui.current_input = "12"
+        self.assertEqual(gui._input_value(), 12)
+        gui._set_input("2.5", 2.5)
+        self.assertIsNone(gui._exact_input)
+
+
+class TestBackgroundCalculator(unittest.TestCase):
+    """Test cases for evaluation in the GUI worker process."""
+    
+    def setUp(self):
+        self.background = BackgroundCalculator(CalculatorService())
+    
+    def tearDown(self):
+        self.background.close()
+    
+    def wait(self, timeout=10.0, background=None):
+        background = background or self.background
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            outcome = background.poll()
+            if outcome is not None:
+                return outcome
+            time.sleep(0.01)
+        self.fail("Background calculation did not finish")
+    
+    def test_result(self):
+        self.background.submit(2, '^', 10)
+        self.assertTrue(self.background.busy)
+        self.assertEqual(self.wait(), ('result', 1024))
+        self.assertFalse(self.background.busy)
+    
+    def test_error(self):
+        self.background.submit(1, '/', 0)
+        self.assertEqual(self.wait(), ('error', 'Cannot divide by zero'))
+    
+    def test_one_calculation_at_a_time(self):
+        self.background.submit(1, '+', 1)
+        with self.assertRaises(RuntimeError):
+            self.background.submit(1, '+', 1)
+    
+    def test_history_recorded_once_by_the_parent(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'history.log')
+            recorder = HistoryRecorder(path, batch_size=1)
+            background = BackgroundCalculator(CalculatorService(history=recorder))
+            try:
+                for a, operator, b in ((2, '^', 3), (1, '+', 2)):
+                    background.submit(a, operator, b)
+                    self.wait(background=background)
+            finally:
+                background.close()
+                recorder.close()
+            with HistoryLogReader(path) as log:
+                records = [(record.operator, record.result) for record in log]
+        self.assertEqual(records, [('^', 8.0), ('+', 3.0)])
+
+    def test_cancel_long_calculation(self):
+        self.background.submit(9, '^', 10 ** 9)
+        time.sleep(0.05)
+        self.assertIsNone(self.background.poll())
+        started = time.monotonic()
+        self.background.cancel()
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertFalse(self.background.busy)
+        # A fresh worker takes the next calculation
+        self.background.submit(6, '*', 7)
+        self.assertEqual(self.wait(), ('result', 42))
+
 
 if __name__ == '__main__':
     unittest.main()
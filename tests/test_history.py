@@ -0,0 +1,65 @@
+"""Unit tests for the GUI calculation history store."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import unittest
+from src.presentation.history import CalculationHistory, HistoryEntry
+
+
+class TestCalculationHistory(unittest.TestCase):
+    """Test cases for CalculationHistory."""
+
+    def setUp(self):
+        self.history = CalculationHistory()
+        self.history.append("2 + 3", "5")
+        self.history.append("5 * 2", "10")
+        self.history.append("π ≈ 22 / 7", "3.142857142857143")
+
+    def test_length_and_indexing(self):
+        self.assertEqual(len(self.history), 3)
+        self.assertEqual(self.history[0], HistoryEntry("2 + 3", "5"))
+        self.assertEqual(self.history[-1].result, "3.142857142857143")
+        self.assertEqual(self.history[2].expression, "π ≈ 22 / 7")
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.history[3]
+        with self.assertRaises(IndexError):
+            self.history[-4]
+
+    def test_window(self):
+        self.assertEqual([entry.result for entry in self.history.window(1, 5)], ["10", "3.142857142857143"])
+        self.assertEqual(self.history.window(10, 5), [])
+
+    def test_iteration(self):
+        self.assertEqual([entry.result for entry in self.history], ["5", "10", "3.142857142857143"])
+
+    def test_clear(self):
+        self.history.clear()
+        self.assertEqual(len(self.history), 0)
+        self.assertEqual(self.history.window(0, 10), [])
+
+    def test_exact_values_are_kept(self):
+        self.history.append("9 ^ 99999", "1.98000000e+95419", 9 ** 99999)
+        self.assertEqual(self.history[-1].value, 9 ** 99999)
+        self.assertIsNone(self.history[0].value)
+        self.history.clear()
+        self.history.append("1 + 1", "2")
+        self.assertIsNone(self.history[0].value)
+
+    def test_memory_stays_compact(self):
+        history = CalculationHistory()
+        for i in range(200_000):
+            history.append(f"{i} + 1", str(i + 1))
+        self.assertEqual(history[123_456], HistoryEntry("123456 + 1", "123457"))
+        # About 20 bytes per entry, with no Python object per entry
+        self.assertLess(history.nbytes(), 200_000 * 24)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+"""Unit tests for the memory-mapped calculation history log."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import math
+import os
+import pickle
+import tempfile
+import unittest
+from array import array
+from decimal import Decimal
+from src.application.calculator_service import CalculatorService
+from src.application.history_log import (
+    ERROR,
+    LOSSY,
+    RECORD_SIZE,
+    HistoryLogReader,
+    HistoryRecorder,
+    index_path,
+)
+
+
+class TestHistoryLog(unittest.TestCase):
+    """Test cases for HistoryRecorder and HistoryLogReader."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'history.log')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        with HistoryRecorder(self.path) as recorder:
+            recorder.record(2, '+', 3, 5)
+            recorder.record(1.5, 'root', 2, 1.224744871391589)
+            recorder.record(1, '/', 0, error=True)
+        with HistoryLogReader(self.path) as reader:
+            records = list(reader)
+        self.assertEqual([(r.operator, r.a, r.b) for r in records], [('+', 2, 3), ('root', 1.5, 2), ('/', 1, 0)])
+        self.assertEqual(records[0].result, 5.0)
+        self.assertFalse(records[0].error)
+        self.assertTrue(records[2].error)
+        self.assertTrue(math.isnan(records[2].result))
+        self.assertEqual(os.path.getsize(self.path), 256 + 3 * RECORD_SIZE)
+
+    def test_unrepresentable_values_are_flagged(self):
+        with HistoryRecorder(self.path) as recorder:
+            recorder.record(10 ** 400, '*', Decimal('1.5'), -10 ** 400)
+            recorder.record('x', '+', 1, None)
+        with HistoryLogReader(self.path) as reader:
+            big, text = reader[0], reader[1]
+        self.assertEqual((big.a, big.b, big.result), (math.inf, 1.5, -math.inf))
+        self.assertEqual(big.flags, LOSSY)
+        self.assertTrue(math.isnan(text.a))
+        self.assertEqual(text.flags & (ERROR | LOSSY), LOSSY)
+
+    def test_writes_are_batched(self):
+        recorder = HistoryRecorder(self.path, batch_size=4)
+        for i in range(6):
+            recorder.record(i, '+', 1, i + 1)
+        with HistoryLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 4)
+        self.assertEqual(len(recorder), 6)
+        recorder.close()
+        with HistoryLogReader(self.path) as reader:
+            self.assertEqual(len(reader), 6)
+
+    def test_reopen_appends(self):
+        with HistoryRecorder(self.path) as recorder:
+            recorder.record(1, '+', 1, 2)
+        with HistoryRecorder(self.path) as recorder:
+            recorder.record(2, '-', 1, 1)
+            recorder.record(3, '+', 1, 4)
+        with HistoryLogReader(self.path) as reader:
+            self.assertEqual([r.operator for r in reader], ['+', '-', '+'])
+            timestamps = [r.timestamp_ns for r in reader]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+    def test_time_range_lookup(self):
+        with HistoryRecorder(self.path, batch_size=100, index_interval=16) as recorder:
+            for i in range(1000):
+                recorder.record(i, '+', 0, i)
+        self.assertEqual(os.path.getsize(index_path(self.path)), 16 * math.ceil(1000 / 16))
+        with HistoryLogReader(self.path) as reader:
+            timestamps = [r.timestamp_ns for r in reader]
+            start, end = timestamps[300], timestamps[700]
+            expected = [i for i, t in enumerate(timestamps) if start <= t < end]
+            self.assertEqual([int(r.a) for r in reader.between(start, end)], expected)
+            self.assertEqual(list(reader.between(end + 10 ** 12, end + 2 * 10 ** 12)), [])
+            self.assertEqual(len(list(reader.between(0, timestamps[0]))), 0)
+
+    def test_missing_index_still_searchable(self):
+        with HistoryRecorder(self.path, index_interval=8) as recorder:
+            for i in range(50):
+                recorder.record(i, '+', 0, i)
+        os.remove(index_path(self.path))
+        with HistoryLogReader(self.path) as reader:
+            middle = reader[25].timestamp_ns
+            self.assertEqual(next(reader.between(middle, middle + 1)).a, 25)
+
+    def test_not_a_log(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'\0' * 512)
+        with self.assertRaises(ValueError):
+            HistoryLogReader(self.path)
+        with self.assertRaises(ValueError):
+            HistoryRecorder(self.path)
+
+
+class TestServiceHistory(unittest.TestCase):
+    """Test cases for recording from CalculatorService."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'history.log')
+        self.recorder = HistoryRecorder(self.path)
+        self.service = CalculatorService(history=self.recorder)
+
+    def tearDown(self):
+        self.recorder.close()
+        self.directory.cleanup()
+
+    def read(self):
+        self.recorder.flush()
+        with HistoryLogReader(self.path) as reader:
+            return list(reader)
+
+    def test_calculations_and_errors_recorded(self):
+        self.service.calculate(6, '*', 7)
+        with self.assertRaises(ValueError):
+            self.service.calculate(1, '/', 0)
+        records = self.read()
+        self.assertEqual([(r.operator, r.result, r.error) for r in records[:1]], [('*', 42.0, False)])
+        self.assertTrue(records[1].error)
+
+    def test_calculate_many_recorded(self):
+        self.service.calculate_many([1, 2], '+', [10, 20])
+        self.assertEqual([r.result for r in self.read()], [11.0, 22.0])
+
+    def test_calculate_many_buffers_and_iterators(self):
+        self.service.calculate_many(memoryview(array('d', [1.0, 2.0])), '*', array('d', [3.0, 4.0]))
+        self.service.calculate_many((a for a in [5, 6]), '-', iter([1, 2]))
+        self.assertEqual([(r.a, r.b, r.result) for r in self.read()],
+                         [(1.0, 3.0, 3.0), (2.0, 4.0, 8.0), (5.0, 1.0, 4.0), (6.0, 2.0, 4.0)])
+
+    def test_failed_batch_is_one_error_record(self):
+        with self.assertRaises(ValueError):
+            self.service.calculate_many([1, 2, 3], '/', [1, 0, 1])
+        [record] = self.read()
+        self.assertEqual(record.operator, '/')
+        self.assertTrue(record.error)
+        self.assertTrue(math.isnan(record.a))
+
+    def test_pickled_copy_does_not_record(self):
+        copy = pickle.loads(pickle.dumps(self.service))
+        self.assertIsNone(copy.history)
+        self.assertEqual(copy.calculate(1, '+', 1), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""Unit tests for the application entry point."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import io
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.main import main, parse_arguments
+
+
+class TestEntryPoint(unittest.TestCase):
+    """Test cases for argument handling and lazy imports in src.main."""
+
+    def setUp(self):
+        # Keep the plugin manifest out of the user's cache directory
+        cache = tempfile.TemporaryDirectory()
+        self.addCleanup(cache.cleanup)
+        environment = patch.dict(os.environ, {'XDG_CACHE_HOME': cache.name})
+        environment.start()
+        self.addCleanup(environment.stop)
+
+    def test_cli_path_does_not_import_gui_or_process_pool(self):
+        code = (
+            "import sys, src.main, src.presentation; "
+            "print(sorted(m for m in ('tkinter', 'src.presentation.gui', 'concurrent.futures.process') "
+            "if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', code], cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip(), '[]')
+
+    def test_presentation_exposes_gui_lazily(self):
+        import src.presentation
+        from src.presentation.gui import CalculatorGUI
+        self.assertIs(src.presentation.CalculatorGUI, CalculatorGUI)
+        with self.assertRaises(AttributeError):
+            src.presentation.Missing
+
+    def test_parse_arguments(self):
+        self.assertTrue(parse_arguments(['--gui']).gui)
+        self.assertEqual(parse_arguments(['--batch']).batch, '-')
+        self.assertEqual(parse_arguments(['--batch', 'in.txt', '--workers', '2']).workers, 2)
+
+    def test_workers_require_batch_file(self):
+        with patch('sys.stderr', io.StringIO()):
+            with self.assertRaises(SystemExit):
+                parse_arguments(['--batch', '--workers', '2'])
+
+    def test_workers_reject_history(self):
+        with patch('sys.stderr', io.StringIO()) as stderr:
+            with self.assertRaises(SystemExit):
+                parse_arguments(['--batch', 'in.txt', '--workers', '2', '--history', 'calc.log'])
+        self.assertIn('--history', stderr.getvalue())
+        self.assertEqual(parse_arguments(['--batch', 'in.txt', '--workers', '1', '--history', 'calc.log']).workers, 1)
+
+    def test_main_batch_returns_exit_status(self):
+        handle, path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handle, 'w', encoding='utf-8') as source:
+            source.write("1 + 1\n1 / 0\n")
+        try:
+            with patch('sys.stdout', io.StringIO()) as output:
+                status = main(['--batch', path])
+        finally:
+            os.remove(path)
+        self.assertEqual(status, 1)
+        self.assertEqual(output.getvalue(), "2\nError: Cannot divide by zero\n")
+
+    def test_main_batch_numeric_backend(self):
+        with patch('sys.stdin', io.StringIO("1 / 3\n0.1 + 0.2\n")), patch('sys.stdout', io.StringIO()) as output:
+            status = main(['--batch', '--numeric', 'fraction'])
+        self.assertEqual(status, 0)
+        self.assertEqual(output.getvalue(), "1/3\n3/10\n")
+
+    def test_main_batch_plugins(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'modulo.py'), 'w', encoding='utf-8') as plugin:
+                plugin.write(
+                    "from src.domain.operations import Operation\n"
+                    "class Modulo(Operation):\n"
+                    "    def execute(self, a, b):\n"
+                    "        return a % b\n"
+                    "    def symbol(self):\n"
+                    "        return '%'\n"
+                )
+            with patch('sys.stdin', io.StringIO("7 % 3\n")), patch('sys.stdout', io.StringIO()) as output:
+                status = main(['--batch', '--plugins', directory])
+        self.assertEqual(status, 0)
+        self.assertEqual(output.getvalue(), "1\n")
+        self.assertTrue(os.path.exists(os.path.join(os.environ['XDG_CACHE_HOME'], 'niwpi-calculator', 'plugins.json')))
+
+    def test_main_batch_history(self):
+        from src.application.history_log import HistoryLogReader
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'history.log')
+            with patch('sys.stdin', io.StringIO("2 * 21\n1 / 0\n")), patch('sys.stdout', io.StringIO()):
+                main(['--batch', '--history', path])
+            with HistoryLogReader(path) as reader:
+                records = [(r.operator, r.error) for r in reader]
+        self.assertEqual(records, [('*', False), ('/', True)])
+
+    def test_main_binary(self):
+        from array import array
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ('a.f64', 'b.f64', 'out.f64')]
+            for path, values in zip(paths, ([1.5, 9.0, 2.0], [2.0, 3.0, 0.5])):
+                with open(path, 'wb') as target:
+                    target.write(array('d', values).tobytes())
+            status = main(['--binary', paths[0], '*', paths[1], paths[2]])
+            results = array('d')
+            with open(paths[2], 'rb') as source:
+                results.frombytes(source.read())
+        self.assertEqual(status, 0)
+        self.assertEqual(results.tolist(), [3.0, 27.0, 1.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
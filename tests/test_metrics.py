@@ -0,0 +1,132 @@
+"""Unit tests for per-operator metrics."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import io
+import unittest
+from unittest.mock import patch
+from src.application.calculator_service import CalculatorService
+from src.application.metrics import OperatorMetrics, ServiceMetrics
+from src.domain.operations import Operation
+from src.presentation.cli import CalculatorCLI
+
+
+class Modulo(Operation):
+    def execute(self, a, b):
+        return a % b
+
+    def symbol(self):
+        return '%'
+
+
+class TestOperatorMetrics(unittest.TestCase):
+    """Test cases for the histogram and its snapshot."""
+
+    def test_log2_buckets(self):
+        metrics = OperatorMetrics()
+        for elapsed in (0, 1, 3, 900, 1000, 1023, 1024):
+            metrics.record(elapsed)
+        stats = metrics.snapshot()
+        self.assertEqual(stats.calls, 7)
+        self.assertEqual(stats.total_ns, 3951)
+        self.assertEqual(stats.buckets(), {1: 1, 2: 1, 4: 1, 1024: 3, 2048: 1})
+
+    def test_percentiles_and_errors(self):
+        metrics = OperatorMetrics()
+        for _ in range(98):
+            metrics.record(100)
+        metrics.record_error(ValueError(), 5000)
+        metrics.record_error(ZeroDivisionError(), 5000)
+        stats = metrics.snapshot()
+        self.assertEqual(stats.percentile(50), 128)
+        self.assertEqual(stats.percentile(99), 8192)
+        self.assertEqual(stats.errors, 2)
+        self.assertEqual(stats.error_types, {'ValueError': 1, 'ZeroDivisionError': 1})
+        self.assertAlmostEqual(stats.error_rate, 0.02)
+        with self.assertRaises(ValueError):
+            stats.percentile(101)
+
+    def test_snapshot_is_detached(self):
+        metrics = ServiceMetrics()
+        metrics.operator('+').record(10)
+        snapshot = metrics.snapshot()
+        metrics.operator('+').record(10)
+        metrics.operator('-')
+        self.assertEqual(snapshot['+'].calls, 1)
+        self.assertEqual(list(metrics.snapshot()), ['+'])
+        metrics.clear()
+        self.assertEqual(metrics.snapshot(), {})
+
+    def test_merge(self):
+        worker = ServiceMetrics()
+        worker.operator('^').record(100)
+        worker.operator('^').record_error(ValueError(), 3000)
+        metrics = ServiceMetrics()
+        metrics.operator('^').record(100)
+        metrics.merge(worker.snapshot())
+        stats = metrics.snapshot()['^']
+        self.assertEqual((stats.calls, stats.errors, stats.total_ns), (3, 1, 3200))
+        self.assertEqual(stats.buckets(), {128: 2, 4096: 1})
+        self.assertEqual(stats.error_types, {'ValueError': 1})
+
+
+class TestServiceMetrics(unittest.TestCase):
+    """Test cases for CalculatorService(metrics=True)."""
+
+    def test_disabled_by_default(self):
+        service = CalculatorService()
+        service.calculate(1, '+', 2)
+        self.assertFalse(service.metrics_enabled)
+        self.assertEqual(service.stats(), {})
+
+    def test_counts_calls_and_errors(self):
+        service = CalculatorService(metrics=True, cache_size=8)
+        for _ in range(3):
+            self.assertEqual(service.calculate(2, '+', 3), 5)
+        with self.assertRaises(ValueError):
+            service.calculate(1, '/', 0)
+        service.calculate_many([1, 2, 3], '*', [4, 5, 6])
+        stats = service.stats()
+        self.assertEqual(set(stats), {'+', '/', '*'})
+        self.assertEqual((stats['+'].calls, stats['+'].errors), (3, 0))
+        self.assertEqual(stats['/'].error_types, {'ValueError': 1})
+        self.assertEqual(stats['*'].calls, 1)
+        self.assertGreater(stats['+'].total_ns, 0)
+        service.stats_clear()
+        self.assertEqual(service.stats(), {})
+
+    def test_added_operation_is_measured(self):
+        service = CalculatorService(metrics=True)
+        service.calculate(1, '+', 1)
+        service.add_operation(Modulo())
+        service.calculate(7, '%', 3)
+        self.assertEqual({symbol: entry.calls for symbol, entry in service.stats().items()}, {'+': 1, '%': 1})
+
+
+class TestCLIStats(unittest.TestCase):
+    """Test cases for the CLI ':stats' command."""
+
+    def run_cli(self, service, lines):
+        with patch('builtins.input', side_effect=lines + ['quit']), patch('sys.stdout', io.StringIO()) as output:
+            CalculatorCLI(service).run()
+        return output.getvalue()
+
+    def test_stats_table(self):
+        output = self.run_cli(CalculatorService(metrics=True), ['2 + 3', '1 / 0', ':stats'])
+        self.assertIn('Operator', output)
+        row = next(line for line in output.splitlines() if line.startswith('/ '))
+        self.assertEqual(row.split()[1:3], ['1', '1'])
+        self.assertTrue(row.endswith('ValueError=1'))
+
+    def test_stats_disabled(self):
+        output = self.run_cli(CalculatorService(), [':stats'])
+        self.assertIn('Metrics are disabled', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
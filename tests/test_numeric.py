@@ -0,0 +1,174 @@
+"""Unit tests for numeric backends."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pickle
+import unittest
+from decimal import Decimal, ROUND_DOWN
+from fractions import Fraction
+from src.application.calculator_service import CalculatorService
+from src.application.expression import evaluate_expression
+from src.domain.numeric import DecimalBackend, FloatBackend, get_numeric_backend
+from src.domain.operations import Operation
+
+
+class Modulo(Operation):
+    """User-defined operation without backend kernels."""
+
+    def execute(self, a, b):
+        return a % b
+
+    def symbol(self):
+        return "%"
+
+
+class TestNumericBackendRegistry(unittest.TestCase):
+    """Test cases for resolving backends."""
+
+    def test_named_backends_are_shared(self):
+        self.assertIs(get_numeric_backend('decimal'), get_numeric_backend('decimal'))
+        self.assertIs(get_numeric_backend('decimal').context, get_numeric_backend('decimal').context)
+
+    def test_instances_pass_through(self):
+        backend = FloatBackend()
+        self.assertIs(get_numeric_backend(backend), backend)
+        self.assertIsNone(get_numeric_backend(None))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            CalculatorService(numeric='complex')
+
+
+class TestDecimalBackend(unittest.TestCase):
+    """Test cases for Decimal arithmetic."""
+
+    def setUp(self):
+        self.service = CalculatorService(numeric='decimal')
+
+    def test_floats_are_read_as_decimals(self):
+        self.assertEqual(self.service.calculate(0.1, '+', 0.2), Decimal('0.3'))
+
+    def test_division(self):
+        self.assertEqual(self.service.calculate(1, '/', 4), Decimal('0.25'))
+        with self.assertRaises(ValueError):
+            self.service.calculate(1, '/', 0)
+
+    def test_strings_accepted(self):
+        self.assertEqual(self.service.calculate('19.99', '*', '3'), Decimal('59.97'))
+
+    def test_roots(self):
+        self.assertEqual(self.service.calculate(27, 'root', 3), Decimal(3))
+        self.assertEqual(self.service.calculate(2, 'root', 2), Decimal(2).sqrt())
+        with self.assertRaises(ValueError):
+            self.service.calculate(-8, 'root', 3)
+
+    def test_invalid_operands(self):
+        for value in ('abc', float('nan'), 'Infinity'):
+            with self.assertRaises(ValueError):
+                self.service.calculate(value, '+', 1)
+
+    def test_overflow_is_a_value_error(self):
+        for operator in ('*', '+', '-', '/'):
+            b = '-9e999999' if operator == '-' else '9e-999999' if operator == '/' else '9e999999'
+            with self.assertRaisesRegex(ValueError, "Overflow"):
+                self.service.calculate('9e999999', operator, b)
+        with self.assertRaises(ValueError):
+            self.service.calculate_many(['9e999999'], '*', ['9e999999'])
+
+    def test_custom_context(self):
+        service = CalculatorService(numeric=DecimalBackend(precision=5, rounding=ROUND_DOWN))
+        self.assertEqual(service.calculate(2, '/', 3), Decimal('0.66666'))
+
+    def test_pickle(self):
+        service = pickle.loads(pickle.dumps(CalculatorService(numeric=DecimalBackend(precision=5))))
+        self.assertEqual(service.calculate(1, '/', 3), Decimal('0.33333'))
+
+    def test_expression(self):
+        self.assertEqual(evaluate_expression('0.1 * 3 - 0.3', self.service), Decimal('0.0'))
+
+
+class TestFractionBackend(unittest.TestCase):
+    """Test cases for exact rational arithmetic."""
+
+    def setUp(self):
+        self.service = CalculatorService(numeric='fraction')
+
+    def test_exact_division(self):
+        self.assertEqual(self.service.calculate(1, '/', 3), Fraction(1, 3))
+
+    def test_power(self):
+        self.assertEqual(self.service.calculate(Fraction(2, 3), '^', -2), Fraction(9, 4))
+        self.assertEqual(self.service.calculate(8, '^', Fraction(2, 3)), 4)
+        with self.assertRaises(ValueError):
+            self.service.calculate(2, '^', 0.5)
+
+    def test_rational_roots(self):
+        self.assertEqual(self.service.calculate(Fraction(8, 27), 'root', 3), Fraction(2, 3))
+        with self.assertRaises(ValueError):
+            self.service.calculate(2, 'root', 2)
+
+    def test_calculate_many(self):
+        self.assertEqual(self.service.calculate_many([1, 2], '/', [3, 4]), [Fraction(1, 3), Fraction(1, 2)])
+        with self.assertRaises(ValueError):
+            self.service.calculate_many([1, 2], '+', [3])
+
+
+class TestIntBackend(unittest.TestCase):
+    """Test cases for integer arithmetic."""
+
+    def setUp(self):
+        self.service = CalculatorService(numeric='int')
+
+    def test_floor_division_and_root(self):
+        self.assertEqual(self.service.calculate(7, '/', 2), 3)
+        self.assertEqual(self.service.calculate(10 ** 40, 'root', 2), 10 ** 20)
+
+    def test_integral_values_coerced(self):
+        self.assertEqual(self.service.calculate(2.0, '^', '10'), 1024)
+
+    def test_non_integers_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.calculate(2.5, '+', 1)
+        with self.assertRaises(ValueError):
+            self.service.calculate(2, '^', -1)
+
+
+class TestFloatBackend(unittest.TestCase):
+    """Test cases for the float backend."""
+
+    def setUp(self):
+        self.service = CalculatorService(numeric='float')
+
+    def test_results_are_floats(self):
+        self.assertIsInstance(self.service.calculate(2, '+', 3), float)
+
+    def test_complex_power_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.calculate(-8, '^', 0.5)
+
+    def test_calculate_many_uses_float64_kernel(self):
+        self.assertEqual(list(self.service.calculate_many([1, 2], '*', [3, 4])), [3.0, 8.0])
+
+
+class TestBackendWithServiceLayers(unittest.TestCase):
+    """Test cases for backends combined with caching and custom operations."""
+
+    def test_custom_operation_gets_coerced_operands(self):
+        service = CalculatorService(numeric='fraction')
+        service.add_operation(Modulo())
+        self.assertEqual(service.calculate('7/2', '%', 1), Fraction(1, 2))
+
+    def test_cache(self):
+        service = CalculatorService(cache_size=8, numeric='decimal')
+        self.assertEqual(service.calculate(1, '/', 8), Decimal('0.125'))
+        self.assertEqual(service.calculate(1, '/', 8), Decimal('0.125'))
+        self.assertEqual(service.cache_info().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
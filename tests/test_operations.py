@@ -7,8 +7,13 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+import math
 import unittest
-from src.domain.operations import Addition, Subtraction, Multiplication, Division, Power, Root
+from array import array
+from fractions import Fraction
+from src.domain.operations import (
+    Operation, Addition, Subtraction, Multiplication, Division, Power, Root, integer_nth_root,
+)
 
 
 class TestAddition(unittest.TestCase):
@@ -158,9 +163,157 @@ class TestRoot(unittest.TestCase):
             self.operation.execute(-8, 3)
         self.assertIn("Cannot extract root of negative number", str(context.exception))
 
+    def test_perfect_power_is_exact(self):
+        result = self.operation.execute(27, 3)
+        self.assertEqual(result, 3)
+        self.assertIsInstance(result, int)
+
+    def test_integral_float_operands(self):
+        self.assertEqual(self.operation.execute(27.0, 3), 3.0)
+        self.assertEqual(self.operation.execute(125, 3.0), 5)
+
+    def test_inexact_root_is_correctly_rounded(self):
+        self.assertEqual(self.operation.execute(2, 2), math.sqrt(2))
+        for a, n in [(2, 3), (10, 5), (12345678901234567890, 7)]:
+            expected = float(Fraction(integer_nth_root(a << (n * 200), n), 1 << 200))
+            self.assertAlmostEqual(self.operation.execute(a, n), expected, delta=abs(expected) * 2 ** -52)
+
+    def test_big_integer_root(self):
+        base = 3 ** 5000 + 1
+        self.assertEqual(self.operation.execute(base ** 3, 3), base)
+        # Beyond float range as an operand, but the root itself fits
+        self.assertAlmostEqual(self.operation.execute(10 ** 401, 2) / 1e200, math.sqrt(10), places=14)
+
+    def test_big_inexact_root_too_large_for_float(self):
+        with self.assertRaises(ValueError):
+            self.operation.execute(2 ** 3000 + 1, 2)
+
+    def test_huge_degree_falls_back_to_float(self):
+        self.assertAlmostEqual(self.operation.execute(2, 10 ** 6), 2 ** 1e-6, places=15)
+        self.assertEqual(self.operation.execute(2, 10 ** 30), 1.0)
+        self.assertAlmostEqual(self.operation.execute(10 ** 20 + 1, 500), (10 ** 20 + 1) ** (1 / 500), places=14)
+        self.assertEqual(self.operation.execute(1, 10 ** 30), 1)
+
+    def test_fractional_degree(self):
+        self.assertEqual(self.operation.execute(16, 0.5), 256.0)
+
     def test_symbol(self):
         self.assertEqual(self.operation.symbol(), "root")
 
 
+class TestIntegerNthRoot(unittest.TestCase):
+    """Test cases for integer_nth_root."""
+
+    def test_floor_root_small_values(self):
+        for a in range(0, 500):
+            for n in range(1, 10):
+                root = integer_nth_root(a, n)
+                self.assertTrue(root ** n <= a < (root + 1) ** n, (a, n))
+
+    def test_large_values(self):
+        value = 7 ** 4000
+        self.assertEqual(integer_nth_root(value ** 5, 5), value)
+        self.assertEqual(integer_nth_root(value ** 5 - 1, 5), value - 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            integer_nth_root(-1, 3)
+        with self.assertRaises(ValueError):
+            integer_nth_root(8, 0)
+
+
+class TestStatelessOperations(unittest.TestCase):
+    """Test cases for shared flyweight operation instances."""
+
+    def test_instances_are_shared(self):
+        for operation_class in (Addition, Subtraction, Multiplication, Division, Power, Root):
+            with self.subTest(operation=operation_class.__name__):
+                self.assertIs(operation_class(), operation_class())
+
+    def test_distinct_classes_have_distinct_instances(self):
+        self.assertIsNot(Addition(), Subtraction())
+
+    def test_instances_have_no_dict(self):
+        with self.assertRaises(AttributeError):
+            Addition().state = 1
+
+
+class TestBatchKernels(unittest.TestCase):
+    """Test cases for the element-wise batch kernels."""
+
+    def test_addition_many(self):
+        result = Addition().execute_many([1, 2, 3], array('d', [0.5, 0.5, 0.5]))
+        self.assertEqual(list(result), [1.5, 2.5, 3.5])
+
+    def test_subtraction_many(self):
+        result = Subtraction().execute_many(array('q', [5, 3]), [3, 5])
+        self.assertEqual(list(result), [2.0, -2.0])
+
+    def test_multiplication_many_memoryview(self):
+        result = Multiplication().execute_many(memoryview(array('d', [2.0, 4.0])), [3, 0])
+        self.assertEqual(list(result), [6.0, 0.0])
+
+    def test_division_many(self):
+        result = Division().execute_many([7, 6], [2, 3])
+        self.assertEqual(list(result), [3.5, 2.0])
+
+    def test_division_many_by_zero(self):
+        with self.assertRaises(ValueError) as context:
+            Division().execute_many([1, 2], [1, 0])
+        self.assertIn("Cannot divide by zero", str(context.exception))
+
+    def test_power_many(self):
+        result = Power().execute_many([2, 5, 2], [3, 0, -1])
+        self.assertEqual(list(result), [8.0, 1.0, 0.5])
+
+    def test_power_many_invalid(self):
+        with self.assertRaises(ValueError):
+            Power().execute_many([10.0], [1000.0])
+
+    def test_root_many(self):
+        result = Root().execute_many([9, 16], [2, 4])
+        self.assertEqual(list(result), [3.0, 2.0])
+
+    def test_root_many_matches_execute(self):
+        # Perfect powers and operands beyond 2**53 are exact; other roots are
+        # within one ulp of the correctly rounded root execute() returns
+        a_values = [64, 125, 27.0, 2 ** 60, 3 ** 39, 2, 30.5, 1e300, 10 ** 15 - 1, 2 ** 53 + 2]
+        b_values = [3, 3, 3.0, 4, 3, 5, 3, 7, 2, 3]
+        results = list(Root().execute_many(a_values, b_values))
+        for a, b, result in zip(a_values, b_values, results):
+            expected = float(Root().execute(a, b))
+            self.assertAlmostEqual(result, expected, delta=math.ulp(expected), msg=(a, b))
+        self.assertEqual(results[:5], [4.0, 5.0, 3.0, 2.0 ** 15, 3.0 ** 13])
+        self.assertEqual(results[-1], float(Root().execute(2 ** 53 + 2, 3)))
+
+    def test_root_many_large_batch_of_cubes(self):
+        roots = list(range(1, 20001))
+        results = Root().execute_many([float(root ** 3) for root in roots], [3.0] * len(roots))
+        self.assertEqual(list(results), [float(root) for root in roots])
+
+    def test_root_many_errors(self):
+        with self.assertRaises(ValueError) as context:
+            Root().execute_many([4], [0])
+        self.assertIn("Root degree cannot be zero", str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            Root().execute_many([4, -8], [2, 3])
+        self.assertIn("Cannot extract root of negative number", str(context.exception))
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            Addition().execute_many([1, 2], [1])
+
+    def test_default_kernel_uses_execute(self):
+        class Modulo(Operation):
+            def execute(self, a, b):
+                return a % b
+
+            def symbol(self):
+                return "%"
+
+        result = Modulo().execute_many([7, 9], [4, 5])
+        self.assertEqual(list(result), [3.0, 4.0])
+
+
 if __name__ == '__main__':
     unittest.main()
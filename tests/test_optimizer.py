@@ -0,0 +1,92 @@
+"""Unit tests for the expression tree optimizer."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import math
+import unittest
+from src.application.calculator_service import CalculatorService
+from src.application.expression import compile_expression, unparse
+from src.application.optimizer import optimize, plain_operation
+from src.application.templates import compile_template
+from src.domain.operations import Operation
+
+
+class ScaledAddition(Operation):
+    """A replacement '+' the optimizer must not simplify."""
+
+    def execute(self, a, b):
+        return a + 2 * b
+
+    def symbol(self):
+        return '+'
+
+
+class TestOptimizer(unittest.TestCase):
+    """Test cases for optimize."""
+
+    def setUp(self):
+        self.service = CalculatorService()
+
+    def optimized(self, source):
+        tree, rewrites = optimize(compile_expression(source), self.service)
+        return unparse(tree), [rewrite.rule for rewrite in rewrites]
+
+    def test_constant_folding(self):
+        self.assertEqual(self.optimized("x * (2 ^ 10 - 24)"), ("(x * 1000)", ['fold', 'fold']))
+        self.assertEqual(self.optimized("(5 ^ 3) root 3 + x"), ("(5 + x)", ['fold', 'fold']))
+        self.assertEqual(self.optimized("-(2 + 1) * x"), ("(-3 * x)", ['fold', 'fold']))
+
+    def test_identities(self):
+        self.assertEqual(
+            self.optimized("(x * 1 + 0) - 0"),
+            ("x", ['x * 1', 'x + 0', 'x - 0']),
+        )
+        self.assertEqual(self.optimized("1 * (0 + y) ^ 1"), ("y", ['0 + x', 'x ^ 1', '1 * x']))
+        self.assertEqual(self.optimized("x * -1 - --y"), ("(-x - y)", ['x * -1', 'double negation']))
+
+    def test_float_literals_keep_types(self):
+        self.assertEqual(self.optimized("x * 1.0 + x ^ 1.0 + (x + 0.0)"), ("(((x * 1.0) + (x ^ 1.0)) + (x + 0.0))", []))
+
+    def test_power_chains(self):
+        self.assertEqual(self.optimized("x ^ 2"), ("(x * x)", ['x ^ 2']))
+        self.assertEqual(self.optimized("x ^ 4"), ("(((x * x) * x) * x)", ['x ^ 4']))
+        self.assertEqual(self.optimized("x ^ 5"), ("(x ^ 5)", []))
+        self.assertEqual(self.optimized("(x + 1) ^ 2"), ("((x + 1) ^ 2)", []))
+
+    def test_error_semantics_kept(self):
+        self.assertEqual(self.optimized("1 / 0 + x"), ("((1 / 0) + x)", []))
+        self.assertEqual(self.optimized("(a ^ 2) root 2"), ("((a * a) root 2)", ['x ^ 2']))
+        self.assertEqual(self.optimized("x / 1"), ("(x / 1)", []))
+        template = compile_template("(a ^ 3) root 3", self.service)
+        with self.assertRaisesRegex(ValueError, "negative"):
+            template(-2)
+
+    def test_layered_and_custom_operations_untouched(self):
+        for service in (CalculatorService(numeric='decimal'), CalculatorService(metrics=True)):
+            with self.subTest(service=service):
+                self.assertEqual(optimize(compile_expression("x * 1 + 2 ^ 2"), service).rewrites, ())
+        self.service.add_operation(ScaledAddition())
+        self.assertIsNone(plain_operation(self.service, '+'))
+        self.assertEqual(self.optimized("x + 0 + (1 + 1)"), ("((x + 0) + (1 + 1))", []))
+
+    def test_matches_unoptimized_templates(self):
+        source = "x ^ 3 * 1 + (y - 0) * (4 root 2) - --x ^ 2 + 0"
+        optimized = compile_template(source, self.service)
+        plain = compile_template(source, self.service, optimize=False)
+        self.assertTrue(optimized.rewrites)
+        self.assertEqual(plain.rewrites, ())
+        for x, y in [(3, 4), (-2, 7), (1.5, -0.25), (10 ** 20, 3)]:
+            with self.subTest(x=x, y=y):
+                expected = plain(x, y)
+                actual = optimized(x, y)
+                self.assertEqual(type(actual), type(expected))
+                self.assertTrue(math.isclose(actual, expected, rel_tol=1e-15))
+
+
+if __name__ == '__main__':
+    unittest.main()
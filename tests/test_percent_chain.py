@@ -0,0 +1,114 @@
+"""Unit tests for percent chains."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import io
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+from src.percent_chain import PercentChain
+from src.percent_test import obnizka_procentowa, podwyzka_procentowa
+from src.repricing import CsvRepricer, main
+
+
+class TestPercentChain(unittest.TestCase):
+    """Test cases for composing percentage steps."""
+
+    def setUp(self):
+        self.chain = PercentChain().raise_by(10).discount(5).raise_by(3)
+
+    def test_factor_is_product_of_steps(self):
+        self.assertEqual(self.chain.factor, float(Fraction(110, 100) * Fraction(95, 100) * Fraction(103, 100)))
+
+    def test_matches_step_by_step(self):
+        expected = podwyzka_procentowa(obnizka_procentowa(podwyzka_procentowa(200.0, 10), 5), 3)
+        self.assertAlmostEqual(self.chain.apply(200), expected, places=12)
+
+    def test_immutable(self):
+        longer = self.chain.percent_of(50)
+        self.assertEqual(len(self.chain.steps), 3)
+        self.assertEqual(len(longer.steps), 4)
+        self.assertAlmostEqual(longer.factor, self.chain.factor / 2)
+
+    def test_empty_chain_is_identity(self):
+        self.assertEqual(PercentChain().apply(12.5), 12.5)
+
+    def test_apply_many_matches_apply(self):
+        values = [0.0, 1.5, 19.99, -7.0, 1e6]
+        self.assertEqual(list(self.chain.apply_many(values)), [self.chain.apply(value) for value in values])
+        self.assertEqual(list(self.chain.apply_many(values, 2)), [self.chain.apply(value, 2) for value in values])
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            PercentChain([('double', 10)])
+
+
+class TestExactPercentChain(unittest.TestCase):
+    """Test cases for exact money arithmetic."""
+
+    def setUp(self):
+        self.chain = PercentChain([('raise', 10), ('discount', 5), ('raise', 3)], exact=True)
+
+    def test_exact_factor(self):
+        self.assertEqual(self.chain.factor, Fraction(21527, 20000))
+
+    def test_apply_returns_decimal(self):
+        self.assertEqual(self.chain.apply('100'), Decimal('107.635'))
+        self.assertEqual(self.chain.apply(Decimal('19.99'), 2), Decimal('21.52'))
+
+    def test_rounding_is_half_even_on_exact_value(self):
+        half = PercentChain([('of', 50)], exact=True)
+        self.assertEqual(half.apply('0.05', 2), Decimal('0.02'))
+        self.assertEqual(half.apply('0.07', 2), Decimal('0.04'))
+        self.assertEqual(half.apply('-0.07', 2), Decimal('-0.04'))
+
+    def test_floats_read_as_decimals(self):
+        self.assertEqual(PercentChain([('of', 10)], exact=True).apply(0.1), Decimal('0.01'))
+
+    def test_fractional_percent(self):
+        chain = PercentChain([('discount', '12.5')], exact=True)
+        self.assertEqual(chain.apply('8'), Decimal('7'))
+
+    def test_apply_many(self):
+        self.assertEqual(self.chain.apply_many(['1', '2'], 2), [Decimal('1.08'), Decimal('2.15')])
+
+    def test_invalid_value(self):
+        for value in ('abc', 'nan', float('inf')):
+            with self.assertRaises(ValueError):
+                self.chain.apply(value)
+
+
+class TestChainRepricing(unittest.TestCase):
+    """Test cases for repricing CSV files with a chain."""
+
+    def test_exact_chain(self):
+        target = io.StringIO()
+        stats = CsvRepricer('price', PercentChain([('raise', 10), ('discount', 5)], exact=True), 2).run(
+            io.StringIO("price\n19.99\nfree\n"), target)
+        self.assertEqual(target.getvalue(), "price\n20.89\nfree\n")
+        self.assertEqual((stats.repriced, stats.skipped), (1, 1))
+
+    def test_float_chain(self):
+        target = io.StringIO()
+        CsvRepricer(0, PercentChain([('of', 50), ('of', 50)]), header=False).run(io.StringIO("8\n"), target)
+        self.assertEqual(target.getvalue(), "2.0\n")
+
+    def test_main_steps(self):
+        stdin, stdout, stderr = sys.stdin, sys.stdout, sys.stderr
+        sys.stdin, sys.stdout, sys.stderr = io.StringIO("price\n100\n"), io.StringIO(), io.StringIO()
+        try:
+            status = main(['-', '-', '--column', 'price', '--step', 'raise', '10', '--step', 'discount', '5', '--exact'])
+            output = sys.stdout.getvalue()
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+        self.assertEqual(status, 0)
+        self.assertEqual(output, "price\n104.5\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
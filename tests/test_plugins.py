@@ -0,0 +1,188 @@
+"""Unit tests for operation plugin discovery."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import json
+import os
+import pickle
+import tempfile
+import textwrap
+import unittest
+import warnings
+from src.application.calculator_service import CalculatorService
+from src.application.plugins import (
+    LazyOperation,
+    discover_plugins,
+    environment_key,
+    plugin_operations,
+)
+
+MODULO_PLUGIN = textwrap.dedent('''
+    from src.domain.operations import Operation
+
+    LOADS = []
+    LOADS.append(1)
+
+
+    class Modulo(Operation):
+        def execute(self, a, b):
+            return a % b
+
+        def symbol(self):
+            return '%'
+''')
+
+
+class PluginTestCase(unittest.TestCase):
+    """Creates a plugin directory and a manifest path in a temporary directory."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        self.plugins = self.root / 'plugins'
+        self.plugins.mkdir()
+        self.manifest = self.root / 'cache' / 'plugins.json'
+
+    def tearDown(self):
+        for name in [name for name in sys.modules if name.startswith(('_calculator_plugin_', 'fake_calc_plugin'))]:
+            del sys.modules[name]
+        self.directory.cleanup()
+
+    def write_plugin(self, name, source=MODULO_PLUGIN):
+        path = self.plugins / name
+        path.write_text(source, encoding='utf-8')
+        return path
+
+    def loaded_plugin_modules(self):
+        return [name for name in sys.modules if name.startswith('_calculator_plugin_')]
+
+    def forget_plugin_modules(self):
+        for name in self.loaded_plugin_modules():
+            del sys.modules[name]
+
+
+class TestDiscovery(PluginTestCase):
+    """Test cases for discover_plugins and the manifest."""
+
+    def test_directory_plugins(self):
+        path = self.write_plugin('modulo.py')
+        self.write_plugin('_private.py', 'raise RuntimeError')
+        operations = discover_plugins([self.plugins], self.manifest)
+        self.assertEqual(operations, {'%': f"{path}:Modulo"})
+        manifest = json.loads(self.manifest.read_text(encoding='utf-8'))
+        self.assertEqual(manifest['operations'], operations)
+        self.assertEqual(manifest['key'], environment_key([self.plugins]))
+
+    def test_manifest_hit_imports_nothing(self):
+        self.write_plugin('modulo.py')
+        discover_plugins([self.plugins], self.manifest)
+        self.forget_plugin_modules()
+        operations = plugin_operations([self.plugins], self.manifest)
+        self.assertEqual([op.symbol() for op in operations], ['%'])
+        self.assertEqual(self.loaded_plugin_modules(), [])
+
+    def test_manifest_invalidated_by_plugin_changes(self):
+        self.write_plugin('modulo.py')
+        key = environment_key([self.plugins])
+        discover_plugins([self.plugins], self.manifest)
+        self.write_plugin('floor.py', MODULO_PLUGIN.replace("'%'", "'//'").replace('a % b', 'a // b'))
+        self.assertNotEqual(environment_key([self.plugins]), key)
+        self.assertEqual(set(discover_plugins([self.plugins], self.manifest)), {'%', '//'})
+
+    def test_corrupt_manifest_is_rebuilt(self):
+        self.write_plugin('modulo.py')
+        self.manifest.parent.mkdir()
+        self.manifest.write_text('{not json', encoding='utf-8')
+        self.assertEqual(set(discover_plugins([self.plugins], self.manifest)), {'%'})
+        json.loads(self.manifest.read_text(encoding='utf-8'))
+
+    def test_broken_plugin_is_skipped(self):
+        self.write_plugin('broken.py', 'raise RuntimeError("boom")')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            self.assertEqual(discover_plugins([self.plugins], self.manifest), {})
+        self.assertIn('boom', str(caught[0].message))
+
+    def test_operation_that_cannot_be_instantiated_is_skipped(self):
+        self.write_plugin('modulo.py')
+        self.write_plugin('scaled.py', MODULO_PLUGIN.replace(
+            "class Modulo(Operation):", "class Scaled(Operation):\n    def __init__(self, factor):\n        self.factor = factor\n"
+        ))
+        self.write_plugin('nameless.py', MODULO_PLUGIN.replace("return '%'", "raise RuntimeError('no symbol')"))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            operations = discover_plugins([self.plugins], self.manifest)
+        self.assertEqual(set(operations), {'%'})
+        self.assertTrue(operations['%'].endswith('modulo.py:Modulo'))
+        messages = sorted(str(warning.message) for warning in caught)
+        self.assertEqual(len(messages), 2)
+        self.assertIn('no symbol', messages[0])
+        self.assertIn('factor', messages[1])
+        self.assertTrue(all(warning.category is RuntimeWarning for warning in caught))
+
+    def test_entry_points(self):
+        site = self.root / 'site'
+        distribution = site / 'fake_calc_plugin-1.0.dist-info'
+        distribution.mkdir(parents=True)
+        (distribution / 'METADATA').write_text('Metadata-Version: 2.1\nName: fake-calc-plugin\nVersion: 1.0\n')
+        (distribution / 'entry_points.txt').write_text(
+            '[niwpi_calculator.operations]\n% = fake_calc_plugin:Modulo\n'
+        )
+        (site / 'fake_calc_plugin.py').write_text(MODULO_PLUGIN, encoding='utf-8')
+        sys.path.insert(0, str(site))
+        try:
+            operations = discover_plugins(manifest_path=self.manifest)
+            self.assertEqual(operations, {'%': 'fake_calc_plugin:Modulo'})
+            self.assertNotIn('fake_calc_plugin', sys.modules)
+            self.assertEqual(LazyOperation('%', operations['%']).load().execute(7, 3), 1)
+        finally:
+            sys.path.remove(str(site))
+
+
+class TestLazyOperations(PluginTestCase):
+    """Test cases for plugin operations registered with CalculatorService."""
+
+    def test_imported_on_first_use(self):
+        self.write_plugin('modulo.py')
+        discover_plugins([self.plugins], self.manifest)
+        self.forget_plugin_modules()
+        service = CalculatorService(operations=plugin_operations([self.plugins], self.manifest))
+        self.assertIn('%', service.get_supported_operators())
+        self.assertEqual(self.loaded_plugin_modules(), [])
+        self.assertEqual(service.calculate(7, '%', 3), 1)
+        self.assertEqual(service.calculate(8, '%', 3), 2)
+        module = sys.modules[self.loaded_plugin_modules()[0]]
+        self.assertEqual(module.LOADS, [1])
+        self.assertEqual(list(service.calculate_many([7.0], '%', [4.0])), [3.0])
+
+    def test_first_use_is_measured(self):
+        path = self.write_plugin('modulo.py')
+        service = CalculatorService(metrics=True, operations=[LazyOperation('%', f"{path}:Modulo")])
+        service.calculate(7, '%', 3)
+        self.assertEqual(service.stats()['%'].calls, 1)
+
+    def test_load_errors(self):
+        service = CalculatorService(operations=[
+            LazyOperation('%', 'no_such_module_for_tests:Modulo'),
+            LazyOperation('?', f"{self.write_plugin('modulo.py')}:Modulo"),
+        ])
+        with self.assertRaisesRegex(ValueError, 'Cannot load plugin'):
+            service.calculate(7, '%', 3)
+        with self.assertRaisesRegex(ValueError, "does not provide an operation for '\\?'"):
+            service.calculate(7, '?', 3)
+        self.assertIn('%', service.get_supported_operators())
+
+    def test_pickled_service_keeps_lazy_operations(self):
+        path = self.write_plugin('modulo.py')
+        service = CalculatorService(operations=[LazyOperation('%', f"{path}:Modulo")])
+        copy = pickle.loads(pickle.dumps(service))
+        self.assertEqual(copy.calculate(9, '%', 4), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Unit tests for the percent functions and CSV repricing."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import io
+import os
+import tempfile
+import unittest
+from src.percent_test import obnizka_procentowa, podwyzka_procentowa, procent_z_liczby
+from src.repricing import CsvRepricer, RepricingStats, main, percent_factor, reprice_csv
+
+
+class TestPercentFunctions(unittest.TestCase):
+    """Test cases for the pure percent functions."""
+
+    def test_procent_z_liczby(self):
+        self.assertAlmostEqual(procent_z_liczby(200, 15), 30)
+
+    def test_podwyzka_procentowa(self):
+        self.assertAlmostEqual(podwyzka_procentowa(200, 10), 220)
+
+    def test_obnizka_procentowa(self):
+        self.assertAlmostEqual(obnizka_procentowa(200, 25), 150)
+
+
+class TestPercentFactor(unittest.TestCase):
+    """Test cases for folding a percent mode into one multiplier."""
+
+    def test_factor_matches_formula(self):
+        for value in (0.1, 19.99, 1234.5, -7.25):
+            for percent in (0.5, 7, 23, 100):
+                self.assertEqual(value * percent_factor('of', percent), procent_z_liczby(value, percent))
+                self.assertEqual(value * percent_factor('raise', percent), podwyzka_procentowa(value, percent))
+                self.assertEqual(value * percent_factor('discount', percent), obnizka_procentowa(value, percent))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError) as context:
+            percent_factor('double', 10)
+        self.assertIn("Unknown mode", str(context.exception))
+
+
+class TestRepriceCsv(unittest.TestCase):
+    """Test cases for streaming CSV repricing."""
+
+    def reprice(self, text, *args, **kwargs):
+        target = io.StringIO()
+        stats = reprice_csv(io.StringIO(text), target, *args, **kwargs)
+        return target.getvalue(), stats
+
+    def test_raise_by_column_name(self):
+        output, stats = self.reprice("sku,price\na,100\nb,12.5\n", 'price', 'raise', 10)
+        self.assertEqual(output, f"sku,price\na,{podwyzka_procentowa(100.0, 10)!r}\nb,{podwyzka_procentowa(12.5, 10)!r}\n")
+        self.assertEqual(stats, RepricingStats(2, 2, 0))
+
+    def test_rounding(self):
+        output, _ = self.reprice("price\n19.99\n", 'price', 'discount', 15, digits=2)
+        self.assertEqual(output, "price\n16.99\n")
+
+    def test_unparsable_values_are_copied_and_counted(self):
+        output, stats = self.reprice("name,price\na,n/a\nb\nc,10\n", 'price', 'of', 50)
+        self.assertEqual(output, "name,price\na,n/a\nb\nc,5.0\n")
+        self.assertEqual(stats, RepricingStats(3, 1, 2))
+
+    def test_index_without_header(self):
+        output, stats = self.reprice("a;10\nb;20\n", 1, 'of', 10, delimiter=';', header=False)
+        self.assertEqual(output, "a;1.0\nb;2.0\n")
+        self.assertEqual(stats.repriced, 2)
+
+    def test_quoted_fields_preserved(self):
+        output, _ = self.reprice('name,price\n"Widget, large",8\n', 'price', 'raise', 50)
+        self.assertEqual(output, 'name,price\n"Widget, large",12.0\n')
+
+    def test_missing_column(self):
+        with self.assertRaises(ValueError):
+            self.reprice("sku,cost\na,1\n", 'price', 'raise', 10)
+
+    def test_column_name_requires_header(self):
+        with self.assertRaises(ValueError):
+            CsvRepricer('price', 1.1, header=False)
+
+    def test_empty_input(self):
+        output, stats = self.reprice("", 'price', 'raise', 10)
+        self.assertEqual(output, "")
+        self.assertEqual(stats, RepricingStats(0, 0, 0))
+
+
+class TestRepricingMain(unittest.TestCase):
+    """Test cases for the repricing command line."""
+
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'in.csv')
+            target = os.path.join(directory, 'out.csv')
+            with open(source, 'w', newline='') as f:
+                f.write("sku,price\na,10\n")
+            stderr = io.StringIO()
+            sys.stderr, saved = stderr, sys.stderr
+            try:
+                status = main([source, target, '--column', 'price', '--mode', 'discount', '--percent', '50'])
+            finally:
+                sys.stderr = saved
+            self.assertEqual(status, 0)
+            with open(target, newline='') as f:
+                self.assertEqual(f.read(), "sku,price\na,5.0\n")
+            self.assertIn("1 of 1 rows repriced", stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
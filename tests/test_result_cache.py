@@ -0,0 +1,134 @@
+"""Unit tests for application layer result memoization."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import math
+import unittest
+from decimal import Decimal
+from src.application.calculator_service import CalculatorService
+from src.application.result_cache import ResultCache, make_key
+from src.domain.operations import Operation
+
+
+class CountingPower(Operation):
+    """Power operation that counts its executions."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def execute(self, a, b):
+        self.calls += 1
+        return a ** b
+
+    def symbol(self):
+        return "^"
+
+
+class TestResultCache(unittest.TestCase):
+    """Test cases for ResultCache."""
+
+    def test_hits_and_misses(self):
+        cache = ResultCache(maxsize=4)
+        compute = lambda a, b: a + b
+        self.assertEqual(cache.get_or_compute(1, '+', 2, compute), 3)
+        self.assertEqual(cache.get_or_compute(1, '+', 2, compute), 3)
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_lru_eviction(self):
+        cache = ResultCache(maxsize=2)
+        compute = lambda a, b: a * b
+        cache.get_or_compute(1, '*', 1, compute)
+        cache.get_or_compute(2, '*', 2, compute)
+        cache.get_or_compute(1, '*', 1, compute)  # 1 * 1 becomes most recent
+        cache.get_or_compute(3, '*', 3, compute)  # evicts 2 * 2
+        self.assertEqual(cache.info().evictions, 1)
+        cache.get_or_compute(1, '*', 1, compute)
+        self.assertEqual(cache.info().hits, 2)
+        cache.get_or_compute(2, '*', 2, compute)
+        self.assertEqual(cache.info().misses, 4)
+
+    def test_uncacheable_operands(self):
+        self.assertIsNone(make_key(math.nan, '+', 1))
+        self.assertIsNone(make_key([1], '+', 1))
+
+    def test_key_distinguishes_types_and_signed_zero(self):
+        self.assertNotEqual(make_key(1, '+', 1), make_key(1.0, '+', 1))
+        self.assertNotEqual(make_key(0.0, '*', 1), make_key(-0.0, '*', 1))
+
+    def test_decimal_keys(self):
+        self.assertNotEqual(make_key(Decimal('1.0'), '+', 1), make_key(Decimal('1.00'), '+', 1))
+        self.assertEqual(make_key(Decimal('1.0'), '+', 1), make_key(Decimal('1.0'), '+', 1))
+        for nan in ('NaN', 'sNaN', '-sNaN'):
+            self.assertIsNone(make_key(Decimal(nan), '+', 1))
+            self.assertIsNone(make_key(1, '+', Decimal(nan)))
+
+    def test_exceptions_are_not_cached(self):
+        cache = ResultCache(maxsize=2)
+
+        def fail(a, b):
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            cache.get_or_compute(1, '/', 0, fail)
+        self.assertEqual(cache.info().currsize, 0)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            ResultCache(maxsize=0)
+
+
+class TestServiceMemoization(unittest.TestCase):
+    """Test cases for the memoization layer of CalculatorService."""
+
+    def setUp(self):
+        self.service = CalculatorService(cache_size=16)
+        self.power = CountingPower()
+        self.service.add_operation(self.power)
+
+    def test_repeated_calculation_is_memoized(self):
+        self.assertEqual(self.service.calculate(2, '^', 10), 1024)
+        self.assertEqual(self.service.calculate(2, '^', 10), 1024)
+        self.assertEqual(self.power.calls, 1)
+        info = self.service.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_nan_is_not_memoized(self):
+        self.service.calculate(math.nan, '^', 1)
+        self.service.calculate(math.nan, '^', 1)
+        self.assertEqual(self.power.calls, 2)
+
+    def test_decimal_exponent_is_kept(self):
+        service = CalculatorService(numeric='decimal', cache_size=16)
+        self.assertEqual(str(service.calculate(Decimal('1.0'), '*', 3)), '3.0')
+        self.assertEqual(str(service.calculate(Decimal('1.00'), '*', 3)), '3.00')
+        with self.assertRaises(ValueError):
+            service.calculate(Decimal('sNaN'), '+', 1)
+
+    def test_add_operation_drops_stale_results(self):
+        self.service.calculate(2, '+', 2)
+        self.service.calculate(2, '^', 2)
+        replacement = CountingPower()
+        self.service.add_operation(replacement)
+        self.assertEqual(self.service.cache_info().currsize, 1)
+        self.service.calculate(2, '^', 2)
+        self.assertEqual(replacement.calls, 1)
+
+    def test_cache_clear(self):
+        self.service.calculate(3, '^', 3)
+        self.service.cache_clear()
+        self.assertEqual(self.service.cache_info(), (0, 0, 0, 16, 0))
+
+    def test_cache_disabled_by_default(self):
+        service = CalculatorService()
+        service.calculate(1, '+', 1)
+        self.assertEqual(service.cache_info().maxsize, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
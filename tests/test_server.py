@@ -0,0 +1,165 @@
+"""Unit tests for the asyncio calculation server."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import patch
+from src.application.calculator_service import CalculatorService
+from src.application.history_log import HistoryLogReader, HistoryRecorder
+from src.presentation.server import CalculationServer, _encode, handle_request
+
+
+class TestHandleRequest(unittest.TestCase):
+    """Test cases for request evaluation."""
+
+    def setUp(self):
+        self.service = CalculatorService()
+
+    def test_single_calculation(self):
+        self.assertEqual(handle_request(self.service, {'id': 7, 'a': 2, 'op': '^', 'b': 10}),
+                         {'id': 7, 'result': 1024})
+
+    def test_expression(self):
+        self.assertEqual(handle_request(self.service, {'id': 'x', 'expr': '(2 + 3) * 4'}),
+                         {'id': 'x', 'result': 20})
+
+    def test_batch(self):
+        response = handle_request(self.service, {'id': 1, 'batch': [
+            {'a': 1, 'op': '+', 'b': 2},
+            {'a': 1, 'op': '/', 'b': 0},
+            {'expr': '9 root 2'},
+        ]})
+        self.assertEqual(response['results'], [
+            {'result': 3}, {'error': 'Cannot divide by zero'}, {'result': 3},
+        ])
+
+    def test_invalid_requests(self):
+        self.assertIn('error', handle_request(self.service, [1, 2]))
+        self.assertIn('Missing field', handle_request(self.service, {'a': 1, 'op': '+'})['error'])
+        self.assertIn('not a number', handle_request(self.service, {'a': '1', 'op': '+', 'b': 2})['error'])
+        self.assertIn('error', handle_request(self.service, {'batch': 'nope'}))
+
+
+class TestCalculationServer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the server over TCP localhost."""
+
+    async def asyncSetUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.server = CalculationServer(CalculatorService(), max_pipeline=4, offload_executor=self.executor)
+        self.listener = await self.server.start_tcp()
+        port = self.listener.sockets[0].getsockname()[1]
+        self.reader, self.writer = await asyncio.open_connection('127.0.0.1', port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.listener.close()
+        await self.listener.wait_closed()
+        self.server.close()
+        self.executor.shutdown()
+
+    async def request_lines(self, lines):
+        self.writer.write(''.join(line + '\n' for line in lines).encode())
+        await self.writer.drain()
+        return [json.loads(await self.reader.readline()) for _ in lines]
+
+    async def test_pipelined_responses_keep_order(self):
+        requests = [json.dumps({'id': i, 'a': i, 'op': '^' if i % 2 else '+', 'b': 2}) for i in range(20)]
+        responses = await self.request_lines(requests)
+        self.assertEqual([response['id'] for response in responses], list(range(20)))
+        self.assertEqual(responses[3]['result'], 9)
+        self.assertEqual(responses[4]['result'], 6)
+
+    async def test_invalid_json(self):
+        responses = await self.request_lines(['{not json', json.dumps({'id': 1, 'expr': '1 + 1'})])
+        self.assertIn('Invalid JSON', responses[0]['error'])
+        self.assertEqual(responses[1], {'id': 1, 'result': 2})
+
+    async def test_non_finite_result_is_an_error(self):
+        responses = await self.request_lines([json.dumps({'id': 1, 'a': 1e308, 'op': '*', 'b': 10}),
+                                              json.dumps({'id': 2, 'a': 1, 'op': '+', 'b': 1})])
+        self.assertEqual(responses[0], {'id': 1, 'error': "Result inf is not a finite number"})
+        self.assertEqual(responses[1], {'id': 2, 'result': 2})
+        [response] = await self.request_lines([json.dumps({'id': 3, 'batch': [{'expr': '1e308 * 10'}, {'expr': '2 * 3'}]})])
+        self.assertEqual(response['results'][1], {'result': 6})
+        self.assertIn('error', response['results'][0])
+
+    def test_encode_rejects_non_finite_values(self):
+        line = _encode({'id': 1, 'result': float('nan')})
+        self.assertEqual(json.loads(line)['id'], 1)
+        self.assertIn('error', json.loads(line))
+
+    async def test_batch_message(self):
+        [response] = await self.request_lines([json.dumps({'id': 'b', 'batch': [{'expr': '2 ^ 3'}, {'expr': '1 +'}]})])
+        self.assertEqual(response['results'][0], {'result': 8})
+        self.assertIn('error', response['results'][1])
+
+
+class TestProcessPoolOffload(unittest.IsolatedAsyncioTestCase):
+    """Test cases for offloading to the server's own process pool."""
+
+    async def test_process_pool_with_history(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'history.log')
+            recorder = HistoryRecorder(path, batch_size=1)
+            server = CalculationServer(CalculatorService(history=recorder))
+            listener = await server.start_tcp()
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            try:
+                for request in ({'id': 1, 'a': 2, 'op': '^', 'b': 3}, {'id': 2, 'a': 1, 'op': '+', 'b': 2},
+                                {'id': 3, 'expr': '9 root 2 + 1'}):
+                    writer.write(json.dumps(request).encode() + b'\n')
+                    await writer.drain()
+                    self.assertIn('result', json.loads(await reader.readline()))
+            finally:
+                writer.close()
+                await writer.wait_closed()
+                listener.close()
+                await listener.wait_closed()
+                server.close()
+                recorder.close()
+            with HistoryLogReader(path) as log:
+                records = [(record.operator, record.result) for record in log]
+        self.assertEqual(records, [('^', 8.0), ('+', 3.0), ('root', 3.0), ('+', 4.0)])
+
+    async def test_process_pool_with_metrics(self):
+        service = CalculatorService(metrics=True)
+        service.calculate(1, '+', 1)
+        server = CalculationServer(service)
+        try:
+            for request in ({'id': 1, 'a': 2, 'op': '^', 'b': 3}, {'id': 2, 'expr': '9 root 2 * 2'},
+                            {'id': 3, 'a': -1, 'op': 'root', 'b': 2}):
+                self.assertEqual((await server._offload(request))['id'], request['id'])
+        finally:
+            server.close()
+        stats = service.stats()
+        self.assertEqual({symbol: entry.calls for symbol, entry in stats.items()}, {'+': 1, '^': 1, 'root': 2, '*': 1})
+        self.assertEqual(stats['root'].errors, 1)
+
+    async def test_close_with_python38_shutdown(self):
+        server = CalculationServer(CalculatorService())
+        self.assertEqual(await server._offload({'id': 1, 'a': 2, 'op': '^', 'b': 3}), {'id': 1, 'result': 8})
+        original = ProcessPoolExecutor.shutdown
+
+        def shutdown(executor, wait=True):  # the Python 3.8 signature
+            original(executor, wait)
+
+        with patch.object(ProcessPoolExecutor, 'shutdown', shutdown):
+            server.close()
+        self.assertEqual(await server._offload({'id': 2, 'a': 4, 'op': 'root', 'b': 2}), {'id': 2, 'result': 2})
+        server.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
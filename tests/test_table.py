@@ -0,0 +1,143 @@
+"""Unit tests for columnar CSV evaluation."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.application.calculator_service import CalculatorService
+from src.domain.operations import Operation
+from src.table import ColumnCalculator, TableStats, calculate_columns, main
+
+
+class Modulo(Operation):
+    def execute(self, a, b):
+        if b == 0:
+            raise ValueError("Modulo by zero")
+        return a % b
+
+    def symbol(self):
+        return "%"
+
+
+class TestColumnCalculator(unittest.TestCase):
+    """Test cases for ColumnCalculator."""
+
+    def calculate(self, text, *args, **kwargs):
+        target = io.StringIO()
+        rejects = io.StringIO()
+        stats = calculate_columns(CalculatorService(), io.StringIO(text), target, *args, rejects=rejects, **kwargs)
+        return target.getvalue(), rejects.getvalue(), stats
+
+    def test_appends_result_column(self):
+        output, rejects, stats = self.calculate("sku,price,qty\na,2.5,4\nb,10,3\n", 'price', '*', 'qty', 'total')
+        self.assertEqual(output, "sku,price,qty,total\na,2.5,4,10.0\nb,10,3,30.0\n")
+        self.assertEqual(rejects, "sku,price,qty,error\n")
+        self.assertEqual(stats, TableStats(2, 2, 0))
+
+    def test_overwrites_existing_column(self):
+        output, _, _ = self.calculate("a,b,c\n1,2,x\n", 'a', '+', 'b', 'c')
+        self.assertEqual(output, "a,b,c\n1,2,3.0\n")
+
+    def test_rejects_invalid_rows_and_failing_operations(self):
+        text = "a,b\n" + "".join(f"{i},{i % 5}\n" for i in range(20)) + "x,1\n3\n"
+        output, rejects, stats = self.calculate(text, 'a', '/', 'b', chunk_size=8)
+        expected = "a,b,result\n" + "".join(f"{i},{i % 5},{i / (i % 5)!r}\n" for i in range(20) if i % 5)
+        self.assertEqual(output, expected)
+        reject_lines = rejects.splitlines()
+        self.assertEqual(reject_lines[0], "a,b,error")
+        self.assertEqual(reject_lines[1:5], [f"{i},0,Cannot divide by zero" for i in (0, 5, 10, 15)])
+        self.assertEqual(reject_lines[5], "x,1,Column 'a': 'x' is not a valid number")
+        self.assertEqual(reject_lines[6], "3,Missing column 'b'")
+        self.assertEqual(stats, TableStats(22, 16, 6))
+
+    def test_registered_operation(self):
+        service = CalculatorService(operations=[Modulo()])
+        target = io.StringIO()
+        stats = ColumnCalculator(service, 0, '%', 1, header=False).run(io.StringIO("7,3\n9,0\n"), target)
+        self.assertEqual(target.getvalue(), "7,3,1.0\n")
+        self.assertEqual(stats, TableStats(2, 1, 1))
+
+    def test_decimal_comma(self):
+        output, _, _ = self.calculate('a;b\n"1,5";2\n', 'a', '*', 'b', delimiter=';', decimal_comma=True)
+        self.assertEqual(output, "a;b;result\n1,5;2;3,0\n")
+
+    def test_invalid_configuration(self):
+        service = CalculatorService()
+        with self.assertRaises(ValueError):
+            ColumnCalculator(service, 'a', '?', 'b')
+        with self.assertRaises(ValueError):
+            ColumnCalculator(service, 'a', '+', 'b', header=False)
+        with self.assertRaises(ValueError):
+            ColumnCalculator(service, 'a', '+', 'b', chunk_size=0)
+        with self.assertRaises(ValueError):
+            ColumnCalculator(service, 'a', '+', 'missing').run(io.StringIO("a,b\n1,2\n"), io.StringIO())
+
+
+class TestMain(unittest.TestCase):
+    """Test cases for the calc-table command."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        patcher = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': self.directory.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_files_and_rejects(self):
+        with open(self.path('in.csv'), 'w', encoding='utf-8') as source:
+            source.write("a,b\n8,2\n1,0\n")
+        with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            status = main([self.path('in.csv'), self.path('out.csv'), '--left', 'a', '--op', '/', '--right', 'b',
+                           '--rejects', self.path('rejects.csv')])
+        self.assertEqual(status, 1)
+        self.assertIn("1 of 2 rows calculated, 1 rejected", stderr.getvalue())
+        with open(self.path('out.csv'), encoding='utf-8') as output:
+            self.assertEqual(output.read(), "a,b,result\n8,2,4.0\n")
+        with open(self.path('rejects.csv'), encoding='utf-8') as rejects:
+            self.assertEqual(rejects.read(), "a,b,error\n1,0,Cannot divide by zero\n")
+
+    def test_unwritable_target_closes_source(self):
+        with open(self.path('in.csv'), 'w', encoding='utf-8') as source:
+            source.write("a,b\n8,2\n")
+        opened = []
+        real_open = open
+
+        def tracking_open(*args, **kwargs):
+            stream = real_open(*args, **kwargs)
+            opened.append(stream)
+            return stream
+
+        with mock.patch('builtins.open', tracking_open), mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            status = main([self.path('in.csv'), self.path('missing/out.csv'), '--left', 'a', '--op', '+', '--right', 'b',
+                           '--no-plugins'])
+        self.assertEqual(status, 1)
+        self.assertIn("Error:", stderr.getvalue())
+        self.assertTrue(opened)
+        self.assertTrue(all(stream.closed for stream in opened))
+
+    def test_decimal_comma_requires_other_delimiter(self):
+        with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            with self.assertRaises(SystemExit):
+                main(['-', '-', '--left', 'a', '--op', '+', '--right', 'b', '--decimal-comma'])
+        self.assertIn("--delimiter", stderr.getvalue())
+
+    def test_unknown_operator(self):
+        with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            status = main(['-', '-', '--left', 'a', '--op', '?', '--right', 'b'])
+        self.assertEqual(status, 1)
+        self.assertIn("Unsupported operator", stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Unit tests for compiled expression templates."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import unittest
+from array import array
+from decimal import Decimal
+from fractions import Fraction
+from src.application.calculator_service import CalculatorService
+from src.application.expression import ExpressionError, compile_expression, evaluate_expression
+from src.application.templates import ExpressionTemplate, compile_template
+from src.domain.operations import Operation
+
+
+class Modulo(Operation):
+    def execute(self, a, b):
+        return a % b
+
+    def symbol(self):
+        return '%'
+
+
+class TestExpressionTemplate(unittest.TestCase):
+    """Test cases for ExpressionTemplate and compile_template."""
+
+    def setUp(self):
+        self.service = CalculatorService()
+
+    def test_matches_tree_evaluation(self):
+        source = "x ^ 2 + y * 3 - -x / (y root 2)"
+        template = compile_template(source, self.service)
+        self.assertEqual(template.variables, ('x', 'y'))
+        for x, y in [(2, 9), (1.5, 4), (-3, 16)]:
+            expected = evaluate_expression(source.replace('x', f"({x})").replace('y', f"({y})"), self.service)
+            self.assertAlmostEqual(template(x, y), expected)
+            self.assertAlmostEqual(template(y=y, x=x), expected)
+
+    def test_negative_literal_base(self):
+        self.assertEqual(compile_template("(-2) ^ x", self.service)(x=2), 4)
+        self.assertEqual(compile_template("(-2.5) ^ x", self.service)(2), 6.25)
+        self.assertEqual(compile_template("x - (-3) ^ 2", self.service)(1), -8)
+
+    def test_plain_operators_are_inlined(self):
+        template = compile_template("a * b + 1 / a", self.service)
+        self.assertIn("(a * b)", template.code)
+        self.assertIn("__op", template.code)  # '/' keeps its zero check
+        with self.assertRaisesRegex(ValueError, "Cannot divide by zero"):
+            template(0, 1)
+
+    def test_layered_service_is_not_inlined(self):
+        service = CalculatorService(metrics=True)
+        template = compile_template("a + b", service)
+        self.assertNotIn("(a + b)", template.code)
+        self.assertEqual(template.evaluate_rows([(1, 2), (3, 4)]), [3, 7])
+        self.assertEqual(service.stats()['+'].calls, 2)
+
+    def test_numeric_backend(self):
+        template = compile_template("price * qty / 3", CalculatorService(numeric='fraction'))
+        self.assertEqual(template(1, 2), Fraction(2, 3))
+        template = compile_template("price * 1.1", CalculatorService(numeric='decimal'))
+        self.assertEqual(template('19.99'), Decimal('21.989'))
+
+    def test_custom_operation(self):
+        self.service.add_operation(Modulo())
+        self.assertEqual(compile_template("n % 7 + 1", self.service)(23), 3)
+
+    def test_explicit_variable_order(self):
+        template = compile_template("x - y", self.service, variables=['y', 'x', 'unused'])
+        self.assertEqual(template(1, 10, None), 9)
+        with self.assertRaises(ExpressionError):
+            ExpressionTemplate("x - y", self.service, variables=['x'])
+
+    def test_invalid_variable_names(self):
+        for source in ["lambda + 1", "__x + 1"]:
+            with self.subTest(source=source):
+                with self.assertRaises(ExpressionError):
+                    compile_template(source, self.service)
+
+    def test_cached_until_registry_changes(self):
+        first = compile_template("x + 1", self.service)
+        self.assertIs(compile_template("x + 1", self.service), first)
+        self.assertIsNot(compile_template("x + 1", CalculatorService()), first)
+        self.service.add_operation(Modulo())
+        self.assertIsNot(compile_template("x + 1", self.service), first)
+
+    def test_unbound_variable_in_plain_evaluation(self):
+        with self.assertRaisesRegex(ExpressionError, "Unbound variable 'x'"):
+            compile_expression("x + 1").evaluate(self.service)
+
+
+class TestEvaluateColumns(unittest.TestCase):
+    """Test cases for the vectorized template evaluation."""
+
+    def setUp(self):
+        self.service = CalculatorService()
+
+    def test_matches_rows(self):
+        template = compile_template("x ^ 2 + y * 3 - -x", self.service)
+        xs = array('d', [0.5 * i for i in range(50)])
+        ys = array('d', [float(i % 7) for i in range(50)])
+        expected = template.evaluate_rows(zip(xs, ys))
+        self.assertEqual(list(template.evaluate_columns(xs, ys)), expected)
+        self.assertEqual(list(template.evaluate_columns(y=ys, x=xs)), expected)
+
+    def test_constant_subexpressions(self):
+        template = compile_template("(2 ^ 3) * x + 1", self.service)
+        self.assertEqual(list(template.evaluate_columns([1.0, 2.0])), [9.0, 17.0])
+
+    def test_non_float_backend(self):
+        template = compile_template("a / 3 - -b", CalculatorService(numeric='fraction'))
+        self.assertEqual(list(template.evaluate_columns([1, 2], [1, 1])), [Fraction(4, 3), Fraction(5, 3)])
+
+    def test_column_errors(self):
+        template = compile_template("x + y", self.service)
+        with self.assertRaisesRegex(ValueError, "Missing column"):
+            template.evaluate_columns([1.0])
+        with self.assertRaisesRegex(ValueError, "same length"):
+            template.evaluate_columns([1.0], [1.0, 2.0])
+        with self.assertRaises(ValueError):
+            compile_template("x / y", self.service).evaluate_columns([1.0], [0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
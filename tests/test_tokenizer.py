@@ -0,0 +1,71 @@
+"""Unit tests for the bulk numeric tokenizer."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import math
+import unittest
+from src.application.tokenizer import parse_number, scan, tokenize
+
+
+class TestScan(unittest.TestCase):
+    """Test cases for scan and tokenize."""
+
+    def test_one_list_per_line(self):
+        lines = list(scan("1 + 2\n\n3.5*x\n"))
+        self.assertEqual(lines, [[1, '+', 2], [], [3.5, '*', 'x']])
+
+    def test_final_line_without_newline(self):
+        self.assertEqual(list(scan("1 + 2\n4 - 1")), [[1, '+', 2], [4, '-', 1]])
+        self.assertEqual(list(scan("")), [])
+
+    def test_bytes_decoded(self):
+        lines = list(scan("2 √ 9\r\nx ^ 2\n".encode('utf-8')))
+        self.assertEqual(lines, [[2, '√', 9], ['x', '^', 2]])
+
+    def test_number_types(self):
+        tokens = tokenize("7 1.5 .5 2. 1e5 2.5E-3")
+        self.assertEqual(tokens, [7, 1.5, 0.5, 2.0, 100000.0, 0.0025])
+        self.assertIs(type(tokens[0]), int)
+        self.assertIs(type(tokens[4]), float)
+
+    def test_special_values(self):
+        tokens = tokenize("inf - INFINITY + nan")
+        self.assertEqual(tokens[:4], [math.inf, '-', math.inf, '+'])
+        self.assertTrue(math.isnan(tokens[4]))
+        # A name that merely starts with "inf" stays a name
+        self.assertEqual(tokenize("info"), ['info'])
+
+    def test_decimal_comma(self):
+        self.assertEqual(tokenize("2,5 * 2"), [2, ',', 5, '*', 2])
+        self.assertEqual(tokenize("2,5 * 2", decimal_comma=True), [2.5, '*', 2])
+        self.assertEqual(list(scan(b"1,25e2 + 1\n", decimal_comma=True)), [[125.0, '+', 1]])
+
+    def test_parentheses_and_operators(self):
+        self.assertEqual(tokenize("-(1+2)%3"), ['-', '(', 1, '+', 2, ')', '%', 3])
+
+
+class TestParseNumber(unittest.TestCase):
+    """Test cases for parse_number."""
+
+    def test_valid_numbers(self):
+        self.assertEqual(parse_number("42"), 42)
+        self.assertIs(type(parse_number("42")), int)
+        self.assertEqual(parse_number(" -1.5 "), -1.5)
+        self.assertEqual(parse_number("+1e3"), 1000.0)
+        self.assertEqual(parse_number("-inf"), -math.inf)
+        self.assertEqual(parse_number("0,5", decimal_comma=True), 0.5)
+
+    def test_invalid_numbers(self):
+        for value in ["", "abc", "1.2.3", "1 2", "--1", "0,5"]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_number(value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Unit tests for the unit-conversion registry."""
+
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import unittest
+from array import array
+from src.converter import C_TO_F, F_TO_C
+from src.units import UnitRegistry, temperature_registry
+
+
+class TestTemperatureRegistry(unittest.TestCase):
+    """Test cases for the built-in temperature units."""
+
+    def setUp(self):
+        self.registry = temperature_registry()
+
+    def test_fused_pairs_match_hand_written_conversions(self):
+        self.assertEqual(self.registry.conversion('C', 'F'), C_TO_F)
+        self.assertEqual(self.registry.conversion('F', 'C'), F_TO_C)
+
+    def test_known_points(self):
+        self.assertEqual(self.registry.convert(0, 'K', 'C'), -273.15)
+        self.assertEqual(self.registry.convert(-40, 'fahrenheit', 'celsius'), -40)
+        self.assertAlmostEqual(self.registry.convert(100, 'C', 'R'), 671.67)
+        self.assertAlmostEqual(self.registry.convert(491.67, 'R', 'F'), 32)
+
+    def test_identity(self):
+        self.assertEqual(self.registry.conversion('F', 'F'), (1.0, 0.0))
+
+    def test_conversion_is_cached(self):
+        first = self.registry.conversion('K', 'F')
+        self.assertIs(self.registry.conversion('K', 'F'), first)
+
+    def test_buffer_conversion(self):
+        values = array('d', [0.0, 100.0])
+        self.registry.convert_buffer(values, 'C', 'K')
+        self.assertEqual(values.tolist(), [273.15, 373.15])
+
+    def test_unknown_unit(self):
+        with self.assertRaises(ValueError) as context:
+            self.registry.convert(1, 'C', 'X')
+        self.assertIn("Unknown unit", str(context.exception))
+
+
+class TestCustomUnits(unittest.TestCase):
+    """Test cases for registering arbitrary linear units."""
+
+    def test_linear_units(self):
+        registry = UnitRegistry('m')
+        registry.register('km', 1000)
+        registry.register('ft', '0.3048')
+        self.assertAlmostEqual(registry.convert(1, 'km', 'ft'), 3280.839895, places=6)
+
+    def test_register_invalidates_cache(self):
+        registry = UnitRegistry('m')
+        registry.register('x', 2)
+        self.assertEqual(registry.convert(1, 'x', 'm'), 2)
+        registry.register('x', 3)
+        self.assertEqual(registry.convert(1, 'x', 'm'), 3)
+
+    def test_zero_scale_rejected(self):
+        with self.assertRaises(ValueError):
+            UnitRegistry('m').register('bad', 0)
+
+
+if __name__ == '__main__':
+    unittest.main()